@@ -91,6 +91,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django_otp.middleware.OTPMiddleware",  # AuthenticationMiddleware 다음에 위치
     "accounts.middleware.OTPSetupMiddleware",
+    "uploads.middleware.MediaVersionMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -232,6 +233,55 @@ MEDIA_URL = env("MEDIA_URL", default="/media/")
 MEDIA_ROOT = "media"
 MEDIA_PUBLIC_DOMAIN = env("MEDIA_PUBLIC_DOMAIN")
 
+# 미디어 URL 버전(?v=해시) 조회 결과를 Redis 캐시에 저장할지 여부
+MEDIA_VERSION_CACHE_ENABLED = env.bool("MEDIA_VERSION_CACHE_ENABLED", default=True)
+MEDIA_VERSION_CACHE_TIMEOUT = env.int("MEDIA_VERSION_CACHE_TIMEOUT", default=86400)
+
+# 콘텐츠 타입별 Cache-Control 정책 (업로드 요청에 함께 전송)
+# 정확한 타입 → "대분류/*" → "default" 순으로 적용
+MEDIA_CACHE_CONTROL = {
+    "image/*": "public, max-age=31536000, immutable",
+    "video/*": "public, max-age=31536000, immutable",
+    "application/pdf": "public, max-age=31536000, immutable",
+    "default": "public, max-age=31536000, immutable",
+}
+
+# 이 크기 이상의 업로드는 해시 계산과 멀티파트 업로드를 한 번의 읽기로 처리
+MEDIA_STREAMING_UPLOAD_THRESHOLD = env.int(
+    "MEDIA_STREAMING_UPLOAD_THRESHOLD", default=32 * 1024 * 1024
+)
+# 멀티파트 업로드 파트 크기 (최소 5MB)
+MEDIA_MULTIPART_PART_SIZE = env.int(
+    "MEDIA_MULTIPART_PART_SIZE", default=8 * 1024 * 1024
+)
+# 멀티파트 업로드 동시 전송 파트 수 및 파트별 재시도 횟수
+MEDIA_MULTIPART_CONCURRENCY = env.int("MEDIA_MULTIPART_CONCURRENCY", default=4)
+MEDIA_MULTIPART_MAX_RETRIES = env.int("MEDIA_MULTIPART_MAX_RETRIES", default=3)
+# 직접 업로드(presigned URL) 유효 시간 (초)
+MEDIA_DIRECT_UPLOAD_EXPIRES = env.int("MEDIA_DIRECT_UPLOAD_EXPIRES", default=3600)
+# 일괄 업로드 시 해시 계산과 업로드를 병렬로 처리하는 스레드 수
+MEDIA_BULK_UPLOAD_CONCURRENCY = env.int("MEDIA_BULK_UPLOAD_CONCURRENCY", default=4)
+
+# 이미지 업로드 시 Celery에서 생성할 파생 이미지 폭과 포맷 (원본보다 큰 폭은 생략)
+MEDIA_RENDITION_WIDTHS = [320, 640, 1024, 1600]
+MEDIA_RENDITION_FORMATS = ["avif", "webp"]
+MEDIA_RENDITION_QUALITY = 80
+
+# 이미지 로딩 전 표시할 저해상도 플레이스홀더(LQIP)의 긴 변 크기 (px)
+MEDIA_PLACEHOLDER_SIZE = 20
+# 지각 해시(dHash, 64비트)의 해밍 거리가 이 값 이하이면 유사 이미지로 묶음
+MEDIA_NEAR_DUPLICATE_DISTANCE = 6
+
+# 미사용 미디어 정리 시 한 번에 삭제하는 Media 수 (중단 시 이 단위로 재개)
+MEDIA_GC_CHUNK_SIZE = 500
+# 정리 작업의 실행 잠금 유지 시간 (초, 진행 상황을 기록할 때마다 연장되며
+# 이 시간 동안 진행이 없으면 중단된 것으로 보고 다음 실행이 이어서 진행)
+MEDIA_GC_LOCK_TIMEOUT = 60 * 60
+# 미디어 대량 삭제 시 동시에 보내는 DeleteObjects 요청 수
+MEDIA_DELETE_CONCURRENCY = 4
+# 버킷 대조 시 업로드 후 이 시간이 지나지 않은 고아 오브젝트는 제외 (직접 업로드 완료 대기 등)
+MEDIA_ORPHAN_GRACE_HOURS = 48
+
 # 스토리지 백엔드
 STORAGES = {
     "staticfiles": {"BACKEND": env("STATICFILES_STORAGE")},
@@ -268,6 +318,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "uploads.tasks.clean_unused_media_task",
         "schedule": 86400.0,  # 하루에 한 번 실행
     },
+    "reconcile-media-storage-every-week": {
+        "task": "uploads.tasks.reconcile_media_storage_async",
+        "schedule": 604800.0,  # 일주일에 한 번 실행 (보고만 함)
+    },
     "check-system-health-every-hour": {
         "task": "config.tasks.check_system_health",
         "schedule": 3600.0,  # 1시간마다 실행
@@ -285,6 +339,12 @@ CACHES = {
     }
 }
 
+# 공개 API 응답 캐시 (콘텐츠 변경 시 시그널에서 태그 단위로 무효화)
+RESPONSE_CACHE_ENABLED = env.bool("RESPONSE_CACHE_ENABLED", default=True)
+RESPONSE_CACHE_TIMEOUT = env.int("RESPONSE_CACHE_TIMEOUT", default=86400)
+# 응답 형식이 바뀌는 배포에서 올리면 기존 캐시 항목과 ETag가 모두 무효화됨
+RESPONSE_CACHE_VERSION = env("RESPONSE_CACHE_VERSION", default="1")
+
 # =================================================
 # CKEditor 5 설정
 # =================================================
@@ -0,0 +1,135 @@
+# homepage/management/commands/benchmark_translated_serializer.py
+# GalleryItem 목록 직렬화에서 기존 SerializerMethodField(safe_translation_getter) 방식과
+# TranslatedField 방식의 소요 시간과 쿼리 수를 비교하는 벤치마크
+# 가상의 행을 트랜잭션 안에서 생성하고 측정 후 롤백하므로 기존 데이터는 바뀌지 않음
+#   python manage.py benchmark_translated_serializer --items 1000 --language en
+import time
+import uuid
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import translation
+from rest_framework import serializers
+from homepage.models.gallery_models import GalleryCategory, GalleryItem
+from homepage.serializers.gallery_serializers import GalleryItemListSerializer
+from uploads.serializers import MediaSerializer
+from uploads.usage import count_queries
+
+
+class LegacyGalleryCategorySerializer(serializers.ModelSerializer):
+    name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = GalleryCategory
+        fields = ["id", "slug", "name"]
+
+    def get_name(self, obj):
+        return obj.safe_translation_getter("name", any_language=True)
+
+
+class LegacyGalleryItemListSerializer(serializers.ModelSerializer):
+    """TranslatedField 도입 전의 GalleryItemListSerializer"""
+
+    title = serializers.SerializerMethodField()
+    short_description = serializers.SerializerMethodField()
+    category = LegacyGalleryCategorySerializer(read_only=True)
+    image = MediaSerializer(read_only=True)
+
+    class Meta:
+        model = GalleryItem
+        fields = [
+            "id",
+            "title",
+            "short_description",
+            "image",
+            "year",
+            "category",
+            "is_featured",
+        ]
+
+    def get_title(self, obj):
+        return obj.safe_translation_getter("title", any_language=True)
+
+    def get_short_description(self, obj):
+        return obj.safe_translation_getter("short_description", any_language=True)
+
+
+class Command(BaseCommand):
+    help = "GalleryItem 목록 직렬화의 번역 필드 처리 방식별 성능을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=1000)
+        parser.add_argument(
+            "--language",
+            default="en",
+            help="직렬화할 언어 (절반의 항목은 이 언어 번역이 없어 fallback 사용)",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        with transaction.atomic(), translation.override(options["language"]):
+            self._populate(options["items"], options["language"])
+            queryset = GalleryItem.objects.select_related(
+                "category", "image"
+            ).prefetch_related("image__renditions")
+
+            for label, serializer_class, items in (
+                ("기존 (prefetch 없음)", LegacyGalleryItemListSerializer, queryset),
+                (
+                    "기존 + 번역 prefetch",
+                    LegacyGalleryItemListSerializer,
+                    queryset.prefetch_translations("category"),
+                ),
+                (
+                    "TranslatedField + 번역 prefetch",
+                    GalleryItemListSerializer,
+                    queryset.prefetch_translations("category"),
+                ),
+            ):
+                best = None
+                for _ in range(options["repeat"]):
+                    with count_queries() as counter:
+                        started = time.perf_counter()
+                        serializer_class(items.all(), many=True).data
+                        elapsed = time.perf_counter() - started
+                    best = min(best or elapsed, elapsed)
+                self.stdout.write(
+                    f"{label:>32}: {best * 1000:8.1f} ms, 쿼리 {counter['queries']}개"
+                )
+            transaction.set_rollback(True)
+
+    def _populate(self, size, language):
+        """카테고리 10개와 size개의 GalleryItem (ko 번역 전체, language 번역 절반) 생성"""
+        prefix = uuid.uuid4().hex[:8]
+        categories = GalleryCategory.objects.bulk_create(
+            [GalleryCategory(slug=f"{prefix}-{i}") for i in range(10)]
+        )
+        category_translation = GalleryCategory._parler_meta.root_model
+        category_translation.objects.bulk_create(
+            [
+                category_translation(
+                    master_id=category.id, language_code="ko", name=f"분류 {i}"
+                )
+                for i, category in enumerate(categories)
+            ]
+        )
+
+        items = GalleryItem.objects.bulk_create(
+            [
+                GalleryItem(category=categories[i % 10], year=2000 + i % 25)
+                for i in range(size)
+            ]
+        )
+        item_translation = GalleryItem._parler_meta.root_model
+        rows = []
+        for i, item in enumerate(items):
+            languages = ["ko", language] if i % 2 and language != "ko" else ["ko"]
+            rows.extend(
+                item_translation(
+                    master_id=item.id,
+                    language_code=code,
+                    title=f"{code} 제목 {i}",
+                    short_description=f"{code} 설명 {i}",
+                )
+                for code in languages
+            )
+        item_translation.objects.bulk_create(rows)
@@ -2,11 +2,12 @@
 from django.db import models
 from django.utils import timezone
 from django_ckeditor_5.fields import CKEditor5Field
-from parler.models import TranslatableModel, TranslatedFields
+from parler.models import TranslatedFields
 from uploads.models import Media
+from .base_models import PrefetchTranslatableModel
 
 
-class Creator(TranslatableModel):
+class Creator(PrefetchTranslatableModel):
     slug = models.SlugField(unique=True)
     photo = models.ForeignKey(
         Media,
@@ -15,6 +16,7 @@ class Creator(TranslatableModel):
         null=True,
         related_name="homepage_creator_photos",
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     translations = TranslatedFields(
         name=models.CharField(max_length=100),
@@ -35,7 +37,7 @@ class Creator(TranslatableModel):
         verbose_name_plural = "A01. Creators"
 
 
-class BookCategory(TranslatableModel):
+class BookCategory(PrefetchTranslatableModel):
     translations = TranslatedFields(name=models.CharField(max_length=100))
     slug = models.SlugField(unique=True)
 
@@ -50,7 +52,7 @@ class BookCategory(TranslatableModel):
         verbose_name_plural = "A02. Book Categories"
 
 
-class Book(TranslatableModel):
+class Book(PrefetchTranslatableModel):
     cover_image = models.ForeignKey(
         Media,
         on_delete=models.SET_NULL,
@@ -67,6 +69,7 @@ class Book(TranslatableModel):
         related_name="books",
     )
     authors = models.ManyToManyField(Creator, blank=True, related_name="books")
+    updated_at = models.DateTimeField(auto_now=True)
 
     translations = TranslatedFields(
         title=models.CharField(max_length=200),
@@ -88,7 +91,7 @@ class Book(TranslatableModel):
         verbose_name_plural = "A03. Books"
 
 
-class Character(TranslatableModel):
+class Character(PrefetchTranslatableModel):
     slug = models.SlugField(unique=True)
     image = models.ForeignKey(
         Media,
@@ -105,6 +108,7 @@ class Character(TranslatableModel):
         null=True,
         related_name="characters_created",
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     translations = TranslatedFields(
         name=models.CharField(max_length=100),
@@ -125,7 +129,7 @@ class Character(TranslatableModel):
         verbose_name_plural = "A04. Characters"
 
 
-class HistoryEvent(TranslatableModel):
+class HistoryEvent(PrefetchTranslatableModel):
     date = models.DateField()
     image = models.ForeignKey(
         Media,
@@ -134,6 +138,7 @@ class HistoryEvent(TranslatableModel):
         null=True,
         related_name="homepage_history_images",
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     translations = TranslatedFields(
         title=models.CharField(max_length=200),
@@ -154,7 +159,7 @@ class HistoryEvent(TranslatableModel):
         )
 
 
-class LicensePage(TranslatableModel):
+class LicensePage(PrefetchTranslatableModel):
     updated_at = models.DateTimeField(default=timezone.now)
 
     translations = TranslatedFields(
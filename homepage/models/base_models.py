@@ -0,0 +1,33 @@
+# homepage/models/base_models.py
+# 홈페이지 번역 모델 공통 매니저
+# 목록 API에서 객체마다 번역 행을 조회하지 않도록 번역을 모델(관계 포함)당 쿼리 한 번으로 미리 읽음
+# parler는 미리 읽은 번역을 객체의 전체 번역으로 취급하므로 언어로 거르지 않고 모두 읽음
+# (현재 언어 번역이 없을 때 any_language fallback이 다른 언어를 찾을 수 있어야 함)
+from parler.managers import TranslatableManager, TranslatableQuerySet
+from parler.models import TranslatableModel
+
+
+class TranslationPrefetchQuerySet(TranslatableQuerySet):
+    def prefetch_translations(self, *lookups):
+        """
+        이 모델과 lookups("category", "books__authors" 등)로 지정한 관계 모델의
+        번역(모든 언어)을 미리 읽도록 설정합니다.
+        언어 선택은 parler가 객체를 읽을 때 하므로 뷰의 클래스 속성에 써도 됩니다.
+        """
+        paths = ["translations", *(f"{lookup}__translations" for lookup in lookups)]
+        return self.prefetch_related(*dict.fromkeys(paths))
+
+
+class TranslationPrefetchManager(
+    TranslatableManager.from_queryset(TranslationPrefetchQuerySet)
+):
+    pass
+
+
+class PrefetchTranslatableModel(TranslatableModel):
+    """번역 prefetch를 지원하는 매니저를 기본으로 쓰는 번역 모델"""
+
+    objects = TranslationPrefetchManager()
+
+    class Meta:
+        abstract = True
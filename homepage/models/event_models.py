@@ -1,10 +1,11 @@
 # homepage/models/event_models.py
 from django.db import models
 from django_ckeditor_5.fields import CKEditor5Field
-from parler.models import TranslatableModel, TranslatedFields
+from parler.models import TranslatedFields
 from uploads.models import Media
+from .base_models import PrefetchTranslatableModel
 
-class EventCategory(TranslatableModel):
+class EventCategory(PrefetchTranslatableModel):
     slug = models.SlugField(unique=True, allow_unicode=True)
     translations = TranslatedFields(
         name=models.CharField(max_length=100, verbose_name="카테고리 이름")
@@ -17,7 +18,7 @@ class EventCategory(TranslatableModel):
     def __str__(self):
         return self.safe_translation_getter("name", any_language=True) or f"Category {self.pk}"
 
-class Event(TranslatableModel):
+class Event(PrefetchTranslatableModel):
     category = models.ForeignKey(
         EventCategory,
         on_delete=models.SET_NULL,
@@ -35,6 +36,7 @@ class Event(TranslatableModel):
     )
     date = models.DateField(verbose_name="행사 날짜")
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     translations = TranslatedFields(
         title=models.CharField(max_length=200, verbose_name="제목"),
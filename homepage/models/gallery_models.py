@@ -3,11 +3,12 @@
 
 from django.db import models
 from django_ckeditor_5.fields import CKEditor5Field
-from parler.models import TranslatableModel, TranslatedFields
+from parler.models import TranslatedFields
 from uploads.models import Media
+from .base_models import PrefetchTranslatableModel
 
 
-class GalleryCategory(TranslatableModel):
+class GalleryCategory(PrefetchTranslatableModel):
     """갤러리 카테고리 모델"""
 
     slug = models.SlugField(unique=True, allow_unicode=True)
@@ -26,7 +27,7 @@ class GalleryCategory(TranslatableModel):
         )
 
 
-class GalleryItem(TranslatableModel):
+class GalleryItem(PrefetchTranslatableModel):
     """갤러리 아이템 모델"""
 
     category = models.ForeignKey(
@@ -1,9 +1,10 @@
 # homepage/models/global_models.py
 from django.db import models
-from parler.models import TranslatableModel, TranslatedFields
+from parler.models import TranslatedFields
+from .base_models import PrefetchTranslatableModel
 
 
-class SiteTitle(TranslatableModel):
+class SiteTitle(PrefetchTranslatableModel):
     translations = TranslatedFields(title=models.CharField(max_length=200))
 
     def save(self, *args, **kwargs):
@@ -23,7 +24,7 @@ class SiteTitle(TranslatableModel):
         verbose_name_plural = "_01. Site Titles"
 
 
-class NavigationGroup(TranslatableModel):
+class NavigationGroup(PrefetchTranslatableModel):
     highlighted = models.BooleanField(default=False)
     order = models.PositiveIntegerField(default=0)
 
@@ -41,7 +42,7 @@ class NavigationGroup(TranslatableModel):
         ordering = ["order"]
 
 
-class NavigationSubMenu(TranslatableModel):
+class NavigationSubMenu(PrefetchTranslatableModel):
     parent_group = models.ForeignKey(
         NavigationGroup, related_name="sub_menus", on_delete=models.CASCADE
     )
@@ -62,7 +63,7 @@ class NavigationSubMenu(TranslatableModel):
         ordering = ["order"]
 
 
-class FooterSection(TranslatableModel):
+class FooterSection(PrefetchTranslatableModel):
     translations = TranslatedFields(label=models.CharField(max_length=100))
     order = models.PositiveIntegerField(default=0)
 
@@ -78,7 +79,7 @@ class FooterSection(TranslatableModel):
         ordering = ["order"]
 
 
-class FooterSubMenu(TranslatableModel):
+class FooterSubMenu(PrefetchTranslatableModel):
     footer_section = models.ForeignKey(
         FooterSection, related_name="sub_menus", on_delete=models.CASCADE
     )
@@ -100,7 +101,7 @@ class FooterSubMenu(TranslatableModel):
         ordering = ["order"]
 
 
-class FamilySite(TranslatableModel):
+class FamilySite(PrefetchTranslatableModel):
     href = models.CharField(max_length=200)
     order = models.PositiveIntegerField(default=0)
 
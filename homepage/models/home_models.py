@@ -1,10 +1,11 @@
 from django.db import models
 from django_ckeditor_5.fields import CKEditor5Field
-from parler.models import TranslatableModel, TranslatedFields
+from parler.models import TranslatedFields
 from uploads.models import Media
+from .base_models import PrefetchTranslatableModel
 
 
-class HomeSection(TranslatableModel):
+class HomeSection(PrefetchTranslatableModel):
     SECTION_TYPES = (
         ("books", "New Books"),
         ("authors", "Authors"),
@@ -25,6 +26,7 @@ class HomeSection(TranslatableModel):
     )
     is_active = models.BooleanField(default=True, verbose_name="활성화 여부")
     order = models.PositiveIntegerField(verbose_name="표시 순서")
+    updated_at = models.DateTimeField(auto_now=True)
 
     translations = TranslatedFields(
         content=CKEditor5Field("내용", config_name="default", blank=True, null=True)
@@ -39,7 +41,7 @@ class HomeSection(TranslatableModel):
         return f"{self.get_type_display()} (레이아웃: {self.layout}, 활성화: {self.is_active})"
 
 
-class HeroSlide(TranslatableModel):
+class HeroSlide(PrefetchTranslatableModel):
     image = models.ForeignKey(
         Media,
         on_delete=models.SET_NULL,
@@ -51,6 +53,7 @@ class HeroSlide(TranslatableModel):
     link = models.URLField(blank=True, verbose_name="링크")
     is_active = models.BooleanField(default=True, verbose_name="활성화 여부")
     order = models.PositiveIntegerField(verbose_name="표시 순서")
+    updated_at = models.DateTimeField(auto_now=True)
 
     translations = TranslatedFields(
         title=models.CharField(max_length=100, verbose_name="제목"),
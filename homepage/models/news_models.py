@@ -1,10 +1,11 @@
 # homepage/models/news_models.py
 from django.db import models
 from django_ckeditor_5.fields import CKEditor5Field
-from parler.models import TranslatableModel, TranslatedFields
+from parler.models import TranslatedFields
 from uploads.models import Media
+from .base_models import PrefetchTranslatableModel
 
-class NewsCategory(TranslatableModel):
+class NewsCategory(PrefetchTranslatableModel):
     slug = models.SlugField(unique=True, allow_unicode=True)
     translations = TranslatedFields(
         name=models.CharField(max_length=100, verbose_name="카테고리 이름")
@@ -17,7 +18,7 @@ class NewsCategory(TranslatableModel):
     def __str__(self):
         return self.safe_translation_getter("name", any_language=True) or f"Category {self.pk}"
 
-class News(TranslatableModel):
+class News(PrefetchTranslatableModel):
     category = models.ForeignKey(
         NewsCategory,
         on_delete=models.SET_NULL,
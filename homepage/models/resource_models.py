@@ -1,10 +1,11 @@
 # homepage/models/resource_models.py
 from django.db import models
 from django_ckeditor_5.fields import CKEditor5Field
-from parler.models import TranslatableModel, TranslatedFields
+from parler.models import TranslatedFields
 from uploads.models import Media
+from .base_models import PrefetchTranslatableModel
 
-class ResourceCategory(TranslatableModel):
+class ResourceCategory(PrefetchTranslatableModel):
     slug = models.SlugField(unique=True, allow_unicode=True)
     translations = TranslatedFields(
         name=models.CharField(max_length=100, verbose_name="카테고리 이름")
@@ -17,7 +18,7 @@ class ResourceCategory(TranslatableModel):
     def __str__(self):
         return self.safe_translation_getter("name", any_language=True) or f"Category {self.pk}"
 
-class Resource(TranslatableModel):
+class Resource(PrefetchTranslatableModel):
     category = models.ForeignKey(
         ResourceCategory,
         on_delete=models.SET_NULL,
@@ -42,6 +43,7 @@ class Resource(TranslatableModel):
         verbose_name="다운로드 파일"
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     translations = TranslatedFields(
         title=models.CharField(max_length=200, verbose_name="제목"),
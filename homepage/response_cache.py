@@ -0,0 +1,206 @@
+# homepage/response_cache.py
+# 공개 API 응답 캐시와 조건부 요청(ETag) 검증값
+# 경로, 쿼리 문자열, 협상된 언어로 키를 만들어 렌더링된 응답 바이트를 저장하고
+# signals.py와 같은 태그(news, gallery, book-{id} ...)로 묶어 두었다가
+# 콘텐츠가 바뀌면 해당 태그의 항목만 삭제함 (Redis에서는 태그별 SET에 항목 키를 모음)
+# 태그마다 버전 카운터(마지막 변경 시각, ns)를 두고 응답이 의존하는 태그 버전으로
+# ETag와 Last-Modified를 만듦
+import hashlib
+import logging
+import time
+from urllib.parse import urlencode
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils import translation
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "response:"
+TAG_KEY_PREFIX = "response-tag:"
+VERSION_KEY_PREFIX = "response-version:"
+
+# 캐시한 응답에 다시 붙이는 헤더
+CACHED_HEADERS = ("Allow", "Vary", "ETag", "Last-Modified")
+
+
+def get_timeout():
+    return getattr(settings, "RESPONSE_CACHE_TIMEOUT", 86400)
+
+
+def is_enabled():
+    return getattr(settings, "RESPONSE_CACHE_ENABLED", False)
+
+
+def is_cacheable(request):
+    """캐시/ETag 대상 요청인지 여부 (GET만, 브라우저용 Browsable API 응답은 제외)"""
+    return request.method == "GET" and "text/html" not in request.headers.get(
+        "Accept", ""
+    )
+
+
+def get_cache_key(request):
+    """경로 + 정렬한 쿼리 문자열 + 현재 언어로 만든 캐시 키"""
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    # 응답 형식이 바뀌는 배포에서는 RESPONSE_CACHE_VERSION을 올려 기존 항목과 ETag를 버림
+    version = getattr(settings, "RESPONSE_CACHE_VERSION", "1")
+    raw = f"{version}|{request.path}?{query}|{translation.get_language()}"
+    return f"{CACHE_KEY_PREFIX}{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def _get_redis():
+    """django_redis 백엔드이면 Redis 클라이언트, 다른 백엔드(개발용 등)이면 None"""
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        return None
+
+
+def _tag_key(tag):
+    return f"{TAG_KEY_PREFIX}{tag}"
+
+
+def _version_key(tag):
+    return f"{VERSION_KEY_PREFIX}{tag}"
+
+
+def _new_version():
+    # 카운터가 없거나 제거된 뒤 다시 만들 때 이전 값과 겹치지 않도록 현재 시각에서 시작
+    return time.time_ns()
+
+
+def _next_version(version):
+    """
+    이전 버전보다 초 단위로 큰 다음 버전 (보통은 현재 시각)
+    Last-Modified는 초 단위이므로 같은 초 안에 다시 바뀌어도 이전 값보다 커야
+    If-Modified-Since만 보내는 클라이언트가 이전 응답으로 304를 받지 않음
+    """
+    next_second = (version // 10**9 + 1) * 10**9
+    return max(_new_version(), next_second)
+
+
+def get_tag_versions(tags):
+    """
+    태그별 버전 카운터 목록 (없는 카운터는 만들어서 반환)
+    존재하지 않는 객체의 URL로도 카운터가 만들어지므로 캐시 항목과 같은 만료 시간을 둠
+    (만료 후에는 현재 시각에서 다시 시작하므로 이전 ETag와 겹치지 않음)
+    """
+    keys = [_version_key(tag) for tag in tags]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            value = _new_version()
+            added = cache.add(key, value, get_timeout())
+            versions[key] = value if added else cache.get(key, value)
+    return [versions[key] for key in keys]
+
+
+def bump_tag_versions(tags):
+    """태그의 버전을 변경 시각으로 올려 이전 ETag와 캐시 항목을 무효로 만듦"""
+    keys = [_version_key(tag) for tag in tags]
+    versions = cache.get_many(keys)
+    cache.set_many(
+        {key: _next_version(versions.get(key, 0)) for key in keys}, get_timeout()
+    )
+
+
+def get_validators(key, tags):
+    """
+    캐시 키와 태그 버전으로 만든 (강한 ETag, Last-Modified 타임스탬프)
+    Last-Modified는 응답이 의존하는 태그 중 마지막으로 바뀐 시각이며
+    삭제, 번역/카테고리/미디어 변경처럼 행의 updated_at에 남지 않는 변경도 반영됩니다.
+    캐시 오류 시 None을 반환합니다.
+    """
+    try:
+        versions = get_tag_versions(tags)
+    except Exception as e:
+        logger.error(f"태그 버전 조회 실패: {e}")
+        return None
+    raw = "|".join([key, *(f"{tag}:{v}" for tag, v in zip(tags, versions))])
+    etag = f'"{hashlib.sha1(raw.encode()).hexdigest()}"'
+    last_modified = max(versions, default=_new_version()) // 10**9
+    return etag, last_modified
+
+
+def get_cached_response(key, etag):
+    """
+    저장된 응답을 HttpResponse로 복원합니다.
+    없거나, 저장 후 태그 버전이 바뀌어 ETag가 다르거나, 캐시 오류 시 None을 반환합니다.
+    """
+    if not is_enabled():
+        return None
+    try:
+        entry = cache.get(key)
+    except Exception as e:
+        logger.error(f"응답 캐시 조회 실패: {e}")
+        return None
+    # 무효화 직전에 읽은 데이터로 늦게 저장된 항목은 ETag가 달라 사용하지 않음
+    if entry is None or entry["headers"].get("ETag") != etag:
+        return None
+
+    response = HttpResponse(entry["content"], content_type=entry["content_type"])
+    for header, value in entry["headers"].items():
+        response[header] = value
+    return response
+
+
+def store_response(key, response, tags):
+    """렌더링된 응답을 저장하고 각 태그의 항목 목록에 키를 추가"""
+    timeout = get_timeout()
+    entry = {
+        "content": response.content,
+        "content_type": response["Content-Type"],
+        "headers": {
+            header: response[header] for header in CACHED_HEADERS if header in response
+        },
+    }
+    try:
+        cache.set(key, entry, timeout)
+        client = _get_redis()
+        if client is None:
+            for tag in tags:
+                keys = cache.get(_tag_key(tag), set())
+                keys.add(key)
+                cache.set(_tag_key(tag), keys, timeout)
+            return
+
+        pipe = client.pipeline()
+        for tag in tags:
+            # 태그 SET은 마지막으로 추가된 항목과 같이 만료됨
+            tag_key = cache.make_key(_tag_key(tag))
+            pipe.sadd(tag_key, key)
+            pipe.expire(tag_key, timeout)
+        pipe.execute()
+    except Exception as e:
+        logger.error(f"응답 캐시 저장 실패: {e}")
+
+
+def invalidate_tags(*tags):
+    """태그 버전을 올리고 태그에 속한 캐시 항목을 모두 삭제한 뒤 삭제한 항목 수를 반환"""
+    if not tags:
+        return 0
+    try:
+        bump_tag_versions(tags)
+        client = _get_redis()
+        if client is None:
+            tag_keys = [_tag_key(tag) for tag in tags]
+            keys = set().union(*cache.get_many(tag_keys).values())
+            cache.delete_many([*keys, *tag_keys])
+        else:
+            # 항목 키 조회와 태그 SET 삭제를 MULTI/EXEC로 묶어 그 사이에 추가된 키를 놓치지 않음
+            tag_keys = [cache.make_key(_tag_key(tag)) for tag in tags]
+            pipe = client.pipeline()
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            pipe.delete(*tag_keys)
+            *members, _ = pipe.execute()
+            keys = {key.decode() for tag_members in members for key in tag_members}
+            if keys:
+                cache.delete_many(list(keys))
+    except Exception as e:
+        logger.error(f"응답 캐시 무효화 실패 ({', '.join(tags)}): {e}")
+        return 0
+
+    logger.debug(f"응답 캐시 무효화: {', '.join(tags)} - {len(keys)}개 삭제")
+    return len(keys)
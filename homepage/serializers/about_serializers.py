@@ -1,7 +1,10 @@
 # homepage/serializers/about_serializers.py
 # About 페이지 관련 모델의 시리얼라이저 정의
 # 책, 캐릭터, 크리에이터, 역사, 라이센스 정보를 API로 제공
-from rest_framework import serializers
+from homepage.serializers.base_serializers import (
+    TranslatableModelSerializer,
+    TranslatedField,
+)
 from homepage.models.about_models import (
     Creator,
     BookCategory,
@@ -13,54 +16,39 @@ from homepage.models.about_models import (
 from uploads.serializers import MediaSerializer
 
 
-class CreatorSerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
-    bio_summary = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
+class CreatorSerializer(TranslatableModelSerializer):
+    name = TranslatedField()
+    bio_summary = TranslatedField()
+    description = TranslatedField()
     photo = MediaSerializer(read_only=True)
 
     class Meta:
         model = Creator
         fields = ["id", "slug", "photo", "name", "bio_summary", "description"]
 
-    def get_name(self, obj):
-        return obj.safe_translation_getter("name", any_language=True)
-
-    def get_bio_summary(self, obj):
-        return obj.safe_translation_getter("bio_summary", any_language=True)
-
-    def get_description(self, obj):
-        return obj.safe_translation_getter("description", any_language=True)
-
 
 # 간소화된 Creator 정보를 반환하는 시리얼라이저
-class SimpleCreatorSerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
+class SimpleCreatorSerializer(TranslatableModelSerializer):
+    name = TranslatedField()
 
     class Meta:
         model = Creator
         fields = ["id", "slug", "name"]
 
-    def get_name(self, obj):
-        return obj.safe_translation_getter("name", any_language=True)
-
 
-class BookCategorySerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
+class BookCategorySerializer(TranslatableModelSerializer):
+    name = TranslatedField()
 
     class Meta:
         model = BookCategory
         fields = ["id", "slug", "name"]
 
-    def get_name(self, obj):
-        return obj.safe_translation_getter("name", any_language=True)
 
-
-class BookSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    subtitle = serializers.SerializerMethodField()
-    summary = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
+class BookSerializer(TranslatableModelSerializer):
+    title = TranslatedField()
+    subtitle = TranslatedField()
+    summary = TranslatedField()
+    description = TranslatedField()
     category = BookCategorySerializer(read_only=True)
     authors = SimpleCreatorSerializer(
         many=True, read_only=True
@@ -81,23 +69,11 @@ class BookSerializer(serializers.ModelSerializer):
             "authors",
         ]
 
-    def get_title(self, obj):
-        return obj.safe_translation_getter("title", any_language=True)
-
-    def get_subtitle(self, obj):
-        return obj.safe_translation_getter("subtitle", any_language=True)
-
-    def get_summary(self, obj):
-        return obj.safe_translation_getter("summary", any_language=True)
-
-    def get_description(self, obj):
-        return obj.safe_translation_getter("description", any_language=True)
 
-
-class CharacterSerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
-    bio_summary = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
+class CharacterSerializer(TranslatableModelSerializer):
+    name = TranslatedField()
+    bio_summary = TranslatedField()
+    description = TranslatedField()
     books = BookSerializer(many=True, read_only=True)
     creator = SimpleCreatorSerializer(read_only=True)  # 간소화된 Creator 정보 사용
     image = MediaSerializer(read_only=True)
@@ -115,42 +91,21 @@ class CharacterSerializer(serializers.ModelSerializer):
             "creator",
         ]
 
-    def get_name(self, obj):
-        return obj.safe_translation_getter("name", any_language=True)
-
-    def get_bio_summary(self, obj):
-        return obj.safe_translation_getter("bio_summary", any_language=True)
-
-    def get_description(self, obj):
-        return obj.safe_translation_getter("description", any_language=True)
-
 
-class HistoryEventSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
+class HistoryEventSerializer(TranslatableModelSerializer):
+    title = TranslatedField()
+    description = TranslatedField()
     image = MediaSerializer(read_only=True)
 
     class Meta:
         model = HistoryEvent
         fields = ["id", "date", "image", "title", "description"]
 
-    def get_title(self, obj):
-        return obj.safe_translation_getter("title", any_language=True)
 
-    def get_description(self, obj):
-        return obj.safe_translation_getter("description", any_language=True)
-
-
-class LicensePageSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    content = serializers.SerializerMethodField()
+class LicensePageSerializer(TranslatableModelSerializer):
+    title = TranslatedField()
+    content = TranslatedField()
 
     class Meta:
         model = LicensePage
         fields = ["id", "updated_at", "title", "content"]
-
-    def get_title(self, obj):
-        return obj.safe_translation_getter("title", any_language=True)
-
-    def get_content(self, obj):
-        return obj.safe_translation_getter("content", any_language=True)
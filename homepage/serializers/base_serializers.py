@@ -0,0 +1,106 @@
+# homepage/serializers/base_serializers.py
+# 번역 필드를 선언형으로 직렬화하는 공통 시리얼라이저
+# 미리 읽은 번역 행(prefetch_translations)에서 현재 언어 → fallback 언어 → 아무 언어 순으로
+# 객체당 한 번 번역 행을 골라 두고, 필드 값은 그 행에서 바로 읽음
+from functools import lru_cache
+from django.db.models import Prefetch, prefetch_related_objects
+from parler.utils.i18n import get_active_language_choices
+from rest_framework import serializers
+
+# 객체에 골라 둔 번역 행을 저장하는 속성 이름
+TRANSLATION_ATTR = "_serializer_translation"
+
+
+@lru_cache(maxsize=None)
+def get_language_chain(language_code):
+    """현재 언어와 PARLER_LANGUAGES의 fallback 언어 순서"""
+    return get_active_language_choices(language_code)
+
+
+def get_translation(instance):
+    """
+    safe_translation_getter(any_language=True)와 같은 순서로 번역 행을 골라 반환합니다.
+    번역을 미리 읽지 않은 객체는 None을 반환하며 parler 조회로 처리합니다.
+    """
+    try:
+        return getattr(instance, TRANSLATION_ATTR)
+    except AttributeError:
+        pass
+
+    prefetched = getattr(instance, "_prefetched_objects_cache", {})
+    translations = prefetched.get(instance._parler_meta.root_rel_name)
+    if translations is None:
+        return None
+
+    by_language = {
+        translation.language_code: translation for translation in translations
+    }
+    translation = next(
+        (
+            by_language[language]
+            for language in get_language_chain(instance.get_current_language())
+            if language in by_language
+        ),
+        None,
+    )
+    if translation is None and by_language:
+        translation = next(iter(by_language.values()))
+    setattr(instance, TRANSLATION_ATTR, translation)
+    return translation
+
+
+def prefetch_missing_translations(instances):
+    """
+    번역을 미리 읽지 않은 객체들의 번역을 쿼리 한 번으로 읽음
+    현재/fallback 언어 번역이 없는 객체도 다른 언어로 표시되도록 모든 언어를 읽습니다.
+    """
+    missing = [
+        instance
+        for instance in instances
+        if instance._parler_meta.root_rel_name
+        not in getattr(instance, "_prefetched_objects_cache", {})
+    ]
+    if not missing:
+        return
+    meta = missing[0]._parler_meta
+    prefetch_related_objects(
+        missing, Prefetch(meta.root_rel_name, queryset=meta.root_model.objects.all())
+    )
+
+
+class TranslatedField(serializers.Field):
+    """parler 번역 필드를 읽기 전용으로 직렬화 (필드 이름 또는 source의 번역 값)"""
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        translation = get_translation(instance)
+        if translation is None:
+            return instance.safe_translation_getter(self.source, any_language=True)
+        return getattr(translation, self.source, None)
+
+    def to_representation(self, value):
+        return value
+
+
+class TranslatableListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        # 목록 전체의 번역을 한 번에 읽어 객체별 조회를 막음
+        items = list(data.all() if hasattr(data, "all") else data)
+        prefetch_missing_translations(items)
+        return super().to_representation(items)
+
+
+class TranslatableModelSerializer(serializers.ModelSerializer):
+    """
+    TranslatedField로 번역 필드를 선언하는 parler 모델용 시리얼라이저
+    many=True이면 목록 전체의 번역을 한 번에 준비하는 TranslatableListSerializer를 사용합니다.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = getattr(cls, "Meta", None)
+        if meta is not None and not hasattr(meta, "list_serializer_class"):
+            meta.list_serializer_class = TranslatableListSerializer
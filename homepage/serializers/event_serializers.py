@@ -1,30 +1,25 @@
 # homepage/serializers/event_serializers.py
-from rest_framework import serializers
+from homepage.serializers.base_serializers import (
+    TranslatableModelSerializer,
+    TranslatedField,
+)
 from homepage.models.event_models import EventCategory, Event
 from uploads.serializers import MediaSerializer
 
-class EventCategorySerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
+class EventCategorySerializer(TranslatableModelSerializer):
+    name = TranslatedField()
 
     class Meta:
         model = EventCategory
         fields = ["id", "slug", "name"]
 
-    def get_name(self, obj):
-        return obj.safe_translation_getter("name", any_language=True)
 
-class EventSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
+class EventSerializer(TranslatableModelSerializer):
+    title = TranslatedField()
+    description = TranslatedField()
     category = EventCategorySerializer(read_only=True)
     main_image = MediaSerializer(read_only=True)
 
     class Meta:
         model = Event
         fields = ["id", "title", "description", "category", "main_image", "date", "created_at"]
-
-    def get_title(self, obj):
-        return obj.safe_translation_getter("title", any_language=True)
-
-    def get_description(self, obj):
-        return obj.safe_translation_getter("description", any_language=True)
\ No newline at end of file
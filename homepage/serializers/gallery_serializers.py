@@ -1,25 +1,25 @@
 # homepage/serializers/gallery_serializers.py
 # 갤러리 모델의 API 응답 형식을 정의합니다.
 
-from rest_framework import serializers
+from homepage.serializers.base_serializers import (
+    TranslatableModelSerializer,
+    TranslatedField,
+)
 from homepage.models.gallery_models import GalleryCategory, GalleryItem
 from uploads.serializers import MediaSerializer
 
 
-class GalleryCategorySerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
+class GalleryCategorySerializer(TranslatableModelSerializer):
+    name = TranslatedField()
 
     class Meta:
         model = GalleryCategory
         fields = ["id", "slug", "name"]
 
-    def get_name(self, obj):
-        return obj.safe_translation_getter("name", any_language=True)
 
-
-class GalleryItemListSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    short_description = serializers.SerializerMethodField()
+class GalleryItemListSerializer(TranslatableModelSerializer):
+    title = TranslatedField()
+    short_description = TranslatedField()
     category = GalleryCategorySerializer(read_only=True)
     image = MediaSerializer(read_only=True)
 
@@ -35,17 +35,11 @@ class GalleryItemListSerializer(serializers.ModelSerializer):
             "is_featured",
         ]
 
-    def get_title(self, obj):
-        return obj.safe_translation_getter("title", any_language=True)
-
-    def get_short_description(self, obj):
-        return obj.safe_translation_getter("short_description", any_language=True)
-
 
-class GalleryItemDetailSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    short_description = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
+class GalleryItemDetailSerializer(TranslatableModelSerializer):
+    title = TranslatedField()
+    short_description = TranslatedField()
+    description = TranslatedField()
     category = GalleryCategorySerializer(read_only=True)
     image = MediaSerializer(read_only=True)
 
@@ -61,12 +55,3 @@ class GalleryItemDetailSerializer(serializers.ModelSerializer):
             "category",
             "is_featured",
         ]
-
-    def get_title(self, obj):
-        return obj.safe_translation_getter("title", any_language=True)
-
-    def get_short_description(self, obj):
-        return obj.safe_translation_getter("short_description", any_language=True)
-
-    def get_description(self, obj):
-        return obj.safe_translation_getter("description", any_language=True)
@@ -1,5 +1,9 @@
 # homepage/serializers/global_serializers.py
 from rest_framework import serializers
+from homepage.serializers.base_serializers import (
+    TranslatableModelSerializer,
+    TranslatedField,
+)
 
 from homepage.models.global_models import (
     SiteTitle,
@@ -12,74 +16,55 @@ from homepage.models.global_models import (
 )
 
 
-class SiteTitleSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
+class SiteTitleSerializer(TranslatableModelSerializer):
+    title = TranslatedField()
 
     class Meta:
         model = SiteTitle
         fields = ["id", "title"]
 
-    def get_title(self, obj):
-        # LocaleMiddleware가 설정한 현재 언어의 title
-        return obj.safe_translation_getter("title", any_language=True)
-
 
-class NavigationSubMenuSerializer(serializers.ModelSerializer):
-    label = serializers.SerializerMethodField()
+class NavigationSubMenuSerializer(TranslatableModelSerializer):
+    label = TranslatedField()
 
     class Meta:
         model = NavigationSubMenu
         fields = ["id", "href", "label"]
 
-    def get_label(self, obj):
-        return obj.safe_translation_getter("label", any_language=True)
 
-
-class NavigationGroupSerializer(serializers.ModelSerializer):
-    group_label = serializers.SerializerMethodField()
+class NavigationGroupSerializer(TranslatableModelSerializer):
+    group_label = TranslatedField()
     sub_menus = NavigationSubMenuSerializer(many=True, read_only=True)
 
     class Meta:
         model = NavigationGroup
         fields = ["id", "group_label", "highlighted", "sub_menus"]
 
-    def get_group_label(self, obj):
-        return obj.safe_translation_getter("group_label", any_language=True)
-
 
-class FooterSubMenuSerializer(serializers.ModelSerializer):
-    label = serializers.SerializerMethodField()
+class FooterSubMenuSerializer(TranslatableModelSerializer):
+    label = TranslatedField()
 
     class Meta:
         model = FooterSubMenu
         fields = ["id", "href", "label", "open_in_new_tab"]
 
-    def get_label(self, obj):
-        return obj.safe_translation_getter("label", any_language=True)
 
-
-class FooterSectionSerializer(serializers.ModelSerializer):
-    label = serializers.SerializerMethodField()
+class FooterSectionSerializer(TranslatableModelSerializer):
+    label = TranslatedField()
     sub_menus = FooterSubMenuSerializer(many=True, read_only=True)
 
     class Meta:
         model = FooterSection
         fields = ["id", "label", "sub_menus"]
 
-    def get_label(self, obj):
-        return obj.safe_translation_getter("label", any_language=True)
-
 
-class FamilySiteSerializer(serializers.ModelSerializer):
-    label = serializers.SerializerMethodField()
+class FamilySiteSerializer(TranslatableModelSerializer):
+    label = TranslatedField()
 
     class Meta:
         model = FamilySite
         fields = ["id", "href", "label"]
 
-    def get_label(self, obj):
-        return obj.safe_translation_getter("label", any_language=True)
-
 
 class CopyrightSerializer(serializers.ModelSerializer):
     class Meta:
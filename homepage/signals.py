@@ -1,14 +1,21 @@
 """
 /homepage/signals.py
 모델 변경 이벤트를 감지하여 Next.js 캐시 태그 재검증 시그널 정의
-Django 모델 변경 시 프론트엔드 캐시를 자동 갱신하기 위한 시그널 핸들러 구현
+Django 모델 변경 시 프론트엔드 캐시와 API 응답 캐시를 자동 갱신하기 위한 시그널 핸들러 구현
 """
 
 import logging
+from collections import defaultdict
 import requests
-from django.db.models.signals import post_save, post_delete
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
 from django.conf import settings
+from uploads.models import MediaReference
+from uploads.signals import media_changed
+
+from .response_cache import invalidate_tags
 
 from .models.global_models import (
     SiteTitle,
@@ -30,6 +37,7 @@ from .models.about_models import (
     LicensePage,
 )
 from .models.home_models import HomeSection, HeroSlide
+from .models.resource_models import ResourceCategory, Resource
 from .models.gallery_models import GalleryCategory, GalleryItem
 
 logger = logging.getLogger(__name__)
@@ -109,165 +117,266 @@ def revalidate_all_nextjs_tags():
     return tag_count
 
 
+def invalidate_response_cache(*tags):
+    """
+    API 응답 캐시에서 태그에 속한 항목을 삭제하는 함수
+    트랜잭션 커밋 후에 삭제하여 커밋 전 데이터로 캐시가 다시 채워지지 않도록 합니다.
+    """
+    transaction.on_commit(lambda: invalidate_tags(*tags))
+
+
+def revalidate_tags(*tags):
+    """
+    API 응답 캐시와 Next.js 캐시에서 태그를 함께 무효화하는 함수
+    Next.js는 응답 캐시가 비워진 뒤(커밋 후)에 재검증 요청을 받아 새 데이터를 가져갑니다.
+    """
+
+    def revalidate():
+        invalidate_tags(*tags)
+        for tag in tags:
+            revalidate_nextjs_tag(tag)
+
+    transaction.on_commit(revalidate)
+
+
 # Global models signals
 @receiver(post_save, sender=SiteTitle)
 @receiver(post_delete, sender=SiteTitle)
 def handle_sitetitle_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("global")
-    revalidate_nextjs_tag("sitetitle")
+    revalidate_tags("global", "sitetitle")
 
 
 @receiver(post_save, sender=NavigationGroup)
 @receiver(post_delete, sender=NavigationGroup)
 def handle_navigation_group_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("global")
-    revalidate_nextjs_tag("navigation")
+    revalidate_tags("global", "navigation")
 
 
 @receiver(post_save, sender=NavigationSubMenu)
 @receiver(post_delete, sender=NavigationSubMenu)
 def handle_navigation_submenu_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("global")
-    revalidate_nextjs_tag("navigation")
+    revalidate_tags("global", "navigation")
 
 
 @receiver(post_save, sender=FooterSection)
 @receiver(post_delete, sender=FooterSection)
 def handle_footer_section_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("global")
-    revalidate_nextjs_tag("footer")
+    revalidate_tags("global", "footer")
 
 
 @receiver(post_save, sender=FooterSubMenu)
 @receiver(post_delete, sender=FooterSubMenu)
 def handle_footer_submenu_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("global")
-    revalidate_nextjs_tag("footer")
+    revalidate_tags("global", "footer")
 
 
 @receiver(post_save, sender=FamilySite)
 @receiver(post_delete, sender=FamilySite)
 def handle_familysite_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("global")
-    revalidate_nextjs_tag("familysite")
+    revalidate_tags("global", "familysite")
 
 
 @receiver(post_save, sender=Copyright)
 @receiver(post_delete, sender=Copyright)
 def handle_copyright_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("global")
-    revalidate_nextjs_tag("copyright")
+    revalidate_tags("global", "copyright")
 
 
 # News models signals
 @receiver(post_save, sender=NewsCategory)
 @receiver(post_delete, sender=NewsCategory)
 def handle_news_category_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("news")
-    revalidate_nextjs_tag("newscategories")
+    revalidate_tags("news", "newscategories")
 
 
 @receiver(post_save, sender=News)
 @receiver(post_delete, sender=News)
 def handle_news_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("news")
-    # Also revalidate the specific news item
-    revalidate_nextjs_tag(f"news-{instance.id}")
+    revalidate_tags("news", f"news-{instance.id}")
 
 
 # Events models signals
 @receiver(post_save, sender=EventCategory)
 @receiver(post_delete, sender=EventCategory)
 def handle_event_category_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("events")
-    revalidate_nextjs_tag("eventcategories")
+    revalidate_tags("events", "eventcategories")
 
 
 @receiver(post_save, sender=Event)
 @receiver(post_delete, sender=Event)
 def handle_event_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("events")
-    # Also revalidate the specific event item
-    revalidate_nextjs_tag(f"event-{instance.id}")
+    revalidate_tags("events", f"event-{instance.id}")
 
 
 # About models signals
+@receiver(pre_save, sender=Creator)
+@receiver(pre_save, sender=Character)
+def remember_previous_slug(sender, instance, **kwargs):
+    """slug가 바뀌면 이전 slug의 상세 응답도 무효화할 수 있도록 저장 전 값을 기록"""
+    instance._previous_slug = (
+        sender.objects.filter(pk=instance.pk).values_list("slug", flat=True).first()
+        if instance.pk
+        else None
+    )
+
+
+def get_slug_tags(prefix, instance):
+    """현재 slug 태그와, 이번 저장에서 slug가 바뀌었다면 이전 slug 태그"""
+    tags = [f"{prefix}-{instance.slug}"]
+    previous_slug = getattr(instance, "_previous_slug", None)
+    if previous_slug and previous_slug != instance.slug:
+        tags.append(f"{prefix}-{previous_slug}")
+    return tags
+
+
 @receiver(post_save, sender=Creator)
 @receiver(post_delete, sender=Creator)
 def handle_creator_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("about")
-    revalidate_nextjs_tag("creators")
-    # Also revalidate the specific creator
-    revalidate_nextjs_tag(f"creator-{instance.slug}")
+    revalidate_tags("about", "creators", *get_slug_tags("creator", instance))
 
 
 @receiver(post_save, sender=BookCategory)
 @receiver(post_delete, sender=BookCategory)
 def handle_book_category_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("about")
-    revalidate_nextjs_tag("books")
-    revalidate_nextjs_tag("bookcategories")
+    revalidate_tags("about", "books", "bookcategories")
 
 
 @receiver(post_save, sender=Book)
 @receiver(post_delete, sender=Book)
 def handle_book_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("about")
-    revalidate_nextjs_tag("books")
-    # Also revalidate the specific book
-    revalidate_nextjs_tag(f"book-{instance.id}")
+    revalidate_tags("about", "books", f"book-{instance.id}")
 
 
 @receiver(post_save, sender=Character)
 @receiver(post_delete, sender=Character)
 def handle_character_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("about")
-    revalidate_nextjs_tag("characters")
-    # Also revalidate the specific character
-    revalidate_nextjs_tag(f"character-{instance.slug}")
+    revalidate_tags("about", "characters", *get_slug_tags("character", instance))
 
 
 @receiver(post_save, sender=HistoryEvent)
 @receiver(post_delete, sender=HistoryEvent)
 def handle_history_event_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("about")
-    revalidate_nextjs_tag("history")
+    revalidate_tags("about", "history")
 
 
 @receiver(post_save, sender=LicensePage)
 @receiver(post_delete, sender=LicensePage)
 def handle_license_page_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("about")
-    revalidate_nextjs_tag("licenses")
+    revalidate_tags("about", "licenses")
 
 
 # Home models signals
 @receiver(post_save, sender=HomeSection)
 @receiver(post_delete, sender=HomeSection)
 def handle_home_section_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("home")
-    revalidate_nextjs_tag("homesections")
+    revalidate_tags("home", "homesections")
 
 
 @receiver(post_save, sender=HeroSlide)
 @receiver(post_delete, sender=HeroSlide)
 def handle_hero_slide_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("home")
-    revalidate_nextjs_tag("heroslides")
+    revalidate_tags("home", "heroslides")
 
 
 # Gallery models signals
 @receiver(post_save, sender=GalleryCategory)
 @receiver(post_delete, sender=GalleryCategory)
 def handle_gallery_category_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("gallery")
-    revalidate_nextjs_tag("gallerycategories")
+    revalidate_tags("gallery", "gallerycategories")
 
 
 @receiver(post_save, sender=GalleryItem)
 @receiver(post_delete, sender=GalleryItem)
 def handle_gallery_item_change(sender, instance, **kwargs):
-    revalidate_nextjs_tag("gallery")
-    revalidate_nextjs_tag("galleryitems")
-    # 개별 갤러리 아이템 태그 재검증
-    revalidate_nextjs_tag(f"gallery-{instance.id}")
+    revalidate_tags("gallery", "galleryitems", f"gallery-{instance.id}")
+
+
+# Resource models signals
+# 리소스 태그는 프론트엔드에서 사용하지 않으므로 API 응답 캐시만 무효화
+@receiver(post_save, sender=ResourceCategory)
+@receiver(post_delete, sender=ResourceCategory)
+def handle_resource_category_change(sender, instance, **kwargs):
+    invalidate_response_cache("resources", "resourcecategories")
+
+
+@receiver(post_save, sender=Resource)
+@receiver(post_delete, sender=Resource)
+def handle_resource_change(sender, instance, **kwargs):
+    invalidate_response_cache("resources", f"resource-{instance.id}")
+
+
+# 모델별 변경 핸들러 (번역 행 삭제, 참조하는 Media 변경 시 원본 객체의 핸들러를 실행)
+CHANGE_HANDLERS = {
+    SiteTitle: handle_sitetitle_change,
+    NavigationGroup: handle_navigation_group_change,
+    NavigationSubMenu: handle_navigation_submenu_change,
+    FooterSection: handle_footer_section_change,
+    FooterSubMenu: handle_footer_submenu_change,
+    FamilySite: handle_familysite_change,
+    Copyright: handle_copyright_change,
+    NewsCategory: handle_news_category_change,
+    News: handle_news_change,
+    EventCategory: handle_event_category_change,
+    Event: handle_event_change,
+    Creator: handle_creator_change,
+    BookCategory: handle_book_category_change,
+    Book: handle_book_change,
+    Character: handle_character_change,
+    HistoryEvent: handle_history_event_change,
+    LicensePage: handle_license_page_change,
+    HomeSection: handle_home_section_change,
+    HeroSlide: handle_hero_slide_change,
+    GalleryCategory: handle_gallery_category_change,
+    GalleryItem: handle_gallery_item_change,
+    ResourceCategory: handle_resource_category_change,
+    Resource: handle_resource_change,
+}
+
+
+# Translation signals
+def handle_translation_delete(sender, instance, origin=None, **kwargs):
+    """
+    관리자 화면의 번역 삭제처럼 번역 행만 삭제되면 원본 객체의 태그를 무효화합니다.
+    원본 객체와 함께 삭제되는 경우는 원본의 post_delete에서 처리합니다.
+    """
+    master_model = sender.master.field.related_model
+    # origin은 delete()를 호출한 객체 또는 쿼리셋
+    if issubclass(getattr(origin, "model", type(origin)), master_model):
+        return
+    master = master_model.objects.filter(pk=instance.master_id).first()
+    if master is not None:
+        CHANGE_HANDLERS[master_model](sender=master_model, instance=master)
+
+
+for model in CHANGE_HANDLERS:
+    for parler_meta in getattr(model, "_parler_meta", None) or ():
+        post_delete.connect(
+            handle_translation_delete,
+            sender=parler_meta.model,
+            dispatch_uid=f"translation-delete-{parler_meta.model._meta.label_lower}",
+        )
+
+
+# Media signals
+@receiver(media_changed)
+def handle_media_change(sender, media_ids, **kwargs):
+    """
+    Media나 파생 이미지가 바뀌면 참조 색인에서 이 Media를 사용하는 객체를 찾아
+    각 객체가 변경된 것처럼 태그를 무효화합니다 (srcset, 크기, 파일 URL이 응답에 포함됨).
+    """
+    source_pks = defaultdict(set)
+    references = (
+        MediaReference.objects.filter(media_id__in=media_ids)
+        .values_list("source_model", "source_pk")
+        .distinct()
+    )
+    for source_model, source_pk in references:
+        source_pks[source_model].add(source_pk)
+
+    for source_model, pks in source_pks.items():
+        model = apps.get_model(source_model)
+        handler = CHANGE_HANDLERS.get(model)
+        if handler is None:
+            continue
+        for instance in model.objects.filter(pk__in=pks):
+            handler(sender=model, instance=instance)
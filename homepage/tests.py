@@ -1,3 +1,287 @@
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import translation
+from homepage.models.about_models import Creator
+from homepage.models.gallery_models import GalleryCategory, GalleryItem
+from homepage.models.global_models import (
+    Copyright,
+    FamilySite,
+    FooterSection,
+    FooterSubMenu,
+    NavigationGroup,
+    NavigationSubMenu,
+    SiteTitle,
+)
+from homepage.models.news_models import News, NewsCategory
+from homepage.serializers.gallery_serializers import GalleryItemListSerializer
+from uploads.models import Media
+from uploads.signals import notify_media_changed
 
-# Create your tests here.
+
+def create_translated(model, translations, **fields):
+    """{언어: {필드: 값}} 번역을 가진 parler 모델 객체 생성"""
+    instance = model(**fields)
+    for language, values in translations.items():
+        instance.set_current_language(language)
+        for name, value in values.items():
+            setattr(instance, name, value)
+        instance.save()
+    return instance
+
+
+class TranslationFallbackTests(TestCase):
+    """한 언어로만 작성된 콘텐츠도 다른 언어 요청에서 그 언어로 표시되는지 확인"""
+
+    def setUp(self):
+        cache.clear()
+        self.category = create_translated(
+            GalleryCategory, {"ko": {"name": "카테고리"}}, slug="cat"
+        )
+        self.item = create_translated(
+            GalleryItem, {"en": {"title": "EN only"}}, category=self.category
+        )
+
+    def get_items(self, response):
+        data = response.json()
+        return data["results"] if isinstance(data, dict) else data
+
+    def test_list_falls_back_to_any_language(self):
+        response = self.client.get(reverse("gallery-list"), HTTP_ACCEPT_LANGUAGE="ko")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_items(response)[0]["title"], "EN only")
+
+    def test_detail_falls_back_to_any_language(self):
+        response = self.client.get(
+            reverse("gallery-detail", kwargs={"id": self.item.id}),
+            HTTP_ACCEPT_LANGUAGE="ko",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["title"], "EN only")
+
+    def test_related_model_falls_back_to_any_language(self):
+        response = self.client.get(reverse("gallery-list"), HTTP_ACCEPT_LANGUAGE="en")
+        self.assertEqual(self.get_items(response)[0]["category"]["name"], "카테고리")
+
+    def test_prefetched_translations_include_every_language(self):
+        item = GalleryItem.objects.prefetch_translations().language("ko").get()
+        languages = {t.language_code for t in item.translations.all()}
+        self.assertEqual(languages, {"en"})
+        self.assertEqual(
+            item.safe_translation_getter("title", any_language=True), "EN only"
+        )
+
+    def test_list_query_count_does_not_grow_with_items(self):
+        def count_queries():
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(reverse("gallery-list"))
+            return len(queries)
+
+        baseline = count_queries()
+        for i in range(3):
+            create_translated(
+                GalleryItem, {"ko": {"title": f"항목 {i}"}}, category=self.category
+            )
+        self.assertEqual(count_queries(), baseline)
+
+    def test_serializer_matches_safe_translation_getter(self):
+        create_translated(
+            GalleryItem, {"ko": {"title": "한국어"}, "en": {"title": "English"}}
+        )
+        with translation.override("ko"):
+            items = list(GalleryItem.objects.order_by("id"))
+            data = GalleryItemListSerializer(items, many=True).data
+            expected = [
+                GalleryItem.objects.get(pk=item.pk).safe_translation_getter(
+                    "title", any_language=True
+                )
+                for item in items
+            ]
+        self.assertEqual([row["title"] for row in data], expected)
+        self.assertEqual(expected, ["EN only", "한국어"])
+
+
+class ConditionalRequestTests(TestCase):
+    """태그 버전으로 만든 ETag/Last-Modified와 변경 후 무효화 확인"""
+
+    def setUp(self):
+        cache.clear()
+        self.category = create_translated(
+            NewsCategory, {"ko": {"name": "공지"}}, slug="notice"
+        )
+        self.news = create_translated(
+            News,
+            {"ko": {"title": "첫 소식", "description": "내용"}},
+            category=self.category,
+            date="2024-01-01",
+        )
+        self.url = reverse("news-list")
+        self.first = self.client.get(self.url)
+
+    def get_modified_since(self):
+        return self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=self.first["Last-Modified"]
+        )
+
+    def test_unchanged_response_is_not_modified(self):
+        self.assertEqual(self.first.status_code, 200)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=self.first["ETag"])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], self.first["ETag"])
+        self.assertEqual(self.get_modified_since().status_code, 304)
+
+    def test_cached_response_is_served_without_queries(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.content, self.first.content)
+        self.assertEqual(response["ETag"], self.first["ETag"])
+
+    def test_delete_invalidates_if_modified_since(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.news.delete()
+        response = self.get_modified_since()
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], self.first["ETag"])
+
+    def test_category_rename_invalidates_if_modified_since(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.set_current_language("ko")
+            self.category.name = "새 이름"
+            self.category.save()
+        for _ in range(2):
+            response = self.get_modified_since()
+            self.assertEqual(response.status_code, 200)
+            self.assertIn("새 이름", response.content.decode())
+
+    def test_translation_edit_invalidates_etag(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.news.set_current_language("ko")
+            self.news.title = "고친 소식"
+            self.news.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=self.first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("고친 소식", response.content.decode())
+        self.assertEqual(self.get_modified_since().status_code, 200)
+
+    def test_translation_delete_invalidates_etag(self):
+        self.news.set_current_language("en")
+        self.news.title = "First news"
+        self.news.description = "Body"
+        self.news.save()
+        first = self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.news.translations.get(language_code="en").delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+
+    def test_unrelated_tag_keeps_cached_response(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            create_translated(GalleryCategory, {"ko": {"name": "갤러리"}}, slug="g")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=self.first["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+
+class ResponseCacheInvalidationTests(TestCase):
+    """태그 무효화로 캐시한 응답이 바뀐 콘텐츠를 다시 가져오는지 확인"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_slug_rename_invalidates_previous_slug(self):
+        creator = create_translated(Creator, {"ko": {"name": "작가"}}, slug="old")
+        old_url = reverse("creator-detail", kwargs={"slug": "old"})
+        self.assertEqual(self.client.get(old_url).status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            creator.slug = "new"
+            creator.save()
+        self.assertEqual(self.client.get(old_url).status_code, 404)
+        new_url = reverse("creator-detail", kwargs={"slug": "new"})
+        self.assertEqual(self.client.get(new_url).status_code, 200)
+
+    def test_media_change_invalidates_referencing_responses(self):
+        media = Media.objects.create(file="2024/01/01-000000.png", hash_value="ab" * 32)
+        with self.captureOnCommitCallbacks(execute=True):
+            create_translated(
+                News,
+                {"ko": {"title": "소식"}},
+                category=create_translated(
+                    NewsCategory, {"ko": {"name": "공지"}}, slug="notice"
+                ),
+                date="2024-01-01",
+                main_image=media,
+            )
+        url = reverse("news-list")
+        first = self.client.get(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            Media.objects.filter(pk=media.pk).update(hash_value="cd" * 32)
+            notify_media_changed(media.id)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("?v=cdcdcdcd", response.content.decode())
+
+
+class GlobalBootstrapTests(TestCase):
+    """레이아웃 전역 데이터를 한 번에 반환하는 bootstrap API 확인"""
+
+    def setUp(self):
+        cache.clear()
+        create_translated(SiteTitle, {"ko": {"title": "사이트"}})
+        Copyright.objects.create(text="© 2024")
+        create_translated(FamilySite, {"ko": {"label": "패밀리"}}, href="/f")
+        section = create_translated(FooterSection, {"ko": {"label": "푸터"}})
+        create_translated(
+            FooterSubMenu, {"ko": {"label": "약관"}}, footer_section=section, href="/t"
+        )
+        self.add_navigation_groups(2)
+        self.url = reverse("global-bootstrap")
+
+    def add_navigation_groups(self, count):
+        for i in range(count):
+            group = create_translated(
+                NavigationGroup, {"ko": {"group_label": f"그룹 {i}"}}, order=i
+            )
+            create_translated(
+                NavigationSubMenu,
+                {"ko": {"label": f"메뉴 {i}"}},
+                parent_group=group,
+                href=f"/m{i}",
+            )
+
+    def test_payload_matches_individual_endpoints(self):
+        data = self.client.get(self.url).json()
+        endpoints = {
+            "sitetitle": "sitetitle-detail",
+            "navigation": "navigation-list",
+            "footer_sections": "footer-sections-list",
+            "family_sites": "family-sites-list",
+            "copyright": "copyright-detail",
+        }
+        for key, name in endpoints.items():
+            with self.subTest(key=key):
+                self.assertEqual(data[key], self.client.get(reverse(name)).json())
+
+    def test_query_count_does_not_grow_with_navigation(self):
+        def count_queries():
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(self.url)
+            return len(queries)
+
+        baseline = count_queries()
+        self.add_navigation_groups(4)
+        self.assertEqual(count_queries(), baseline)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+    def test_global_change_invalidates_bootstrap(self):
+        first = self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 304)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.add_navigation_groups(1)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["navigation"]), 3)
@@ -6,6 +6,7 @@ from homepage.views.global_views import (
     FooterSectionListAPIView,
     FamilySiteListAPIView,
     CopyrightDetailAPIView,
+    GlobalBootstrapAPIView,
 )
 from homepage.views.home_views import HomeSectionListAPIView, HeroSlideListAPIView
 
@@ -66,6 +67,11 @@ urlpatterns = [
     path(
         "global/copyright/", CopyrightDetailAPIView.as_view(), name="copyright-detail"
     ),
+    path(
+        "global/bootstrap/",
+        GlobalBootstrapAPIView.as_view(),
+        name="global-bootstrap",
+    ),
     # Home
     path("home/sections/", HomeSectionListAPIView.as_view(), name="home-sections"),
     path("home/hero/", HeroSlideListAPIView.as_view(), name="home-hero"),
@@ -2,6 +2,7 @@
 
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
+from homepage.views.base_views import CachedResponseMixin
 
 from homepage.models.about_models import (
     Creator,
@@ -22,63 +23,114 @@ from homepage.serializers.about_serializers import (
 
 
 # 1) Creator
-class CreatorListAPIView(generics.ListAPIView):
-    queryset = Creator.objects.all()
+class CreatorListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = (
+        Creator.objects.select_related("photo")
+        .prefetch_related("photo__renditions")
+        .prefetch_translations()
+    )
+    cache_tags = ("creators",)
     serializer_class = CreatorSerializer
     permission_classes = [AllowAny]
 
 
-class CreatorDetailAPIView(generics.RetrieveAPIView):
-    queryset = Creator.objects.all()
+class CreatorDetailAPIView(CachedResponseMixin, generics.RetrieveAPIView):
+    queryset = (
+        Creator.objects.select_related("photo")
+        .prefetch_related("photo__renditions")
+        .prefetch_translations()
+    )
+    cache_tags = ("creator-{slug}",)
     serializer_class = CreatorSerializer
     lookup_field = "slug"
     permission_classes = [AllowAny]
 
 
 # 2) BookCategory
-class BookCategoryListAPIView(generics.ListAPIView):
-    queryset = BookCategory.objects.all()
+class BookCategoryListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = BookCategory.objects.prefetch_translations()
+    cache_tags = ("bookcategories",)
     serializer_class = BookCategorySerializer
     permission_classes = [AllowAny]
 
 
 # 3) Book
-class BookListAPIView(generics.ListAPIView):
-    queryset = Book.objects.select_related("category").prefetch_related("authors")
+class BookListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = (
+        Book.objects.select_related("category", "cover_image")
+        .prefetch_related("authors", "cover_image__renditions")
+        .prefetch_translations("category", "authors")
+    )
+    cache_tags = ("books", "bookcategories", "creators")
     serializer_class = BookSerializer
     permission_classes = [AllowAny]
 
 
-class BookDetailAPIView(generics.RetrieveAPIView):
-    queryset = Book.objects.select_related("category").prefetch_related("authors")
+class BookDetailAPIView(CachedResponseMixin, generics.RetrieveAPIView):
+    queryset = (
+        Book.objects.select_related("category", "cover_image")
+        .prefetch_related("authors", "cover_image__renditions")
+        .prefetch_translations("category", "authors")
+    )
+    cache_tags = ("book-{pk}", "bookcategories", "creators")
     serializer_class = BookSerializer
     lookup_field = "pk"
     permission_classes = [AllowAny]
 
 
 # 4) Character
-class CharacterListAPIView(generics.ListAPIView):
-    queryset = Character.objects.prefetch_related("books", "creator")
+class CharacterListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = (
+        Character.objects.select_related("creator", "image")
+        .prefetch_related(
+            "image__renditions",
+            "books__category",
+            "books__cover_image__renditions",
+            "books__authors",
+        )
+        .prefetch_translations(
+            "creator", "books", "books__category", "books__authors"
+        )
+    )
+    cache_tags = ("characters", "creators", "books", "bookcategories")
     serializer_class = CharacterSerializer
     permission_classes = [AllowAny]
 
 
-class CharacterDetailAPIView(generics.RetrieveAPIView):
-    queryset = Character.objects.prefetch_related("books", "creator")
+class CharacterDetailAPIView(CachedResponseMixin, generics.RetrieveAPIView):
+    queryset = (
+        Character.objects.select_related("creator", "image")
+        .prefetch_related(
+            "image__renditions",
+            "books__category",
+            "books__cover_image__renditions",
+            "books__authors",
+        )
+        .prefetch_translations(
+            "creator", "books", "books__category", "books__authors"
+        )
+    )
+    cache_tags = ("character-{slug}", "creators", "books", "bookcategories")
     serializer_class = CharacterSerializer
     lookup_field = "slug"
     permission_classes = [AllowAny]
 
 
 # 5) History
-class HistoryEventListAPIView(generics.ListAPIView):
-    queryset = HistoryEvent.objects.all()
+class HistoryEventListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = (
+        HistoryEvent.objects.select_related("image")
+        .prefetch_related("image__renditions")
+        .prefetch_translations()
+    )
+    cache_tags = ("history",)
     serializer_class = HistoryEventSerializer
     permission_classes = [AllowAny]
 
 
 # 6) LicensePage
-class LicensePageDetailAPIView(generics.RetrieveAPIView):
+class LicensePageDetailAPIView(CachedResponseMixin, generics.RetrieveAPIView):
+    cache_tags = ("licenses",)
     serializer_class = LicensePageSerializer
     permission_classes = [AllowAny]
 
@@ -0,0 +1,55 @@
+# homepage/views/base_views.py
+# 공개 API 뷰 공통 믹스인
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from homepage import response_cache
+
+
+class CachedResponseMixin:
+    """
+    GET 응답을 응답 캐시에 저장하고 이후 같은 요청은 ORM과 시리얼라이저를 거치지 않고 반환합니다.
+    cache_tags에는 signals.py가 무효화하는 태그를 지정하며, "news-{id}"처럼
+    URL 인자를 넣은 태그는 요청마다 채워집니다.
+    응답에는 태그 버전으로 만든 ETag와 Last-Modified(태그가 마지막으로 바뀐 시각)를 붙이고
+    If-None-Match/If-Modified-Since가 최신이면 304를 반환합니다.
+    """
+
+    cache_tags = ()
+
+    def get_cache_tags(self):
+        return [tag.format(**self.kwargs) for tag in self.cache_tags]
+
+    def dispatch(self, request, *args, **kwargs):
+        if not response_cache.is_cacheable(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        key = response_cache.get_cache_key(request)
+        tags = self.get_cache_tags()
+        validators = response_cache.get_validators(key, tags)
+        if validators is None:
+            return super().dispatch(request, *args, **kwargs)
+        etag, last_modified = validators
+
+        # 쿼리셋과 시리얼라이저를 실행하기 전에 검증값만으로 조건부 요청을 처리
+        cached = response_cache.get_cached_response(key, etag)
+        base = cached if cached is not None else HttpResponse()
+        base["ETag"] = etag
+        base["Last-Modified"] = http_date(last_modified)
+        conditional = get_conditional_response(
+            request, etag=etag, last_modified=last_modified, response=base
+        )
+        if conditional.status_code == 304:
+            return conditional
+        if cached is not None:
+            return cached
+
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code == 200:
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(last_modified)
+            if response_cache.is_enabled():
+                response.add_post_render_callback(
+                    lambda rendered: response_cache.store_response(key, rendered, tags)
+                )
+        return response
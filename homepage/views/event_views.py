@@ -1,21 +1,33 @@
 # homepage/views/event_views.py
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
+from homepage.views.base_views import CachedResponseMixin
 from homepage.models.event_models import EventCategory, Event
 from homepage.serializers.event_serializers import EventCategorySerializer, EventSerializer
 
-class EventCategoryListAPIView(generics.ListAPIView):
-    queryset = EventCategory.objects.all()
+class EventCategoryListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = EventCategory.objects.prefetch_translations()
+    cache_tags = ("eventcategories",)
     serializer_class = EventCategorySerializer
     permission_classes = [AllowAny]
 
-class EventListAPIView(generics.ListAPIView):
-    queryset = Event.objects.select_related("category").all()
+class EventListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = (
+        Event.objects.select_related("category", "main_image")
+        .prefetch_related("main_image__renditions")
+        .prefetch_translations("category")
+    )
+    cache_tags = ("events",)
     serializer_class = EventSerializer
     permission_classes = [AllowAny]
 
-class EventDetailAPIView(generics.RetrieveAPIView):
-    queryset = Event.objects.select_related("category").all()
+class EventDetailAPIView(CachedResponseMixin, generics.RetrieveAPIView):
+    queryset = (
+        Event.objects.select_related("category", "main_image")
+        .prefetch_related("main_image__renditions")
+        .prefetch_translations("category")
+    )
+    cache_tags = ("event-{id}", "eventcategories")
     serializer_class = EventSerializer
     lookup_field = "id"
     permission_classes = [AllowAny]
\ No newline at end of file
@@ -3,6 +3,7 @@
 
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
+from homepage.views.base_views import CachedResponseMixin
 from django.db.models import Prefetch
 
 from homepage.models.gallery_models import GalleryCategory, GalleryItem
@@ -13,18 +14,24 @@ from homepage.serializers.gallery_serializers import (
 )
 
 
-class GalleryCategoryListAPIView(generics.ListAPIView):
+class GalleryCategoryListAPIView(CachedResponseMixin, generics.ListAPIView):
     """갤러리 카테고리 목록 API"""
 
-    queryset = GalleryCategory.objects.all()
+    queryset = GalleryCategory.objects.prefetch_translations()
+    cache_tags = ("gallerycategories",)
     serializer_class = GalleryCategorySerializer
     permission_classes = [AllowAny]
 
 
-class GalleryItemListAPIView(generics.ListAPIView):
+class GalleryItemListAPIView(CachedResponseMixin, generics.ListAPIView):
     """갤러리 아이템 목록 API"""
 
-    queryset = GalleryItem.objects.select_related("category", "image").all()
+    queryset = (
+        GalleryItem.objects.select_related("category", "image")
+        .prefetch_related("image__renditions")
+        .prefetch_translations("category")
+    )
+    cache_tags = ("galleryitems", "gallerycategories")
     serializer_class = GalleryItemListSerializer
     permission_classes = [AllowAny]
 
@@ -49,10 +56,15 @@ class GalleryItemListAPIView(generics.ListAPIView):
         return queryset
 
 
-class GalleryItemDetailAPIView(generics.RetrieveAPIView):
+class GalleryItemDetailAPIView(CachedResponseMixin, generics.RetrieveAPIView):
     """갤러리 아이템 상세 API"""
 
-    queryset = GalleryItem.objects.select_related("category", "image")
+    queryset = (
+        GalleryItem.objects.select_related("category", "image")
+        .prefetch_related("image__renditions")
+        .prefetch_translations("category")
+    )
+    cache_tags = ("gallery-{id}", "gallerycategories")
     serializer_class = GalleryItemDetailSerializer
     lookup_field = "id"
     permission_classes = [AllowAny]
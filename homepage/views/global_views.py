@@ -1,6 +1,9 @@
 # homepage/views/global_views.py
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from homepage.views.base_views import CachedResponseMixin
 
 from homepage.models.global_models import (
     SiteTitle,
@@ -18,7 +21,8 @@ from homepage.serializers.global_serializers import (
 )
 
 
-class SiteTitleDetailAPIView(generics.RetrieveAPIView):
+class SiteTitleDetailAPIView(CachedResponseMixin, generics.RetrieveAPIView):
+    cache_tags = ("sitetitle",)
     serializer_class = SiteTitleSerializer
     permission_classes = [AllowAny]
 
@@ -26,27 +30,74 @@ class SiteTitleDetailAPIView(generics.RetrieveAPIView):
         return SiteTitle.load()
 
 
-class NavigationGroupListAPIView(generics.ListAPIView):
-    queryset = NavigationGroup.objects.prefetch_related("sub_menus").all()
+class NavigationGroupListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = NavigationGroup.objects.prefetch_related(
+        "sub_menus"
+    ).prefetch_translations("sub_menus")
+    cache_tags = ("navigation",)
     serializer_class = NavigationGroupSerializer
     permission_classes = [AllowAny]
 
 
-class FooterSectionListAPIView(generics.ListAPIView):
-    queryset = FooterSection.objects.prefetch_related("sub_menus").all()
+class FooterSectionListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = FooterSection.objects.prefetch_related(
+        "sub_menus"
+    ).prefetch_translations("sub_menus")
+    cache_tags = ("footer",)
     serializer_class = FooterSectionSerializer
     permission_classes = [AllowAny]
 
 
-class FamilySiteListAPIView(generics.ListAPIView):
-    queryset = FamilySite.objects.all()
+class FamilySiteListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = FamilySite.objects.prefetch_translations()
+    cache_tags = ("familysite",)
     serializer_class = FamilySiteSerializer
     permission_classes = [AllowAny]
 
 
-class CopyrightDetailAPIView(generics.RetrieveAPIView):
+class CopyrightDetailAPIView(CachedResponseMixin, generics.RetrieveAPIView):
+    cache_tags = ("copyright",)
     serializer_class = CopyrightSerializer
     permission_classes = [AllowAny]
 
     def get_object(self):
         return Copyright.load()
+
+
+class GlobalBootstrapAPIView(CachedResponseMixin, APIView):
+    """
+    레이아웃에 필요한 전역 데이터(사이트 제목, 네비게이션, 푸터, 패밀리 사이트, 저작권)를
+    한 번의 요청으로 반환하는 API
+    각 목록은 개별 API와 같은 쿼리셋을 사용하므로 데이터 수와 관계없이 쿼리 수가 일정합니다.
+    """
+
+    cache_tags = ("global",)
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        context = {"request": request, "view": self}
+        site_title = (
+            SiteTitle.objects.prefetch_translations().filter(pk=1).first()
+            or SiteTitle.load()
+        )
+        return Response(
+            {
+                "sitetitle": SiteTitleSerializer(site_title, context=context).data,
+                "navigation": NavigationGroupSerializer(
+                    NavigationGroupListAPIView.queryset.all(),
+                    many=True,
+                    context=context,
+                ).data,
+                "footer_sections": FooterSectionSerializer(
+                    FooterSectionListAPIView.queryset.all(),
+                    many=True,
+                    context=context,
+                ).data,
+                "family_sites": FamilySiteSerializer(
+                    FamilySiteListAPIView.queryset.all(), many=True, context=context
+                ).data,
+                "copyright": CopyrightSerializer(
+                    Copyright.load(), context=context
+                ).data,
+            }
+        )
@@ -1,5 +1,6 @@
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
+from homepage.views.base_views import CachedResponseMixin
 from homepage.models import HomeSection, HeroSlide
 from homepage.serializers.home_serializers import (
     HomeSectionSerializer,
@@ -7,13 +8,25 @@ from homepage.serializers.home_serializers import (
 )
 
 
-class HomeSectionListAPIView(generics.ListAPIView):
-    queryset = HomeSection.objects.filter(is_active=True).order_by("order")
+class HomeSectionListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = (
+        HomeSection.objects.filter(is_active=True)
+        .order_by("order")
+        .prefetch_translations()
+    )
+    cache_tags = ("homesections",)
     serializer_class = HomeSectionSerializer
     permission_classes = [AllowAny]
 
 
-class HeroSlideListAPIView(generics.ListAPIView):
-    queryset = HeroSlide.objects.filter(is_active=True).order_by("order")
+class HeroSlideListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = (
+        HeroSlide.objects.select_related("image")
+        .prefetch_related("image__renditions")
+        .filter(is_active=True)
+        .order_by("order")
+        .prefetch_translations()
+    )
+    cache_tags = ("heroslides",)
     serializer_class = HeroSlideSerializer
     permission_classes = [AllowAny]
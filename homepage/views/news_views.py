@@ -1,21 +1,33 @@
 # homepage/views/news_views.py
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
+from homepage.views.base_views import CachedResponseMixin
 from homepage.models.news_models import NewsCategory, News
 from homepage.serializers.news_serializers import NewsCategorySerializer, NewsSerializer
 
-class NewsCategoryListAPIView(generics.ListAPIView):
-    queryset = NewsCategory.objects.all()
+class NewsCategoryListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = NewsCategory.objects.prefetch_translations()
+    cache_tags = ("newscategories",)
     serializer_class = NewsCategorySerializer
     permission_classes = [AllowAny]
 
-class NewsListAPIView(generics.ListAPIView):
-    queryset = News.objects.select_related("category").all()
+class NewsListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = (
+        News.objects.select_related("category", "main_image")
+        .prefetch_related("main_image__renditions")
+        .prefetch_translations("category")
+    )
+    cache_tags = ("news",)
     serializer_class = NewsSerializer
     permission_classes = [AllowAny]
 
-class NewsDetailAPIView(generics.RetrieveAPIView):
-    queryset = News.objects.select_related("category").all()
+class NewsDetailAPIView(CachedResponseMixin, generics.RetrieveAPIView):
+    queryset = (
+        News.objects.select_related("category", "main_image")
+        .prefetch_related("main_image__renditions")
+        .prefetch_translations("category")
+    )
+    cache_tags = ("news-{id}", "newscategories")
     serializer_class = NewsSerializer
     lookup_field = "id"
     permission_classes = [AllowAny]
\ No newline at end of file
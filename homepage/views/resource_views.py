@@ -1,21 +1,33 @@
 # homepage/views/resource_views.py
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
+from homepage.views.base_views import CachedResponseMixin
 from homepage.models.resource_models import ResourceCategory, Resource
 from homepage.serializers.resource_serializers import ResourceCategorySerializer, ResourceSerializer
 
-class ResourceCategoryListAPIView(generics.ListAPIView):
-    queryset = ResourceCategory.objects.all()
+class ResourceCategoryListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = ResourceCategory.objects.prefetch_translations()
+    cache_tags = ("resourcecategories",)
     serializer_class = ResourceCategorySerializer
     permission_classes = [AllowAny]
 
-class ResourceListAPIView(generics.ListAPIView):
-    queryset = Resource.objects.select_related("category").all()
+class ResourceListAPIView(CachedResponseMixin, generics.ListAPIView):
+    queryset = (
+        Resource.objects.select_related("category", "main_image", "file")
+        .prefetch_related("main_image__renditions", "file__renditions")
+        .prefetch_translations("category")
+    )
+    cache_tags = ("resources", "resourcecategories")
     serializer_class = ResourceSerializer
     permission_classes = [AllowAny]
 
-class ResourceDetailAPIView(generics.RetrieveAPIView):
-    queryset = Resource.objects.select_related("category").all()
+class ResourceDetailAPIView(CachedResponseMixin, generics.RetrieveAPIView):
+    queryset = (
+        Resource.objects.select_related("category", "main_image", "file")
+        .prefetch_related("main_image__renditions", "file__renditions")
+        .prefetch_translations("category")
+    )
+    cache_tags = ("resource-{id}", "resourcecategories")
     serializer_class = ResourceSerializer
     lookup_field = "id"
     permission_classes = [AllowAny]
\ No newline at end of file
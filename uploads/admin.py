@@ -1,7 +1,31 @@
 # uploads/admin.py
-from django.contrib import admin
-from .models import Media
-from .tasks import update_media_usage_async, clean_unused_media_async
+from django.contrib import admin, messages
+from django.core.exceptions import PermissionDenied
+from django.db.models import Count
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
+from .gc import format_progress, get_last_run_id, get_locked_run_id, get_progress
+from .models import Media, MediaRendition
+from .similarity import find_near_duplicate_clusters, merge_media, split_by_distance
+from .tasks import (
+    update_media_usage_async,
+    scan_media_usage_async,
+    rescan_media_references_async,
+    clean_unused_media_async,
+    generate_media_renditions_async,
+)
+
+
+class MediaRenditionInline(admin.TabularInline):
+    model = MediaRendition
+    extra = 0
+    fields = ("file", "format", "width", "height", "size")
+    readonly_fields = fields
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
 
 
 @admin.register(Media)
@@ -9,7 +33,93 @@ class MediaAdmin(admin.ModelAdmin):
     list_display = ("id", "title", "file", "uploaded_at")
     list_filter = ("uploaded_at",)
     search_fields = ("title", "file")
-    actions = ["update_media_usage_action", "clean_unused_media_action"]
+    inlines = [MediaRenditionInline]
+    actions = [
+        "update_media_usage_action",
+        "scan_media_usage_action",
+        "rescan_media_references_action",
+        "clean_unused_media_action",
+        "media_gc_status_action",
+        "generate_renditions_action",
+        "near_duplicates_action",
+    ]
+
+    def get_urls(self):
+        urls = [
+            path(
+                "near-duplicates/",
+                self.admin_site.admin_view(self.near_duplicates_view),
+                name="uploads_media_near_duplicates",
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def near_duplicates_view(self, request):
+        """지각 해시가 가까운 이미지 묶음 보고서와 묶음별 병합 처리"""
+        if not self.has_change_permission(request):
+            raise PermissionDenied
+
+        if request.method == "POST":
+            if not self.has_delete_permission(request):
+                raise PermissionDenied
+            try:
+                media_ids = [int(value) for value in request.POST.getlist("media")]
+                keep_id = int(request.POST.get("keep", ""))
+            except ValueError:
+                messages.error(request, "남길 파일을 선택하세요.")
+                return redirect(request.path)
+            medias = Media.objects.in_bulk(media_ids)
+            keep = medias.get(keep_id)
+            if keep is None:
+                messages.error(request, "남길 파일을 선택하세요.")
+                return redirect(request.path)
+            # 묶음 안에서도 남길 파일과 먼 이미지는 다른 이미지일 수 있으므로 병합하지 않음
+            duplicates, far = split_by_distance(keep, medias.values())
+            deleted_count, remaining_ids = merge_media(keep, duplicates)
+            message = f"'{keep}'(으)로 병합했습니다. {deleted_count}개 파일 삭제"
+            if remaining_ids:
+                message += (
+                    f", 바꿀 수 없는 참조가 남은 {len(remaining_ids)}개는 유지 "
+                    f"(id: {', '.join(map(str, remaining_ids))})"
+                )
+            if far:
+                message += (
+                    f", 남길 파일과 거리가 먼 {len(far)}개는 제외 "
+                    f"(id: {', '.join(str(media.id) for media in far)})"
+                )
+            self.message_user(request, message)
+            return redirect(request.path)
+
+        clusters = find_near_duplicate_clusters()
+        medias = (
+            Media.objects.filter(id__in=[i for ids in clusters for i in ids])
+            .annotate(reference_count=Count("references"))
+            .prefetch_related("renditions")
+            .in_bulk()
+        )
+        for media in medias.values():
+            renditions = sorted(media.renditions.all(), key=lambda r: r.width)
+            media.thumbnail_url = (renditions[0].file if renditions else media.file).url
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": "유사 이미지",
+            # 참조가 많고 해상도가 큰 파일을 남길 후보로 먼저 표시
+            "clusters": [
+                sorted(
+                    (medias[media_id] for media_id in ids if media_id in medias),
+                    key=lambda m: (
+                        -m.reference_count,
+                        -((m.width or 0) * (m.height or 0)),
+                        m.id,
+                    ),
+                )
+                for ids in clusters
+            ],
+        }
+        return TemplateResponse(
+            request, "admin/uploads/media/near_duplicates.html", context
+        )
 
     def update_media_usage_action(self, request, queryset):
         task = update_media_usage_async.delay()
@@ -19,13 +129,68 @@ class MediaAdmin(admin.ModelAdmin):
 
     update_media_usage_action.short_description = "(전체, 비동기) 사용 여부 확인"
 
+    def scan_media_usage_action(self, request, queryset):
+        task = scan_media_usage_async.delay()
+        self.message_user(
+            request,
+            f"전체 콘텐츠 스캔 작업이 시작되었습니다. (Task ID: {task.id})",
+        )
+
+    scan_media_usage_action.short_description = (
+        "(전체, 비동기) 전체 콘텐츠 스캔으로 사용 여부 재계산"
+    )
+
+    def rescan_media_references_action(self, request, queryset):
+        task = rescan_media_references_async.delay()
+        self.message_user(
+            request,
+            f"변경된 콘텐츠 재스캔 작업이 시작되었습니다. (Task ID: {task.id})",
+        )
+
+    rescan_media_references_action.short_description = (
+        "(전체, 비동기) 마지막 스캔 이후 변경된 콘텐츠만 재스캔"
+    )
+
     def clean_unused_media_action(self, request, queryset):
+        locked_run_id = get_locked_run_id()
+        if locked_run_id:
+            messages.warning(
+                request,
+                f"미사용 미디어 정리가 이미 진행 중입니다. "
+                f"{format_progress(get_progress(locked_run_id))}",
+            )
+            return
         task = clean_unused_media_async.delay()
         self.message_user(
             request,
-            f"사용 여부 확인 및 삭제 작업이 시작되었습니다. (Task ID: {task.id})",
+            f"사용 여부 확인 및 삭제 작업이 시작되었습니다. (Task ID: {task.id}) "
+            "중단된 작업이 있으면 이어서 진행합니다.",
         )
 
     clean_unused_media_action.short_description = (
         "(전체, 비동기) 사용 여부 확인 후 삭제"
     )
+
+    def media_gc_status_action(self, request, queryset):
+        progress = get_progress(get_last_run_id())
+        self.message_user(request, f"미사용 미디어 정리: {format_progress(progress)}")
+
+    media_gc_status_action.short_description = "(전체) 미사용 미디어 정리 진행 상황"
+
+    def near_duplicates_action(self, request, queryset):
+        return redirect(reverse("admin:uploads_media_near_duplicates"))
+
+    near_duplicates_action.short_description = "(전체) 유사 이미지 보고서 및 병합"
+
+    def generate_renditions_action(self, request, queryset):
+        for media_id in queryset.values_list("id", flat=True):
+            generate_media_renditions_async.delay(media_id)
+        self.message_user(
+            request,
+            f"{queryset.count()}개 파일의 파생 이미지/플레이스홀더 생성 작업이 "
+            "시작되었습니다.",
+        )
+
+    generate_renditions_action.short_description = (
+        "(선택, 비동기) 파생 이미지/플레이스홀더 생성"
+    )
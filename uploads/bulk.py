@@ -0,0 +1,98 @@
+# uploads/bulk.py
+# 여러 파일을 한 요청으로 업로드하는 일괄 처리
+# 해시 계산과 R2 업로드는 스레드 풀에서 병렬로, 중복 확인과 행 생성은 쿼리 한 번씩으로 처리
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models.signals import post_save
+from .dedup import save_unique_media
+from .keys import content_addressed_name
+from .metadata import extract_metadata
+from .models import Media
+
+logger = logging.getLogger(__name__)
+
+
+def _upload(storage, media, file_obj):
+    """파일을 해시 기반 키로 업로드하고 헤더에서 메타데이터를 추출"""
+    file_obj.seek(0)
+    media.apply_metadata(extract_metadata(file_obj, file_obj.name))
+    file_obj.seek(0)
+    name = content_addressed_name(media.hash_value, file_obj.name)
+    media.file.name = storage.save(name, file_obj)
+    return media
+
+
+def _create_rows(medias):
+    """
+    새 Media를 트랜잭션 하나에서 bulk_create로 생성합니다.
+    그 사이 같은 해시가 다른 요청으로 저장되었으면 항목별 upsert로 되돌아갑니다.
+    해시별 저장된 Media를 반환합니다.
+    """
+    try:
+        with transaction.atomic():
+            created = Media.objects.bulk_create(medias)
+    except IntegrityError:
+        logger.info("일괄 업로드 중 동시 업로드와 충돌하여 항목별로 저장합니다.")
+        return {media.hash_value: save_unique_media(media)[0] for media in medias}
+
+    for media in created:
+        # bulk_create는 시그널을 보내지 않으므로 파생 이미지 생성 등을 위해 직접 전송
+        post_save.send(
+            sender=Media,
+            instance=media,
+            created=True,
+            update_fields=None,
+            raw=False,
+            using=media._state.db,
+        )
+    return {media.hash_value: media for media in created}
+
+
+def bulk_upload_media(files, workers=None):
+    """
+    업로드된 파일 목록을 처리하고 입력 순서대로 Media 목록을 반환합니다.
+    같은 요청 안에서 내용이 같은 파일은 하나의 Media로 합쳐집니다.
+    대용량 파일(MEDIA_STREAMING_UPLOAD_THRESHOLD 이상)은 개별 스트리밍 업로드로 처리합니다.
+    작업 스레드는 해시 계산과 스토리지 업로드만 하며 DB 조회는 요청 스레드에서 합니다.
+    """
+    from .views import handle_media_upload
+
+    workers = workers or getattr(settings, "MEDIA_BULK_UPLOAD_CONCURRENCY", 4)
+    threshold = getattr(settings, "MEDIA_STREAMING_UPLOAD_THRESHOLD", None)
+    storage = Media._meta.get_field("file").storage
+    large = {
+        index
+        for index, file_obj in enumerate(files)
+        if threshold and file_obj.size >= threshold
+    }
+    small = [file_obj for index, file_obj in enumerate(files) if index not in large]
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        # hashlib은 큰 버퍼를 처리하는 동안 GIL을 놓으므로 스레드로 병렬 계산됨
+        hashes = list(executor.map(Media.calculate_file_hash, small))
+        existing = Media.objects.in_bulk(set(hashes), field_name="hash_value")
+
+        pending = {}
+        for file_obj, hash_value in zip(small, hashes):
+            if hash_value not in existing and hash_value not in pending:
+                media = Media(
+                    hash_value=hash_value, title=file_obj.name.split("/")[-1]
+                )
+                pending[hash_value] = (media, file_obj)
+        uploaded = list(
+            executor.map(lambda item: _upload(storage, *item), pending.values())
+        )
+
+    saved = dict(existing)
+    if uploaded:
+        saved.update(_create_rows(uploaded))
+
+    # 대용량 파일은 파트 단위로 이미 병렬 전송되므로 순서대로 처리
+    streamed = {index: handle_media_upload(files[index]) for index in sorted(large)}
+    hashes = iter(hashes)
+    return [
+        streamed[index] if index in large else saved[next(hashes)]
+        for index in range(len(files))
+    ]
@@ -0,0 +1,86 @@
+# uploads/dedup.py
+# hash_value 기준 INSERT ... ON CONFLICT 한 문장으로 Media를 생성하거나 기존 행을 반환
+# 같은 파일의 동시 업로드가 경쟁해도 IntegrityError 없이 먼저 저장된 행(승자)을 돌려받음
+import logging
+from django.db import connections, router
+from django.db.models.signals import post_save
+from .metadata import extract_metadata
+from .models import Media
+
+logger = logging.getLogger(__name__)
+
+
+def _upsert_sql(connection):
+    """Media INSERT ... ON CONFLICT (hash_value) 문장과 값 필드 목록"""
+    qn = connection.ops.quote_name
+    opts = Media._meta
+    fields = [field for field in opts.concrete_fields if not field.primary_key]
+    table = qn(opts.db_table)
+    hash_column = qn(opts.get_field("hash_value").column)
+    columns = ", ".join(qn(field.column) for field in fields)
+    placeholders = ", ".join(["%s"] * len(fields))
+    returning = ", ".join(qn(field.column) for field in opts.concrete_fields)
+
+    sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders}) "
+    if connection.vendor == "postgresql":
+        # 충돌 시에도 행을 잠그고 반환하도록 no-op UPDATE,
+        # xmax가 0이면 이 문장이 새로 삽입한 행
+        sql += (
+            f"ON CONFLICT ({hash_column}) "
+            f"DO UPDATE SET {hash_column} = EXCLUDED.{hash_column} "
+            f"RETURNING {returning}, (xmax = 0) AS inserted"
+        )
+    else:
+        # SQLite 등은 쓰기가 직렬화되므로 충돌 시 승자 행을 따로 조회
+        sql += f"ON CONFLICT ({hash_column}) DO NOTHING RETURNING {returning}"
+    return sql, fields
+
+
+def save_unique_media(media):
+    """
+    hash_value가 설정된 새 Media를 저장하고 (저장된 Media, 생성 여부)를 반환합니다.
+    같은 해시의 행이 이미 있거나 동시 업로드에 졌으면 기존 행을 반환하며,
+    이번 업로드로 올린 오브젝트의 키가 기존 행과 다르면 삭제합니다.
+    """
+    if not media.hash_value:
+        raise ValueError("hash_value가 없는 Media는 중복 확인 저장을 할 수 없습니다.")
+    if media.file and not media.file._committed and media.byte_size is None:
+        # Media.save와 같이 업로드 중인 파일의 헤더에서 메타데이터 추출
+        media.file.seek(0)
+        media.apply_metadata(extract_metadata(media.file, media.file.name))
+
+    using = router.db_for_write(Media, instance=media)
+    connection = connections[using]
+    sql, fields = _upsert_sql(connection)
+    # pre_save에서 auto_now_add 값이 채워지고 커밋되지 않은 파일은 스토리지에 업로드됨
+    params = [
+        field.get_db_prep_save(field.pre_save(media, add=True), connection)
+        for field in fields
+    ]
+    rows = list(Media.objects.db_manager(using).raw(sql, params))
+    if rows:
+        saved = rows[0]
+        created = getattr(saved, "inserted", True)
+    else:
+        saved = Media.objects.using(using).get(hash_value=media.hash_value)
+        created = False
+
+    if created:
+        # raw INSERT는 시그널을 보내지 않으므로 파생 이미지 생성 등을 위해 직접 전송
+        post_save.send(
+            sender=Media,
+            instance=saved,
+            created=True,
+            update_fields=None,
+            raw=False,
+            using=using,
+        )
+        return saved, True
+
+    # 해시 기반 키는 같은 내용이면 같은 키이므로 승자의 파일을 지우지 않도록 비교
+    if media.file.name and media.file.name != saved.file.name:
+        try:
+            media.file.storage.delete(media.file.name)
+        except Exception as e:
+            logger.warning(f"중복 업로드 오브젝트 삭제 실패: {media.file.name} - {e}")
+    return saved, False
@@ -0,0 +1,108 @@
+# uploads/deletion.py
+# 대량 삭제 시 R2 오브젝트를 DeleteObjects(최대 1000개/요청)로 모아서 삭제
+# batch_file_deletes() 블록 안에서는 post_delete 시그널이 파일을 바로 지우지 않고 목록에 모음
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# S3/R2 DeleteObjects 요청 하나에 넣을 수 있는 최대 키 수
+MAX_KEYS_PER_REQUEST = 1000
+
+_pending_deletes = ContextVar("pending_file_deletes", default=None)
+
+
+def defer_file_delete(file):
+    """
+    batch_file_deletes() 블록 안이면 파일을 삭제 목록에 추가하고 True를 반환합니다.
+    블록 밖이면 False를 반환하며 호출한 쪽에서 바로 삭제합니다.
+    """
+    pending = _pending_deletes.get()
+    if pending is None:
+        return False
+    pending.append((file.storage, file.name))
+    return True
+
+
+@contextmanager
+def batch_file_deletes():
+    """
+    블록 안에서 삭제된 Media/파생 이미지의 파일을 블록이 끝난 뒤 한꺼번에 삭제합니다.
+    블록에서 예외가 발생하면 DB 삭제가 완료되지 않았을 수 있으므로 파일은 삭제하지 않습니다.
+    결과 dict에 삭제 수(deleted_count)와 실패한 키별 오류(errors)가 기록됩니다.
+    """
+    pending = []
+    result = {"deleted_count": 0, "errors": {}}
+    token = _pending_deletes.set(pending)
+    try:
+        yield result
+    finally:
+        _pending_deletes.reset(token)
+    deleted_count, errors = delete_files(pending)
+    result.update(deleted_count=deleted_count, errors=errors)
+
+
+def _delete_batch(client, bucket, keys):
+    """DeleteObjects 요청 하나를 보내고 실패한 키별 오류를 반환"""
+    try:
+        response = client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+    except Exception as e:
+        return {key: str(e) for key in keys}
+    return {
+        error["Key"]: f"{error.get('Code')}: {error.get('Message')}"
+        for error in response.get("Errors", [])
+    }
+
+
+def delete_files(files, workers=None):
+    """
+    (storage, name) 목록을 스토리지별로 묶어 DeleteObjects로 병렬 삭제합니다.
+    (삭제 수, {name: 오류 메시지})를 반환합니다.
+    """
+    workers = workers or getattr(settings, "MEDIA_DELETE_CONCURRENCY", 4)
+    names_by_storage = defaultdict(set)
+    storages = {}
+    for storage, name in files:
+        if name:
+            storages[id(storage)] = storage
+            names_by_storage[id(storage)].add(name)
+
+    jobs = []
+    for storage_id, names in names_by_storage.items():
+        storage = storages[storage_id]
+        key_to_name = {storage._normalize_name(name): name for name in names}
+        keys = sorted(key_to_name)
+        for start in range(0, len(keys), MAX_KEYS_PER_REQUEST):
+            jobs.append(
+                (storage, key_to_name, keys[start : start + MAX_KEYS_PER_REQUEST])
+            )
+
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        futures = [
+            (
+                key_to_name,
+                executor.submit(
+                    _delete_batch,
+                    storage.connection.meta.client,
+                    storage.bucket_name,
+                    keys,
+                ),
+            )
+            for storage, key_to_name, keys in jobs
+        ]
+        for key_to_name, future in futures:
+            for key, message in future.result().items():
+                errors[key_to_name.get(key, key)] = message
+
+    for name, message in errors.items():
+        logger.error(f"파일 일괄 삭제 실패: {name} - {message}")
+    total = sum(len(names) for names in names_by_storage.values())
+    return total - len(errors), errors
@@ -0,0 +1,191 @@
+# uploads/direct.py
+# 브라우저가 presigned URL로 R2에 직접 업로드하고 서버는 완료 확인만 하는 업로드 흐름
+# Django 프로세스는 파일 본문을 전혀 중계하지 않음
+import base64
+import logging
+import math
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from .dedup import save_unique_media
+from .keys import unique_name
+from .models import Media
+from .streaming import get_part_size
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "direct-upload:"
+# 시작 후 완료되지 않은 업로드 정보를 보관하는 시간
+UPLOAD_STATE_TIMEOUT = 60 * 60 * 24
+
+# presigned 요청에 서명된 파라미터와 클라이언트가 보내야 하는 헤더의 대응
+SIGNED_HEADERS = {
+    "ContentType": "Content-Type",
+    "CacheControl": "Cache-Control",
+    "ChecksumSHA256": "x-amz-checksum-sha256",
+}
+
+
+def _cache_key(name):
+    return f"{CACHE_KEY_PREFIX}{name}"
+
+
+def _sha256_base64(hash_value):
+    return base64.b64encode(bytes.fromhex(hash_value)).decode()
+
+
+def start_direct_upload(filename, size, hash_value):
+    """
+    임시 업로드 키를 발급하고 presigned URL을 생성합니다.
+    파트 크기 이하는 단일 PUT URL, 그보다 크면 멀티파트 업로드의 파트별 URL을 반환합니다.
+    """
+    storage = Media._meta.get_field("file").storage
+    client = storage.connection.meta.client
+    expires = getattr(settings, "MEDIA_DIRECT_UPLOAD_EXPIRES", 3600)
+    part_size = get_part_size()
+
+    name = unique_name(filename)
+    key = storage._normalize_name(name)
+    # ContentType은 확장자로 결정하고 CacheControl도 함께 서명
+    params = storage._get_write_parameters(key)
+    state = {"size": size, "hash_value": hash_value, "title": filename}
+
+    if size <= part_size:
+        # 단일 PUT: SHA-256 체크섬을 서명에 포함하여 R2가 내용을 검증하도록 함
+        params["ChecksumSHA256"] = _sha256_base64(hash_value)
+        url = client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": storage.bucket_name, "Key": key, **params},
+            ExpiresIn=expires,
+        )
+        result = {
+            "key": name,
+            "url": url,
+            "headers": {
+                header: params[param]
+                for param, header in SIGNED_HEADERS.items()
+                if param in params
+            },
+        }
+    else:
+        upload_id = client.create_multipart_upload(
+            Bucket=storage.bucket_name, Key=key, **params
+        )["UploadId"]
+        part_urls = [
+            client.generate_presigned_url(
+                "upload_part",
+                Params={
+                    "Bucket": storage.bucket_name,
+                    "Key": key,
+                    "UploadId": upload_id,
+                    "PartNumber": part_number,
+                },
+                ExpiresIn=expires,
+            )
+            for part_number in range(1, math.ceil(size / part_size) + 1)
+        ]
+        state["upload_id"] = upload_id
+        result = {
+            "key": name,
+            "upload_id": upload_id,
+            "part_size": part_size,
+            "part_urls": part_urls,
+        }
+
+    cache.set(_cache_key(name), state, timeout=UPLOAD_STATE_TIMEOUT)
+    return result
+
+
+def _abort_multipart_upload(client, bucket, key, upload_id):
+    try:
+        client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+    except ClientError as e:
+        # 이미 완료되었거나 취소된 업로드
+        logger.info(f"멀티파트 업로드 취소 생략: {key} - {e}")
+
+
+def finish_direct_upload(name, parts=None):
+    """
+    직접 업로드를 마무리합니다.
+    parts는 DirectUploadCompleteSerializer로 검증한 [{"ETag", "PartNumber"}] 목록입니다.
+    크기와 해시를 확인하고 기존 해시 중복 처리를 거쳐 Media를 생성하며 (media, created)를 반환합니다.
+    """
+    state = cache.get(_cache_key(name))
+    if not state:
+        raise ValueError("알 수 없거나 만료된 업로드입니다.")
+
+    storage = Media._meta.get_field("file").storage
+    client = storage.connection.meta.client
+    key = storage._normalize_name(name)
+    upload_id = state.get("upload_id")
+
+    if upload_id:
+        try:
+            client.complete_multipart_upload(
+                Bucket=storage.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": sorted(
+                        (
+                            {"ETag": part["ETag"], "PartNumber": part["PartNumber"]}
+                            for part in parts or []
+                        ),
+                        key=lambda part: part["PartNumber"],
+                    )
+                },
+            )
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            # NoSuchUpload는 이전 완료 요청이 성공한 뒤 응답만 유실된 경우일 수 있어
+            # 아래 head_object로 오브젝트가 있는지 확인하고, 그 외 오류는 파트 목록을
+            # 고쳐 다시 완료할 수 있도록 상태를 유지
+            if code != "NoSuchUpload":
+                logger.warning(f"멀티파트 업로드 완료 실패: {name} - {e}")
+                raise ValueError(f"멀티파트 업로드를 완료할 수 없습니다. ({code})")
+
+    try:
+        head = client.head_object(
+            Bucket=storage.bucket_name, Key=key, ChecksumMode="ENABLED"
+        )
+    except ClientError as e:
+        logger.warning(f"업로드된 오브젝트 확인 실패: {name} - {e}")
+        not_found = e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey")
+        if upload_id and not_found:
+            # 완료되지도 남아 있지도 않은 멀티파트 업로드는 다시 완료할 수 없으므로 정리
+            _abort_multipart_upload(client, storage.bucket_name, key, upload_id)
+            cache.delete(_cache_key(name))
+        raise ValueError("업로드된 파일을 찾을 수 없습니다.")
+    # 단일 PUT은 서명된 체크섬으로 검증되며, 멀티파트는 파트 조합 체크섬이므로 별도 검증 필요
+    checksum = head.get("ChecksumSHA256")
+    hash_verified = not upload_id and checksum == _sha256_base64(state["hash_value"])
+    if head["ContentLength"] != state["size"] or (
+        checksum and not upload_id and not hash_verified
+    ):
+        storage.delete(name)
+        cache.delete(_cache_key(name))
+        raise ValueError("업로드된 파일의 크기 또는 해시가 일치하지 않습니다.")
+
+    cache.delete(_cache_key(name))
+
+    media = Media(
+        hash_value=state["hash_value"],
+        title=state["title"],
+        content_type=head.get("ContentType", ""),
+        byte_size=head["ContentLength"],
+    )
+    media.file.name = name
+    # 같은 해시의 행이 이미 있거나 동시 업로드에 졌으면 기존 행을 받고,
+    # 이번에 올린 오브젝트(name)는 save_unique_media가 삭제함
+    media, created = save_unique_media(media)
+    if not created:
+        return media, False
+
+    from .tasks import extract_media_metadata_async, verify_media_hash_async
+
+    # 가로/세로, 영상 길이는 Range GET으로 필요한 부분만 읽어 백그라운드에서 추출
+    transaction.on_commit(lambda: extract_media_metadata_async.delay(media.id))
+    if not hash_verified:
+        transaction.on_commit(lambda: verify_media_hash_async.delay(media.id))
+    return media, True
@@ -0,0 +1,130 @@
+# uploads/extractors.py
+# CKEditor HTML에서 미디어 참조를 추출하는 모듈
+# src, href, srcset, data-* 등 속성 값의 URL을 MEDIA_PUBLIC_DOMAIN 기준으로 정규화하여 저장 키로 변환
+import html
+import re
+from functools import lru_cache
+from urllib.parse import unquote, urlsplit
+from django.conf import settings
+
+MEDIA_PREFIX = "/media/"
+
+# 태그 속성 값 (큰따옴표, 작은따옴표, 따옴표 없는 값)
+# 속성 이름이 아닌 "="부터 매칭하면 정규식 엔진이 리터럴 검색으로 빠르게 건너뛸 수 있음
+ATTRIBUTE_VALUE_PATTERN = re.compile(r"""=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))""")
+
+# [scheme:][//host]/media/<저장 키>[?쿼리][#프래그먼트]
+MEDIA_URL_PATTERN = re.compile(
+    r"(?:[a-zA-Z][a-zA-Z0-9+.-]*:)?(?://(?P<host>[^/?#]*))?/media/(?P<path>[^?#]*)"
+)
+
+# srcset 후보("url 640w, url 2x")의 구분자
+SRCSET_SEPARATOR = re.compile(r",\s+|,(?=\S+\s)")
+
+# 속성 값 안의 URL 후보 토큰 (공백과 srcset 구분 쉼표로 나뉨)
+URL_TOKEN_PATTERN = re.compile(r"[^\s,]+(?:,[^\s,]+)*")
+
+
+@lru_cache(maxsize=None)
+def get_media_hosts():
+    """미디어 URL로 인정하는 호스트 (MEDIA_PUBLIC_DOMAIN)"""
+    domain = getattr(settings, "MEDIA_PUBLIC_DOMAIN", "") or ""
+    host = urlsplit(domain if "//" in domain else f"//{domain}").netloc.lower()
+    return frozenset({host} if host else set())
+
+
+def normalize_media_url(url):
+    """
+    URL을 미디어 저장 키로 변환합니다.
+    MEDIA_PUBLIC_DOMAIN 또는 상대 경로의 /media/ URL만 인정하며
+    MediaStorage.url이 붙이는 ?v= 쿼리와 프래그먼트는 제거합니다.
+    """
+    url = url.strip()
+    if "&" in url:
+        url = html.unescape(url)
+    # urlsplit보다 빠른 사전 컴파일 패턴으로 호스트와 경로만 분리
+    match = MEDIA_URL_PATTERN.match(url)
+    if not match:
+        return None
+    host = match.group("host")
+    if host is not None and host.lower() not in get_media_hosts():
+        return None
+    name = match.group("path")
+    if "%" in name:
+        name = unquote(name)
+    return name or None
+
+
+def _iter_attribute_urls(content):
+    """
+    /media/를 포함하는 속성 값의 URL을 반환합니다.
+    src, href, poster, data-* 등은 값 전체를, srcset은 후보별 URL을 반환합니다.
+    """
+    for match in ATTRIBUTE_VALUE_PATTERN.finditer(content):
+        value = match.group(1) or match.group(2) or match.group(3)
+        if not value or MEDIA_PREFIX not in value:
+            continue
+        if "," in value:
+            # srcset 후보("url 640w, url 1024w")는 각 후보의 첫 토큰이 URL
+            for candidate in SRCSET_SEPARATOR.split(value.strip()):
+                if candidate.strip():
+                    yield candidate.split()[0]
+        else:
+            yield value
+
+
+def extract_media_names(content):
+    """HTML 콘텐츠가 참조하는 미디어 저장 키 집합"""
+    if not content or MEDIA_PREFIX not in content:
+        return set()
+    names = set()
+    for url in _iter_attribute_urls(content):
+        name = normalize_media_url(url)
+        if name:
+            names.add(name)
+    return names
+
+
+def replace_media_names(content, replacements):
+    """
+    속성 값의 미디어 URL 중 저장 키가 replacements({기존 키: 새 키})와 정확히 일치하는 것만
+    새 키로 바꿉니다. 추출과 같은 기준으로 키를 판단하므로 a.jpg가 a.jpg.webp 같은
+    더 긴 키의 일부로 치환되지 않으며, 스킴/호스트와 프래그먼트는 유지하고 ?v= 쿼리는 제거합니다.
+    """
+    if not content or not replacements or MEDIA_PREFIX not in content:
+        return content
+
+    def replace_url(match):
+        url = match.group(0)
+        new_name = replacements.get(normalize_media_url(url))
+        url_match = MEDIA_URL_PATTERN.match(url) if new_name else None
+        if not url_match:
+            return url
+        fragment = url[url.index("#") :] if "#" in url else ""
+        return f"{url[: url_match.start('path')]}{new_name}{fragment}"
+
+    def replace_value(match):
+        group = match.lastindex
+        value = match.group(group)
+        if MEDIA_PREFIX not in value:
+            return match.group(0)
+        whole = match.group(0)
+        start = match.start(group) - match.start()
+        end = match.end(group) - match.start()
+        return whole[:start] + URL_TOKEN_PATTERN.sub(replace_url, value) + whole[end:]
+
+    return ATTRIBUTE_VALUE_PATTERN.sub(replace_value, content)
+
+
+def iter_content_media_names(model, field_name, batch_size=2000):
+    """
+    모델(번역 테이블 포함)의 HTML 필드를 인스턴스 생성 없이 스트리밍으로 읽어
+    행마다 (pk, 저장 키 집합)을 반환합니다.
+    """
+    rows = (
+        model.objects.filter(**{f"{field_name}__contains": MEDIA_PREFIX})
+        .values_list("pk", field_name)
+        .iterator(chunk_size=batch_size)
+    )
+    for pk, content in rows:
+        yield pk, extract_media_names(content)
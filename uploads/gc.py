@@ -0,0 +1,116 @@
+# uploads/gc.py
+# 미사용 미디어 정리(GC) 워크플로의 진행 상황 관리
+# 진행 상황은 실행 id(run_id)를 키로 Celery 결과 백엔드에 저장하여 관리자 화면에서 조회하고,
+# 중단된 실행은 마지막으로 완료된 삭제 청크 다음부터 재개함
+# 한 번에 하나의 실행만 진행되도록 실행 잠금을 두고, 진행 상황을 기록할 때마다 연장함
+import uuid
+from celery import current_app
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+LAST_RUN_CACHE_KEY = "media-gc:last-run"
+SCANNED_CACHE_KEY = "media-gc:{run_id}:scanned"
+LOCK_CACHE_KEY = "media-gc:lock"
+
+STAGE_SCAN = "scan"
+STAGE_SWEEP = "sweep"
+STAGE_DONE = "done"
+
+
+def new_run_id():
+    return uuid.uuid4().hex
+
+
+def get_last_run_id():
+    return cache.get(LAST_RUN_CACHE_KEY)
+
+
+def _get_lock_timeout():
+    # 진행 기록 없이 이 시간이 지나면 워커가 중단된 것으로 보고 잠금이 풀려 재개 가능
+    return getattr(settings, "MEDIA_GC_LOCK_TIMEOUT", 60 * 60)
+
+
+def acquire_run_lock(run_id):
+    """실행 잠금을 얻으면 True, 다른 실행이 진행 중이면 False"""
+    return cache.add(LOCK_CACHE_KEY, run_id, timeout=_get_lock_timeout())
+
+
+def get_locked_run_id():
+    return cache.get(LOCK_CACHE_KEY)
+
+
+def refresh_run_lock(run_id):
+    if cache.get(LOCK_CACHE_KEY) == run_id:
+        cache.touch(LOCK_CACHE_KEY, timeout=_get_lock_timeout())
+
+
+def release_run_lock(run_id):
+    if cache.get(LOCK_CACHE_KEY) == run_id:
+        cache.delete(LOCK_CACHE_KEY)
+
+
+def get_progress(run_id):
+    """결과 백엔드에 저장된 진행 상황 (없으면 None)"""
+    if not run_id:
+        return None
+    result = current_app.AsyncResult(run_id)
+    if not isinstance(result.info, dict):
+        return None
+    progress = dict(result.info)
+    if progress.get("stage") == STAGE_SCAN:
+        # 모델별 스캔 태스크는 병렬로 끝나므로 완료 수는 캐시 카운터로 집계
+        key = SCANNED_CACHE_KEY.format(run_id=run_id)
+        progress["models_scanned"] = cache.get(key, 0)
+    return progress
+
+
+def store_progress(run_id, **values):
+    """진행 상황을 갱신하여 결과 백엔드에 저장하고 갱신된 값을 반환"""
+    progress = get_progress(run_id) or {"run_id": run_id}
+    progress.update(values, updated_at=timezone.now().isoformat())
+    state = "SUCCESS" if progress.get("stage") == STAGE_DONE else "PROGRESS"
+    current_app.backend.store_result(run_id, progress, state)
+    cache.set(LAST_RUN_CACHE_KEY, run_id, timeout=None)
+    refresh_run_lock(run_id)
+    return progress
+
+
+def mark_model_scanned(run_id):
+    key = SCANNED_CACHE_KEY.format(run_id=run_id)
+    cache.add(key, 0, timeout=60 * 60 * 24)
+    cache.incr(key)
+    refresh_run_lock(run_id)
+
+
+def reset_scanned(run_id):
+    """스캔 단계를 다시 시작할 때 이전 시도의 모델 완료 수를 지움"""
+    cache.delete(SCANNED_CACHE_KEY.format(run_id=run_id))
+
+
+def format_progress(progress):
+    """관리자 메시지용 진행 상황 요약"""
+    if not progress:
+        return "실행 기록이 없습니다."
+    stage = progress.get("stage")
+    if stage == STAGE_SCAN:
+        detail = (
+            f"참조 스캔 중 ({progress.get('models_scanned', 0)}/"
+            f"{progress.get('models_total', 0)}개 모델)"
+        )
+    elif stage == STAGE_SWEEP:
+        detail = (
+            f"삭제 중 ({progress.get('chunks_done', 0)}/"
+            f"{progress.get('chunks_total', 0)}개 청크, "
+            f"{progress.get('deleted_count', 0)}개 삭제)"
+        )
+    else:
+        detail = (
+            f"완료 (사용 여부 {progress.get('updated_count', 0)}개 갱신, "
+            f"{progress.get('deleted_count', 0)}개 삭제)"
+        )
+    if progress.get("file_error_count"):
+        detail += f", 파일 삭제 실패 {progress['file_error_count']}개"
+    if progress.get("error"):
+        detail += f", 실패: {progress['error']}"
+    return f"[{progress['run_id'][:8]}] {detail} - 마지막 갱신 {progress['updated_at']}"
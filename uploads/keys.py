@@ -0,0 +1,53 @@
+# uploads/keys.py
+# 미디어 저장 키(R2 오브젝트 키) 형식 정의
+# 파일 내용의 SHA-256 해시로 키를 만들어 같은 키는 항상 같은 내용을 가리키도록 함
+import re
+import uuid
+
+# 해시 기반 키 형식: ab/cd/<sha256>.<ext>
+# 파생 이미지(렌디션)는 원본 옆에 ab/cd/<sha256>.w<폭>.<ext> 형식으로 저장
+CONTENT_ADDRESSED_PATTERN = re.compile(
+    r"^(?P<a>[0-9a-f]{2})/(?P<b>[0-9a-f]{2})/(?P<hash>[0-9a-f]{64})"
+    r"(\.w[0-9]+)?(\.[0-9a-z]+)?$"
+)
+
+# 업로드가 끝나야 해시를 알 수 있는 경우(스트리밍 업로드)의 키 형식: u/<uuid>.<ext>
+UNIQUE_PATTERN = re.compile(r"^u/[0-9a-f]{32}(\.w[0-9]+)?(\.[0-9a-z]+)?$")
+
+
+def _extension(filename):
+    return filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+
+
+def content_addressed_name(hash_value, filename):
+    """SHA-256 해시값과 원본 확장자로 변하지 않는 저장 키 생성"""
+    ext = _extension(filename)
+    suffix = f".{ext}" if ext else ""
+    return f"{hash_value[:2]}/{hash_value[2:4]}/{hash_value}{suffix}"
+
+
+def unique_name(filename):
+    """해시를 미리 알 수 없는 업로드용 고유 키 생성 (한 번 쓰면 덮어쓰지 않음)"""
+    ext = _extension(filename)
+    suffix = f".{ext}" if ext else ""
+    return f"u/{uuid.uuid4().hex}{suffix}"
+
+
+def rendition_name(name, width, ext):
+    """원본 키 옆에 놓일 파생 이미지 키 생성 (ab/cd/<hash>.w640.webp)"""
+    stem = name.rsplit(".", 1)[0] if "." in name.rsplit("/", 1)[-1] else name
+    return f"{stem}.w{width}.{ext}"
+
+
+def is_content_addressed(name):
+    """저장 키가 해시 기반(내용이 바뀌지 않는) 형식인지 확인"""
+    match = CONTENT_ADDRESSED_PATTERN.match(name or "")
+    return bool(
+        match
+        and match.group("hash").startswith(match.group("a") + match.group("b"))
+    )
+
+
+def is_immutable(name):
+    """같은 키에 다른 내용이 저장되지 않는 형식(해시 기반 또는 고유 키)인지 확인"""
+    return is_content_addressed(name) or bool(UNIQUE_PATTERN.match(name or ""))
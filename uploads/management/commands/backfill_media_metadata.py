@@ -0,0 +1,77 @@
+# uploads/management/commands/backfill_media_metadata.py
+# 메타데이터가 없는 기존 Media에 가로/세로, MIME 타입, 바이트 크기, 영상 길이를 채우는 명령
+# 오브젝트 전체를 내려받지 않고 Range GET으로 헤더/moov 부분만 병렬로 읽음
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from uploads.metadata import extract_remote_metadata
+from uploads.models import Media
+from uploads.signals import notify_media_changed
+
+logger = logging.getLogger(__name__)
+
+METADATA_FIELDS = ["content_type", "byte_size", "width", "height", "duration"]
+
+
+class Command(BaseCommand):
+    help = (
+        "메타데이터가 비어 있는 Media의 오브젝트를 Range GET으로 부분만 읽어 "
+        "가로/세로, MIME 타입, 바이트 크기, 영상 길이를 채웁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=8, help="동시에 읽을 오브젝트 수"
+        )
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="이미 메타데이터가 있는 항목도 다시 추출합니다.",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Media.objects.order_by("id")
+        if not options["force"]:
+            queryset = queryset.filter(byte_size__isnull=True)
+
+        batch_size = options["batch_size"]
+        updated = failed = 0
+        batch = []
+        with ThreadPoolExecutor(max_workers=max(options["workers"], 1)) as executor:
+            for media in queryset.iterator(chunk_size=batch_size):
+                batch.append(media)
+                if len(batch) >= batch_size:
+                    done, errors = self._process_batch(executor, batch)
+                    updated, failed = updated + done, failed + errors
+                    batch = []
+            if batch:
+                done, errors = self._process_batch(executor, batch)
+                updated, failed = updated + done, failed + errors
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 메타데이터 갱신, {failed}개 실패")
+        )
+
+    def _process_batch(self, executor, batch):
+        """배치의 오브젝트를 병렬로 읽고 DB 갱신은 bulk_update 한 번으로 처리"""
+        results = executor.map(self._extract, batch)
+        updated = []
+        for media, metadata in zip(batch, results):
+            if metadata is None:
+                continue
+            media.apply_metadata(metadata)
+            updated.append(media)
+        # save()를 거치지 않으므로 해시 재계산이나 시그널 없이 컬럼만 갱신
+        Media.objects.bulk_update(updated, METADATA_FIELDS)
+        # 크기 등이 응답에 포함되므로 참조하는 콘텐츠의 캐시 무효화는 배치마다 한 번 알림
+        notify_media_changed(*(media.pk for media in updated))
+        self.stdout.write(f"{len(updated)}/{len(batch)}개 처리")
+        return len(updated), len(batch) - len(updated)
+
+    def _extract(self, media):
+        try:
+            return extract_remote_metadata(media)
+        except Exception as e:
+            logger.error(f"메타데이터 추출 실패: {media.file.name} - {e}")
+            return None
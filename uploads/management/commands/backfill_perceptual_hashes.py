@@ -0,0 +1,70 @@
+# uploads/management/commands/backfill_perceptual_hashes.py
+# 지각 해시가 없는 기존 이미지 Media에 dHash를 채우는 명령
+# 원본 대신 가장 작은 파생 이미지를 내려받아 병렬로 계산
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from uploads.models import Media
+from uploads.renditions import IMAGE_EXTENSIONS
+from uploads.similarity import dhash, open_hash_source
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "지각 해시가 비어 있는 이미지 Media의 dHash를 계산하여 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=8, help="동시에 읽을 이미지 수"
+        )
+        parser.add_argument("--batch-size", type=int, default=200)
+
+    def handle(self, *args, **options):
+        is_image = Q()
+        for ext in IMAGE_EXTENSIONS:
+            is_image |= Q(file__iendswith=f".{ext}")
+        queryset = (
+            Media.objects.filter(is_image, perceptual_hash="")
+            .prefetch_related("renditions")
+            .order_by("id")
+        )
+
+        batch_size = options["batch_size"]
+        updated = failed = 0
+        batch = []
+        with ThreadPoolExecutor(max_workers=max(options["workers"], 1)) as executor:
+            for media in queryset.iterator(chunk_size=batch_size):
+                batch.append(media)
+                if len(batch) >= batch_size:
+                    done, errors = self._process_batch(executor, batch)
+                    updated, failed = updated + done, failed + errors
+                    batch = []
+            if batch:
+                done, errors = self._process_batch(executor, batch)
+                updated, failed = updated + done, failed + errors
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 지각 해시 계산, {failed}개 실패")
+        )
+
+    def _process_batch(self, executor, batch):
+        """배치의 이미지를 병렬로 읽고 DB 갱신은 bulk_update 한 번으로 처리"""
+        results = executor.map(self._hash, batch)
+        updated = []
+        for media, value in zip(batch, results):
+            if value is None:
+                continue
+            media.perceptual_hash = value
+            updated.append(media)
+        Media.objects.bulk_update(updated, ["perceptual_hash"])
+        self.stdout.write(f"{len(updated)}/{len(batch)}개 처리")
+        return len(updated), len(batch) - len(updated)
+
+    def _hash(self, media):
+        try:
+            return dhash(open_hash_source(media))
+        except Exception as e:
+            logger.error(f"지각 해시 계산 실패: {media.file.name} - {e}")
+            return None
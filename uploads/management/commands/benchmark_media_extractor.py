@@ -0,0 +1,81 @@
+# uploads/management/commands/benchmark_media_extractor.py
+# 생성한 대용량 HTML 코퍼스로 미디어 참조 추출기의 처리량과 추출 결과를 비교하는 마이크로 벤치마크
+#   python manage.py benchmark_media_extractor --documents 5000 --size-kb 20
+import random
+import re
+import time
+from urllib.parse import urlparse
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from uploads.extractors import extract_media_names
+
+FILLER = (
+    "<p>고양이 사건 기록의 본문 예시입니다. <strong>강조</strong>와 "
+    '<a href="https://example.com/page">외부 링크</a>를 포함합니다.</p>'
+)
+
+
+class Command(BaseCommand):
+    help = "기존 src 전용 정규식과 추출기 모듈의 HTML 처리량을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--documents", type=int, default=5000)
+        parser.add_argument("--size-kb", type=int, default=20, help="문서당 크기 (KB)")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        domain = settings.MEDIA_PUBLIC_DOMAIN
+        corpus = [
+            self._document(rng, domain, options["size_kb"] * 1024)
+            for _ in range(options["documents"])
+        ]
+        total_mb = sum(len(doc) for doc in corpus) / 1024 / 1024
+
+        for label, extract in (
+            ("기존 src 정규식", self._legacy_extract),
+            ("추출기 모듈", extract_media_names),
+        ):
+            started = time.perf_counter()
+            found = set()
+            for doc in corpus:
+                found.update(extract(doc))
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"{label:>12}: {total_mb / elapsed:8.1f} MB/s, "
+                f"{elapsed * 1000 / len(corpus):6.3f} ms/문서, 참조 {len(found)}개"
+            )
+
+    @staticmethod
+    def _legacy_extract(content):
+        """기존 update_media_usage의 추출 방식 (루프 안에서 컴파일, src만 인식)"""
+        paths = set()
+        url_pattern = re.compile(r'src=["\']([^"\']+)["\']')
+        for url in url_pattern.findall(content):
+            paths.add(urlparse(url).path)
+        return paths
+
+    @staticmethod
+    def _document(rng, domain, size):
+        """img src, srcset, PDF href, data-* 속성이 섞인 HTML 문서 생성"""
+        parts = []
+        length = 0
+        while length < size:
+            digest = f"{rng.getrandbits(256):064x}"
+            key = f"{digest[:2]}/{digest[2:4]}/{digest}"
+            choice = rng.random()
+            if choice < 0.4:
+                parts.append(FILLER)
+            elif choice < 0.6:
+                parts.append(f'<img src="{domain}/media/{key}.jpg?v=1a2b3c4d">')
+            elif choice < 0.75:
+                parts.append(
+                    f'<img srcset="{domain}/media/{key}.w640.webp 640w, '
+                    f'{domain}/media/{key}.w1024.webp 1024w">'
+                )
+            elif choice < 0.9:
+                parts.append(f'<a href="{domain}/media/{key}.pdf">첨부 파일</a>')
+            else:
+                parts.append(f"<figure data-full-src='/media/{key}.png'></figure>")
+            length += len(parts[-1])
+        return "".join(parts)
@@ -0,0 +1,165 @@
+# uploads/management/commands/benchmark_media_upload.py
+# 로컬 S3 호환 서버(moto server, MinIO)를 대상으로 업로드 방식별 성능을 비교하는 벤치마크
+#   moto_server -p 5000 &
+#   python manage.py benchmark_media_upload --endpoint-url http://localhost:5000
+#   python manage.py benchmark_media_upload --endpoint-url http://localhost:5000 \
+#       --multipart --sizes 100 1024 --concurrency 1 4 8
+import io
+import os
+import time
+import uuid
+import boto3
+from django.core.management.base import BaseCommand
+from uploads.multipart import multipart_upload
+from uploads.storages import get_cache_control
+from uploads.streaming import get_part_size
+
+CONTENT_TYPE = "image/jpeg"
+
+
+class Command(BaseCommand):
+    help = (
+        "업로드 후 copy_object 방식과 단일 요청 방식의 요청 수와 소요 시간을 비교합니다. "
+        "--multipart 옵션으로 멀티파트 업로드의 동시성별 처리량을 측정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--endpoint-url", required=True)
+        parser.add_argument("--bucket", default="media-benchmark")
+        parser.add_argument("--access-key", default="test")
+        parser.add_argument("--secret-key", default="test")
+        parser.add_argument("--size", type=int, default=5, help="파일 크기 (MB)")
+        parser.add_argument("--iterations", type=int, default=10)
+        parser.add_argument(
+            "--multipart",
+            action="store_true",
+            help="멀티파트 업로드 처리량 벤치마크를 실행합니다.",
+        )
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[100, 1024],
+            help="멀티파트 벤치마크 파일 크기 목록 (MB)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=[1, 4, 8],
+            help="멀티파트 벤치마크 동시 전송 파트 수 목록",
+        )
+
+    def handle(self, *args, **options):
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=options["endpoint_url"],
+            aws_access_key_id=options["access_key"],
+            aws_secret_access_key=options["secret_key"],
+            region_name="us-east-1",
+        )
+        self.bucket = options["bucket"]
+        self._ensure_bucket()
+
+        # 요청 수 집계
+        self.request_count = 0
+        self.client.meta.events.register("before-send.s3.*", self._count_request)
+
+        if options["multipart"]:
+            self._benchmark_multipart(options["sizes"], options["concurrency"])
+            return
+
+        payload = os.urandom(options["size"] * 1024 * 1024)
+        cache_control = get_cache_control(CONTENT_TYPE)
+
+        modes = {
+            "put + copy_object": self._upload_then_copy,
+            "single put": self._upload_with_metadata,
+        }
+        for label, upload in modes.items():
+            self.request_count = 0
+            started = time.perf_counter()
+            for _ in range(options["iterations"]):
+                key = f"benchmark/{uuid.uuid4().hex}.jpg"
+                upload(key, payload, cache_control)
+                self._verify(key, cache_control)
+            elapsed = time.perf_counter() - started
+            # 검증용 head_object 요청은 제외
+            requests_per_upload = self.request_count / options["iterations"] - 1
+            self.stdout.write(
+                f"{label:>20}: {elapsed / options['iterations'] * 1000:8.1f} ms/업로드, "
+                f"{requests_per_upload:.1f} 요청/업로드"
+            )
+
+    def _benchmark_multipart(self, sizes, concurrencies):
+        """파일 크기와 동시성별 멀티파트 업로드 처리량 측정"""
+        part_size = get_part_size()
+        # 같은 무작위 블록을 반복 전송하여 벤치마크 자체의 메모리 사용을 제한
+        block = os.urandom(part_size)
+        for size_mb in sizes:
+            total = size_mb * 1024 * 1024
+            for concurrency in concurrencies:
+                key = f"benchmark/{uuid.uuid4().hex}.mp4"
+                started = time.perf_counter()
+                multipart_upload(
+                    self.client,
+                    self.bucket,
+                    key,
+                    self._iter_parts(block, total),
+                    params={"ContentType": "video/mp4"},
+                    concurrency=concurrency,
+                )
+                elapsed = time.perf_counter() - started
+                self.client.delete_object(Bucket=self.bucket, Key=key)
+                self.stdout.write(
+                    f"{size_mb:>6} MB, 동시성 {concurrency:>2}: {elapsed:7.2f} s, "
+                    f"{size_mb / elapsed:8.1f} MB/s"
+                )
+
+    @staticmethod
+    def _iter_parts(block, total):
+        sent = 0
+        while sent < total:
+            part = block[: min(len(block), total - sent)]
+            sent += len(part)
+            yield part
+
+    def _count_request(self, **kwargs):
+        self.request_count += 1
+
+    def _ensure_bucket(self):
+        try:
+            self.client.head_bucket(Bucket=self.bucket)
+        except Exception:
+            self.client.create_bucket(Bucket=self.bucket)
+
+    def _upload_then_copy(self, key, payload, cache_control):
+        """기존 방식: 업로드 후 메타데이터 교체를 위해 copy_object 재호출"""
+        self.client.upload_fileobj(
+            io.BytesIO(payload),
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": CONTENT_TYPE},
+        )
+        self.client.copy_object(
+            CopySource={"Bucket": self.bucket, "Key": key},
+            Bucket=self.bucket,
+            Key=key,
+            MetadataDirective="REPLACE",
+            ContentType=CONTENT_TYPE,
+            CacheControl=cache_control,
+        )
+
+    def _upload_with_metadata(self, key, payload, cache_control):
+        """현재 방식: 최초 업로드 요청에 ContentType/CacheControl 포함"""
+        self.client.upload_fileobj(
+            io.BytesIO(payload),
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": CONTENT_TYPE, "CacheControl": cache_control},
+        )
+
+    def _verify(self, key, cache_control):
+        head = self.client.head_object(Bucket=self.bucket, Key=key)
+        if head.get("CacheControl") != cache_control:
+            raise AssertionError(f"CacheControl 불일치: {key}")
@@ -0,0 +1,90 @@
+# uploads/management/commands/benchmark_media_usage.py
+# 집합 연산 기반 미디어 사용 여부 계산(scan_media_usage)의 규모별 소요 시간과 쿼리 수 측정
+# 가상의 Media/News 행을 트랜잭션 안에서 생성하고 측정 후 롤백하므로 기존 데이터는 바뀌지 않음
+#   python manage.py benchmark_media_usage --sizes 10000 100000 1000000
+import datetime
+import uuid
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from homepage.models.news_models import News
+from uploads.models import Media
+from uploads.references import get_reference_fields, get_reference_models
+from uploads.usage import scan_media_usage
+
+BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = "미디어 행 수별로 전체 콘텐츠 스캔 방식의 사용 여부 계산 성능을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[10000, 100000, 1000000],
+            help="생성할 Media 행 수 목록",
+        )
+        parser.add_argument(
+            "--reference-ratio",
+            type=float,
+            default=0.3,
+            help="콘텐츠에서 참조되는 Media 비율 (절반은 FK, 절반은 HTML 경로)",
+        )
+
+    def handle(self, *args, **options):
+        # 기존 방식은 Media 한 행마다 FK/M2M 필드 수만큼 exists() 쿼리를 실행
+        relation_fields = sum(
+            len(get_reference_fields(model)[0]) + len(get_reference_fields(model)[1])
+            for model in get_reference_models()
+        )
+        for size in options["sizes"]:
+            with transaction.atomic():
+                self._populate(size, options["reference_ratio"])
+                stats = scan_media_usage()
+                transaction.set_rollback(True)
+
+            self.stdout.write(
+                f"{size:>9} 행: 스캔 {stats['scan_seconds']:7.2f} s, "
+                f"갱신 {stats['update_seconds']:7.2f} s, "
+                f"쿼리 {stats['queries']:>5}개 (기존 방식 약 {size * relation_fields}개), "
+                f"사용 중 {stats['referenced_count']}개"
+            )
+
+    def _populate(self, size, ratio):
+        """size개의 Media와 그중 ratio 비율을 참조하는 News(FK + 본문 HTML) 생성"""
+        prefix = uuid.uuid4().hex[:8]
+        media_ids = []
+        for start in range(0, size, BATCH_SIZE):
+            batch = [
+                Media(
+                    file=f"benchmark/{prefix}/{i:07d}.jpg",
+                    hash_value=f"{prefix}{i:056x}",
+                    title=f"{i}",
+                )
+                for i in range(start, min(start + BATCH_SIZE, size))
+            ]
+            media_ids.extend(m.id for m in Media.objects.bulk_create(batch))
+
+        translation_model = News._parler_meta.root_model
+        today = datetime.date.today()
+        news_count = int(size * ratio / 2)
+        for start in range(0, news_count, BATCH_SIZE):
+            indexes = range(start, min(start + BATCH_SIZE, news_count))
+            news = News.objects.bulk_create(
+                [News(date=today, main_image_id=media_ids[2 * i]) for i in indexes]
+            )
+            translation_model.objects.bulk_create(
+                [
+                    translation_model(
+                        master_id=item.id,
+                        language_code="ko",
+                        title=f"benchmark {i}",
+                        content=(
+                            f'<p>본문</p><img src="/media/benchmark/{prefix}/'
+                            f'{2 * i + 1:07d}.jpg?v=deadbeef"><p>끝</p>'
+                        ),
+                    )
+                    for i, item in zip(indexes, news)
+                ]
+            )
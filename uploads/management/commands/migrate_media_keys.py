@@ -0,0 +1,117 @@
+# uploads/management/commands/migrate_media_keys.py
+# 기존 날짜 기반 미디어 키(YYYY/MM/DD-HHMMSS.ext)를 해시 기반 키로 이전하는 명령
+import logging
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from uploads.keys import content_addressed_name, is_immutable
+from uploads.models import Media
+from uploads.signals import notify_media_changed
+from uploads.utils import rewrite_media_references
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "기존 미디어 파일을 해시 기반 키(media/ab/cd/<hash>.<ext>)로 서버 측 복사하고 "
+        "Media.file 및 CKEditor 콘텐츠의 경로를 갱신합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="실제 복사/갱신 없이 이전 대상만 출력합니다.",
+        )
+        parser.add_argument(
+            "--delete-old",
+            action="store_true",
+            help="이전이 끝난 뒤 기존 키의 오브젝트를 삭제합니다.",
+        )
+        parser.add_argument("--batch-size", type=int, default=200)
+
+    def update_media(self, storage, media, new_name, hash_value):
+        """
+        복사한 새 키로 Media 행을 갱신합니다.
+        갱신에 실패하면 다른 Media가 쓰지 않는 한 새 키를 삭제해 고아 오브젝트를 남기지 않습니다.
+        """
+        try:
+            with transaction.atomic():
+                updated = Media.objects.filter(pk=media.pk).update(
+                    file=new_name, hash_value=hash_value
+                )
+                if not updated:
+                    raise Media.DoesNotExist(f"Media {media.pk}가 삭제되었습니다.")
+        except Exception:
+            if not Media.objects.filter(file=new_name).exists():
+                storage.delete(new_name)
+            raise
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        storage = Media._meta.get_field("file").storage
+        client = storage.connection.meta.client
+
+        renamed = {}
+        renamed_ids = []
+        failed = 0
+        queryset = Media.objects.order_by("id").iterator(
+            chunk_size=options["batch_size"]
+        )
+        for media in queryset:
+            old_name = media.file.name
+            if not old_name or is_immutable(old_name):
+                continue
+
+            try:
+                # 해시값이 없는 이전 데이터는 스토리지에서 읽어 계산
+                hash_value = media.hash_value or Media.calculate_file_hash(media.file)
+                new_name = content_addressed_name(hash_value, old_name)
+                self.stdout.write(f"{old_name} -> {new_name}")
+                if not dry_run:
+                    client.copy_object(
+                        CopySource={
+                            "Bucket": storage.bucket_name,
+                            "Key": storage._normalize_name(old_name),
+                        },
+                        Bucket=storage.bucket_name,
+                        Key=storage._normalize_name(new_name),
+                        MetadataDirective="COPY",
+                    )
+                    self.update_media(storage, media, new_name, hash_value)
+                renamed[old_name] = new_name
+                renamed_ids.append(media.pk)
+            except Exception as e:
+                failed += 1
+                logger.error(f"미디어 키 이전 실패: {old_name} - {e}")
+                self.stderr.write(f"실패: {old_name} - {e}")
+
+        if dry_run:
+            self.stdout.write(f"이전 대상 {len(renamed)}개 (dry-run)")
+            return
+
+        deleted = []
+
+        def delete_old_objects():
+            for old_name in renamed:
+                try:
+                    storage.delete(old_name)
+                    deleted.append(old_name)
+                except Exception as e:
+                    logger.error(f"기존 오브젝트 삭제 실패: {old_name} - {e}")
+
+        with transaction.atomic():
+            rewritten_count = rewrite_media_references(renamed)
+            # update()는 시그널을 보내지 않으므로 참조하는 콘텐츠의 캐시 무효화를 직접 알림
+            notify_media_changed(*renamed_ids)
+            # 기존 키는 Media.file과 콘텐츠 갱신이 커밋된 뒤에만 삭제
+            if options["delete_old"]:
+                transaction.on_commit(delete_old_objects)
+        deleted_count = len(deleted)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(renamed)}개 이전, 콘텐츠 {rewritten_count}개 갱신, "
+                f"기존 오브젝트 {deleted_count}개 삭제, {failed}개 실패"
+            )
+        )
@@ -0,0 +1,22 @@
+# uploads/management/commands/rebuild_media_references.py
+# 미디어 참조 색인(MediaReference)을 전체 콘텐츠 기준으로 다시 만드는 명령
+# 색인 도입 직후나 시그널을 거치지 않은 대량 변경 후에 실행
+from django.core.management.base import BaseCommand
+from uploads.models import MediaReference
+from uploads.references import rebuild_media_references
+
+
+class Command(BaseCommand):
+    help = "모든 콘텐츠를 다시 읽어 미디어 참조 색인과 사용 여부를 재구성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        synced_count = rebuild_media_references(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{synced_count}개 객체 색인, "
+                f"참조 {MediaReference.objects.count()}개 기록"
+            )
+        )
@@ -0,0 +1,40 @@
+# uploads/management/commands/reconcile_media_storage.py
+# R2 버킷의 media/ 오브젝트 중 Media/파생 이미지 행이 없는 고아 오브젝트를 보고하거나 삭제하는 명령
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from uploads.reconcile import reconcile_storage
+
+
+class Command(BaseCommand):
+    help = (
+        "버킷의 미디어 오브젝트와 데이터베이스를 대조하여 고아 오브젝트를 보고합니다. "
+        "--delete 옵션을 주면 유예 기간이 지난 고아 오브젝트를 삭제합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--delete",
+            action="store_true",
+            help="유예 기간이 지난 고아 오브젝트를 삭제합니다.",
+        )
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=None,
+            help="업로드 후 이 시간이 지나지 않은 오브젝트는 제외 (기본: 설정값)",
+        )
+
+    def handle(self, *args, **options):
+        grace = None
+        if options["grace_hours"] is not None:
+            grace = timedelta(hours=options["grace_hours"])
+        stats = reconcile_storage(delete=options["delete"], grace=grace)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"오브젝트 {stats['scanned_count']}개 확인: "
+                f"고아 {stats['orphan_count']}개 "
+                f"(유예 기간 내 {stats['recent_orphan_count']}개 제외), "
+                f"삭제 {stats['deleted_count']}개, 삭제 실패 {stats['error_count']}개, "
+                f"오브젝트가 없는 DB 행 {stats['missing_count']}개"
+            )
+        )
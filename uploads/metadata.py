@@ -0,0 +1,206 @@
+# uploads/metadata.py
+# 미디어 고유 메타데이터(가로/세로, MIME 타입, 바이트 크기, 영상 길이) 추출
+# 이미지는 Pillow로 헤더만 읽고, MP4/MOV는 박스 헤더를 따라가며 moov 정보만 읽음
+import logging
+import mimetypes
+import struct
+from collections import OrderedDict
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+VIDEO_EXTENSIONS = {"mp4", "mov", "m4v"}
+
+# 하위 박스를 가진 MP4 컨테이너 박스
+MP4_CONTAINER_BOXES = {b"moov", b"trak", b"mdia", b"minf", b"stbl", b"edts"}
+
+# EXIF 방향 값 중 가로/세로가 바뀌는 경우
+EXIF_ROTATED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+def _extension(name):
+    return name.rsplit(".", 1)[-1].lower() if "." in name else ""
+
+
+def guess_content_type(name):
+    return mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+
+def extract_metadata(file_obj, name, size=None, content_type=None):
+    """
+    파일 객체(read/seek/tell 지원)에서 메타데이터를 추출합니다.
+    실패해도 업로드를 막지 않도록 알 수 없는 값은 None으로 둡니다.
+    """
+    metadata = {
+        "content_type": content_type or guess_content_type(name),
+        "byte_size": size if size is not None else getattr(file_obj, "size", None),
+        "width": None,
+        "height": None,
+        "duration": None,
+    }
+    try:
+        file_obj.seek(0)
+        if metadata["content_type"].startswith("image/"):
+            metadata.update(_image_dimensions(file_obj))
+        elif _extension(name) in VIDEO_EXTENSIONS:
+            metadata.update(_mp4_metadata(file_obj))
+    except Exception as e:
+        logger.warning(f"메타데이터 추출 실패: {name} - {e}")
+    finally:
+        file_obj.seek(0)
+    return metadata
+
+
+def _image_dimensions(file_obj):
+    """이미지 헤더만 읽어 EXIF 방향을 반영한 가로/세로 반환"""
+    with Image.open(file_obj) as image:
+        width, height = image.size
+        orientation = image.getexif().get(0x0112)
+    if orientation in EXIF_ROTATED_ORIENTATIONS:
+        width, height = height, width
+    return {"width": width, "height": height}
+
+
+def _iter_boxes(file_obj, start, end):
+    """[start, end) 구간의 MP4 박스를 (타입, 본문 시작, 박스 끝) 형태로 순회"""
+    offset = start
+    while end is None or offset + 8 <= end:
+        file_obj.seek(offset)
+        header = file_obj.read(8)
+        if len(header) < 8:
+            return
+        box_size, box_type = struct.unpack(">I4s", header)
+        body_start = offset + 8
+        if box_size == 1:
+            box_size = struct.unpack(">Q", file_obj.read(8))[0]
+            body_start += 8
+        elif box_size == 0:
+            if end is None:
+                return
+            box_size = end - offset
+        if box_size < 8:
+            return
+        yield box_type, body_start, offset + box_size
+        offset += box_size
+
+
+def _mp4_metadata(file_obj):
+    """moov 박스의 mvhd(길이)와 영상 트랙 tkhd(가로/세로)만 읽음"""
+    result = {}
+
+    def walk(start, end):
+        for box_type, body_start, box_end in _iter_boxes(file_obj, start, end):
+            if box_type in MP4_CONTAINER_BOXES:
+                walk(body_start, box_end)
+            elif box_type == b"mvhd":
+                file_obj.seek(body_start)
+                version = file_obj.read(4)[0]
+                if version == 1:
+                    timescale, duration = struct.unpack(">16xIQ", file_obj.read(28))
+                else:
+                    timescale, duration = struct.unpack(">8xII", file_obj.read(16))
+                if timescale:
+                    result["duration"] = round(duration / timescale, 3)
+            elif box_type == b"tkhd" and "width" not in result:
+                file_obj.seek(body_start)
+                version = file_obj.read(4)[0]
+                file_obj.read(32 if version == 1 else 20)
+                # reserved(8), layer/alt_group/volume/reserved(8), matrix(36), width, height
+                a, b = struct.unpack(">16xii", file_obj.read(24))
+                file_obj.read(28)
+                width, height = struct.unpack(">II", file_obj.read(8))
+                width, height = width >> 16, height >> 16
+                if width and height:
+                    # 90도/270도 회전 행렬이면 가로/세로 교환
+                    if a == 0 and abs(b) == 0x10000:
+                        width, height = height, width
+                    result["width"], result["height"] = width, height
+
+    # 최상위 박스 중 moov만 내려가 읽고 mdat 등 본문은 건너뜀
+    for box_type, body_start, box_end in _iter_boxes(file_obj, 0, None):
+        if box_type == b"moov":
+            walk(body_start, box_end)
+            break
+    return result
+
+
+class RangedObjectReader:
+    """
+    R2 오브젝트를 Range GET으로 필요한 블록만 읽는 파일 객체
+    전체를 내려받지 않고 헤더나 moov 박스처럼 필요한 부분만 가져올 때 사용합니다.
+    """
+
+    def __init__(
+        self, client, bucket, key, size, block_size=64 * 1024, max_blocks=32
+    ):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.size = size
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.position = 0
+        self.request_count = 0
+        self._blocks = OrderedDict()
+
+    def _block(self, index):
+        if index in self._blocks:
+            self._blocks.move_to_end(index)
+            return self._blocks[index]
+        start = index * self.block_size
+        end = min(start + self.block_size, self.size) - 1
+        data = self.client.get_object(
+            Bucket=self.bucket, Key=self.key, Range=f"bytes={start}-{end}"
+        )["Body"].read()
+        self.request_count += 1
+        self._blocks[index] = data
+        if len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+        return data
+
+    def read(self, n=-1):
+        if n is None or n < 0:
+            n = self.size - self.position
+        n = max(0, min(n, self.size - self.position))
+        chunks = []
+        while n > 0:
+            index, offset = divmod(self.position, self.block_size)
+            data = self._block(index)[offset : offset + n]
+            if not data:
+                break
+            chunks.append(data)
+            self.position += len(data)
+            n -= len(data)
+        return b"".join(chunks)
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self.position
+        elif whence == 2:
+            offset += self.size
+        self.position = max(0, offset)
+        return self.position
+
+    def tell(self):
+        return self.position
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+
+def extract_remote_metadata(media):
+    """스토리지의 오브젝트를 Range GET으로 부분만 읽어 메타데이터 추출"""
+    storage = media.file.storage
+    client = storage.connection.meta.client
+    key = storage._normalize_name(media.file.name)
+    head = client.head_object(Bucket=storage.bucket_name, Key=key)
+    reader = RangedObjectReader(client, storage.bucket_name, key, head["ContentLength"])
+    return extract_metadata(
+        reader,
+        media.file.name,
+        size=head["ContentLength"],
+        content_type=head.get("ContentType"),
+    )
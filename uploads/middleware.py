@@ -0,0 +1,12 @@
+from .versioning import media_version_scope
+
+
+class MediaVersionMiddleware:
+    """요청마다 미디어 버전 리졸버를 활성화하여 URL 해시 조회를 일괄 처리"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with media_version_scope():
+            return self.get_response(request)
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uploads', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaRendition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file', models.FileField(max_length=255, upload_to='')),
+                ('format', models.CharField(max_length=10)),
+                ('width', models.PositiveIntegerField()),
+                ('height', models.PositiveIntegerField()),
+                ('size', models.PositiveIntegerField(help_text='바이트 크기')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('media', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='renditions', to='uploads.media')),
+            ],
+            options={
+                'verbose_name': 'Media Rendition',
+                'verbose_name_plural': 'Media Renditions',
+                'ordering': ['format', 'width'],
+                'constraints': [models.UniqueConstraint(fields=('media', 'format', 'width'), name='uploads_rendition_uniq')],
+            },
+        ),
+    ]
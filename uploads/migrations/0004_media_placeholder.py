@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uploads', '0003_media_metadata'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='media',
+            name='placeholder',
+            field=models.TextField(blank=True, editable=False),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uploads', '0004_media_placeholder'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaReference',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_model', models.CharField(help_text='app_label.model_name', max_length=100)),
+                ('source_pk', models.BigIntegerField()),
+                ('field', models.CharField(max_length=100)),
+                ('language', models.CharField(blank=True, max_length=15)),
+                ('media', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='references', to='uploads.media')),
+            ],
+            options={
+                'verbose_name': 'Media Reference',
+                'verbose_name_plural': 'Media References',
+                'indexes': [models.Index(fields=['source_model', 'source_pk'], name='uploads_ref_source_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source_model', 'source_pk', 'field', 'language', 'media'), name='uploads_reference_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,131 @@
+import html
+import re
+from urllib.parse import unquote, urlsplit
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models import Exists, OuterRef
+from django_ckeditor_5.fields import CKEditor5Field
+
+# uploads.extractors의 패턴을 이 시점 기준으로 고정한 사본
+ATTRIBUTE_VALUE_PATTERN = re.compile(r"""=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))""")
+MEDIA_URL_PATTERN = re.compile(
+    r"(?:[a-zA-Z][a-zA-Z0-9+.-]*:)?(?://(?P<host>[^/?#]*))?/media/(?P<path>[^?#]*)"
+)
+SRCSET_SEPARATOR = re.compile(r",\s+|,(?=\S+\s)")
+
+
+def extract_media_names(content, hosts):
+    """uploads.extractors.extract_media_names의 고정 사본"""
+    names = set()
+    if not content or "/media/" not in content:
+        return names
+    for match in ATTRIBUTE_VALUE_PATTERN.finditer(content):
+        value = match.group(1) or match.group(2) or match.group(3)
+        if not value or "/media/" not in value:
+            continue
+        if "," in value:
+            candidates = SRCSET_SEPARATOR.split(value.strip())
+            urls = [candidate.split()[0] for candidate in candidates if candidate]
+        else:
+            urls = [value]
+        for url in urls:
+            url = html.unescape(url.strip())
+            url_match = MEDIA_URL_PATTERN.match(url)
+            if not url_match:
+                continue
+            host = url_match.group("host")
+            if host is not None and host.lower() not in hosts:
+                continue
+            name = unquote(url_match.group("path"))
+            if name:
+                names.add(name)
+    return names
+
+
+def populate_media_references(apps, schema_editor):
+    """
+    기존 콘텐츠로 참조 색인을 채웁니다.
+    색인이 비어 있으면 미사용 미디어 정리 작업이 모든 파일을 미사용으로 판단하므로 필요합니다.
+    """
+    Media = apps.get_model("uploads", "Media")
+    MediaReference = apps.get_model("uploads", "MediaReference")
+    ids_by_name = dict(Media.objects.values_list("file", "id"))
+    domain = getattr(settings, "MEDIA_PUBLIC_DOMAIN", "") or ""
+    host = urlsplit(domain if "//" in domain else f"//{domain}").netloc.lower()
+    hosts = {host} if host else set()
+
+    references = []
+    for model in apps.get_models():
+        if model._meta.app_label == "uploads" or model._meta.auto_created:
+            continue
+        fields = {field.name: field for field in model._meta.get_fields()}
+        fk_names = [
+            field.name
+            for field in fields.values()
+            if field.concrete
+            and field.many_to_one
+            and field.related_model._meta.label_lower == "uploads.media"
+        ]
+        html_names = [
+            name for name, field in fields.items() if isinstance(field, CKEditor5Field)
+        ]
+        if not (fk_names or html_names):
+            continue
+
+        # parler 번역 모델은 원본(master) 객체 기준으로 기록
+        translated = "master" in fields and "language_code" in fields
+        if translated:
+            source_model = fields["master"].related_model._meta.label_lower
+            columns = ["master_id", "language_code"]
+        else:
+            source_model = model._meta.label_lower
+            columns = ["pk"]
+
+        values = [f"{name}_id" for name in fk_names] + html_names
+        for row in model.objects.values_list(*columns, *values).iterator():
+            if translated:
+                source_pk, language = row[0], row[1]
+                row_values = row[2:]
+            else:
+                source_pk, language = row[0], ""
+                row_values = row[1:]
+            found = set()
+            for name, media_id in zip(fk_names, row_values):
+                if media_id:
+                    found.add((name, media_id))
+            for name, content in zip(html_names, row_values[len(fk_names) :]):
+                for media_name in extract_media_names(content, hosts):
+                    if media_name in ids_by_name:
+                        found.add((name, ids_by_name[media_name]))
+            references.extend(
+                MediaReference(
+                    source_model=source_model,
+                    source_pk=source_pk,
+                    field=name,
+                    language=language,
+                    media_id=media_id,
+                )
+                for name, media_id in found
+            )
+
+    MediaReference.objects.bulk_create(
+        references, batch_size=1000, ignore_conflicts=True
+    )
+    referenced = Exists(MediaReference.objects.filter(media=OuterRef("pk")))
+    Media.objects.filter(referenced).update(is_used_cached=True)
+    Media.objects.filter(~referenced).update(is_used_cached=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("homepage", "0005_booktranslation_summary_and_more"),
+        ("uploads", "0005_mediareference"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_media_references, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uploads', '0006_populate_mediareference'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaScanWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_model', models.CharField(max_length=100, unique=True)),
+                ('scanned_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Media Scan Watermark',
+                'verbose_name_plural': 'Media Scan Watermarks',
+            },
+        ),
+    ]
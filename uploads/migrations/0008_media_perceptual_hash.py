@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uploads', '0007_mediascanwatermark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='media',
+            name='perceptual_hash',
+            field=models.CharField(blank=True, editable=False, max_length=16),
+        ),
+    ]
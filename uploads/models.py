@@ -3,15 +3,16 @@
 # Cloudflare R2 스토리지와 연동하여 파일 저장 및 관리
 from django.db import models
 import hashlib
-from datetime import datetime
+from .keys import content_addressed_name
+from .metadata import extract_metadata
+from .streaming import iter_file_chunks
 
 
 def generate_filename(instance, filename):
-    """파일명을 날짜와 시간 기반으로 생성하여 중복 방지"""
-    ext = filename.split(".")[-1]  # 확장자 추출
-    timestamp = datetime.now().strftime("%H%M%S")  # HHMMSS
-    upload_path = f"{datetime.now().strftime('%Y/%m/%d')}-{timestamp}.{ext}"
-    return upload_path
+    """파일 내용의 해시값으로 저장 키를 생성하여 중복 방지 (media/ab/cd/<hash>.<ext>)"""
+    if not instance.hash_value:
+        instance.hash_value = instance.calculate_file_hash(instance.file)
+    return content_addressed_name(instance.hash_value, filename)
 
 
 class Media(models.Model):
@@ -22,6 +23,16 @@ class Media(models.Model):
     )
     is_used_cached = models.BooleanField(default=False, editable=False)
     hash_value = models.CharField(max_length=64, blank=True, null=True, unique=True)
+    # 업로드 시 한 번 추출하여 저장하는 고유 메타데이터 (스토리지 HEAD 요청 없이 사용)
+    content_type = models.CharField(max_length=100, blank=True)
+    byte_size = models.PositiveBigIntegerField(null=True, blank=True)
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    duration = models.FloatField(null=True, blank=True, help_text="영상 길이 (초)")
+    # 이미지 로딩 전에 바로 그릴 수 있는 저해상도 data URI (Celery에서 생성)
+    placeholder = models.TextField(blank=True, editable=False)
+    # 화질/크기만 다른 같은 이미지를 찾기 위한 지각 해시 (dHash, 64비트 16진수)
+    perceptual_hash = models.CharField(max_length=16, blank=True, editable=False)
 
     def __str__(self):
         return self.title or self.file.name
@@ -34,14 +45,19 @@ class Media(models.Model):
     def calculate_file_hash(file_obj):
         """파일 객체에서 SHA-256 해시 계산하여 중복 파일 식별에 사용"""
         sha256 = hashlib.sha256()
-        if hasattr(file_obj, "chunks"):
-            for chunk in file_obj.chunks():
-                sha256.update(chunk)
-        else:
-            file_obj.seek(0)
-            sha256.update(file_obj.read())
+        # 파일 전체를 메모리에 올리지 않도록 청크 단위로 읽음
+        for chunk in iter_file_chunks(file_obj):
+            sha256.update(chunk)
         return sha256.hexdigest()
 
+    def apply_metadata(self, metadata):
+        """extract_metadata 결과를 필드에 반영"""
+        self.content_type = metadata.get("content_type") or ""
+        self.byte_size = metadata.get("byte_size")
+        self.width = metadata.get("width")
+        self.height = metadata.get("height")
+        self.duration = metadata.get("duration")
+
     def _calculate_file_hash(self):
         """현재 인스턴스의 파일 해시값 계산"""
         return self.calculate_file_hash(self.file)
@@ -49,7 +65,12 @@ class Media(models.Model):
     def save(self, *args, **kwargs):
         # 파일이 존재하는지 확인
         if self.file:
-            self.file.seek(0)
+            # 이미 스토리지에 올라간 파일(스트리밍 업로드 등)은 다시 열지 않음
+            if not self.file._committed:
+                self.file.seek(0)
+                # 업로드 중인 파일에서 메타데이터를 미리 추출 (헤더만 읽음)
+                if self.byte_size is None:
+                    self.apply_metadata(extract_metadata(self.file, self.file.name))
 
             # 파일 변경 여부 확인을 위한 변수
             old_file = None
@@ -81,17 +102,20 @@ class Media(models.Model):
                     self.hash_value = self._calculate_file_hash()
                     if not self.title and hasattr(self.file, "name"):
                         self.title = self.file.file.name.split("/")[-1]
+                # 중복 확인과 저장을 INSERT ... ON CONFLICT 한 문장으로 처리
+                self._save_unique()
+                return
 
             # 중복 체크 (해시가 같은 다른 파일이 있는지)
-            if (
-                self.hash_value
-                and Media.objects.filter(hash_value=self.hash_value)
+            existing_media = (
+                Media.objects.filter(hash_value=self.hash_value)
                 .exclude(id=self.id)
-                .exists()
-            ):
+                .first()
+                if self.hash_value
+                else None
+            )
+            if existing_media:
                 # 중복 파일이 있는 경우, 기존 파일 사용하고 현재 업로드 중단
-                existing_media = Media.objects.get(hash_value=self.hash_value)
-
                 # 파일이 변경되었고 이전 파일이 있다면 삭제
                 if file_changed and old_file and old_file.name:
                     try:
@@ -116,49 +140,116 @@ class Media(models.Model):
 
         super().save(*args, **kwargs)
 
-    def _check_usage(self):
-        """모든 모델을 검사하여 현재 미디어 파일이 사용 중인지 확인"""
-        from django.apps import apps
+    def _save_unique(self):
+        """
+        save_unique_media로 저장하고 저장된 행(같은 해시의 기존 행일 수 있음)의 값으로 채움
+        관리자 화면 등 save()를 거치는 새 Media도 같은 원자적 중복 처리를 거침
+        """
+        from .dedup import save_unique_media
+
+        saved, _created = save_unique_media(self)
+        for field in self._meta.concrete_fields:
+            setattr(self, field.attname, getattr(saved, field.attname))
+        self._state.adding = False
+        self._state.db = saved._state.db
 
-        for model in apps.get_models():
-            for field in model._meta.get_fields():
-                if field.related_model == Media:
-                    if isinstance(field, (models.ForeignKey, models.OneToOneField)):
-                        if model.objects.filter(**{field.name: self}).exists():
-                            return True
-                    elif isinstance(field, models.ManyToManyField):
-                        filter_kwargs = {f"{field.name}__id": self.id}
-                        if model.objects.filter(**filter_kwargs).exists():
-                            return True
-        return False
+    def _check_usage(self):
+        """참조 색인을 조회하여 현재 미디어 파일이 사용 중인지 확인"""
+        return self.references.exists()
 
     def get_usage_details(self):
         """미디어 파일이 사용되는 모든 모델과 객체 정보 반환"""
         from django.apps import apps
 
+        source_pks = {}
+        for source_model, source_pk in self.references.values_list(
+            "source_model", "source_pk"
+        ).distinct():
+            source_pks.setdefault(source_model, set()).add(source_pk)
+
         usage = []
-        for model in apps.get_models():
-            for field in model._meta.get_fields():
-                if field.related_model == Media:
-                    if isinstance(field, (models.ForeignKey, models.OneToOneField)):
-                        qs = model.objects.filter(**{field.name: self})
-                        if qs.exists():
-                            usage.append(
-                                {
-                                    "model": model._meta.verbose_name,
-                                    "count": qs.count(),
-                                    "objects": list(qs),
-                                }
-                            )
-                    elif isinstance(field, models.ManyToManyField):
-                        filter_kwargs = {f"{field.name}__id": self.id}
-                        qs = model.objects.filter(**filter_kwargs)
-                        if qs.exists():
-                            usage.append(
-                                {
-                                    "model": model._meta.verbose_name,
-                                    "count": qs.count(),
-                                    "objects": list(qs),
-                                }
-                            )
+        for source_model, pks in source_pks.items():
+            model = apps.get_model(source_model)
+            objects = list(model.objects.filter(pk__in=pks))
+            usage.append(
+                {
+                    "model": model._meta.verbose_name,
+                    "count": len(objects),
+                    "objects": objects,
+                }
+            )
         return usage
+
+
+class MediaRendition(models.Model):
+    """원본 이미지에서 생성한 크기/포맷별 파생 이미지"""
+
+    media = models.ForeignKey(
+        Media, on_delete=models.CASCADE, related_name="renditions"
+    )
+    file = models.FileField(max_length=255)
+    format = models.CharField(max_length=10)
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    size = models.PositiveIntegerField(help_text="바이트 크기")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.file.name
+
+    class Meta:
+        verbose_name = "Media Rendition"
+        verbose_name_plural = "Media Renditions"
+        ordering = ["format", "width"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["media", "format", "width"], name="uploads_rendition_uniq"
+            )
+        ]
+
+
+class MediaReference(models.Model):
+    """
+    미디어 참조 색인: 어떤 객체의 어떤 필드(언어)가 어떤 Media를 참조하는지 기록
+    원본 객체 저장/삭제 시그널로 갱신되며 사용 여부 확인은 이 테이블만 조회합니다.
+    """
+
+    source_model = models.CharField(max_length=100, help_text="app_label.model_name")
+    source_pk = models.BigIntegerField()
+    field = models.CharField(max_length=100)
+    language = models.CharField(max_length=15, blank=True)
+    media = models.ForeignKey(
+        Media, on_delete=models.CASCADE, related_name="references"
+    )
+
+    def __str__(self):
+        return f"{self.source_model}#{self.source_pk}.{self.field} -> {self.media_id}"
+
+    class Meta:
+        verbose_name = "Media Reference"
+        verbose_name_plural = "Media References"
+        indexes = [
+            models.Index(
+                fields=["source_model", "source_pk"], name="uploads_ref_source_idx"
+            )
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source_model", "source_pk", "field", "language", "media"],
+                name="uploads_reference_uniq",
+            )
+        ]
+
+
+class MediaScanWatermark(models.Model):
+    """모델별 마지막 참조 스캔 시각 (이후 변경된 행만 다시 스캔)"""
+
+    source_model = models.CharField(max_length=100, unique=True)
+    scanned_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.source_model} @ {self.scanned_at}"
+
+    class Meta:
+        verbose_name = "Media Scan Watermark"
+        verbose_name_plural = "Media Scan Watermarks"
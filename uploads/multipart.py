@@ -0,0 +1,82 @@
+# uploads/multipart.py
+# R2(S3 호환) 병렬 멀티파트 업로드 엔진
+# 파트를 스레드 풀로 동시에 전송하고, 실패한 파트는 재시도하며, 최종 실패 시 업로드를 중단(abort)
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def _upload_part(client, bucket, key, upload_id, part_number, body, max_retries):
+    """파트 하나를 업로드하고 실패 시 지수 백오프로 재시도"""
+    for attempt in range(max_retries + 1):
+        try:
+            response = client.upload_part(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            return {"ETag": response["ETag"], "PartNumber": part_number}
+        except Exception as e:
+            if attempt == max_retries:
+                raise
+            logger.warning(
+                f"파트 업로드 재시도 ({attempt + 1}/{max_retries}): "
+                f"{key} #{part_number} - {e}"
+            )
+            time.sleep(0.5 * 2**attempt)
+
+
+def multipart_upload(
+    client, bucket, key, parts, params=None, concurrency=4, max_retries=3
+):
+    """
+    parts(바이트 청크 이터러블)를 멀티파트 업로드로 전송합니다.
+    동시에 메모리에 올라가는 파트는 concurrency + 1개로 제한됩니다.
+    """
+    upload_id = client.create_multipart_upload(
+        Bucket=bucket, Key=key, **(params or {})
+    )["UploadId"]
+    # 전송 중인 파트 수를 제한하여 읽기가 업로드보다 앞서 나가지 않도록 함
+    slots = threading.BoundedSemaphore(max(concurrency, 1))
+    failed = threading.Event()
+
+    def upload(part_number, body):
+        try:
+            return _upload_part(
+                client, bucket, key, upload_id, part_number, body, max_retries
+            )
+        except BaseException:
+            failed.set()
+            raise
+        finally:
+            slots.release()
+
+    try:
+        futures = []
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            for part_number, body in enumerate(parts, start=1):
+                slots.acquire()
+                futures.append(executor.submit(upload, part_number, body))
+                # 이미 실패한 파트가 있으면 나머지를 읽지 않고 중단
+                if failed.is_set():
+                    break
+            completed = [future.result() for future in futures]
+
+        client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": completed},
+        )
+    except BaseException:
+        try:
+            client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+        except Exception as e:
+            logger.error(f"멀티파트 업로드 중단 실패: {key} ({upload_id}) - {e}")
+        raise
+    return upload_id
@@ -0,0 +1,107 @@
+# uploads/reconcile.py
+# R2 버킷과 데이터베이스를 대조하여 Media/파생 이미지 행이 없는 고아 오브젝트를 찾는 작업
+# 양쪽을 같은 바이트 순서로 정렬된 스트림으로 읽어 병합하므로 어느 쪽도 메모리에 모두 올리지 않음
+import heapq
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection
+from django.db.models import F
+from django.db.models.functions import Collate
+from django.utils import timezone
+from .deletion import MAX_KEYS_PER_REQUEST, delete_files
+from .models import Media, MediaRendition
+
+logger = logging.getLogger(__name__)
+
+# S3 ListObjectsV2는 키를 UTF-8 바이트 순서로 반환하므로 DB도 같은 순서로 정렬
+BYTE_ORDER_COLLATIONS = {"postgresql": "C", "sqlite": "BINARY"}
+
+
+def _byte_ordered(field_name):
+    collation = BYTE_ORDER_COLLATIONS.get(connection.vendor)
+    return Collate(F(field_name), collation) if collation else F(field_name)
+
+
+def iter_db_names(batch_size=5000):
+    """Media와 파생 이미지의 저장 키를 바이트 순서로 스트리밍 (중복 제거)"""
+    streams = [
+        model.objects.exclude(file="")
+        .order_by(_byte_ordered("file"))
+        .values_list("file", flat=True)
+        .iterator(chunk_size=batch_size)
+        for model in (Media, MediaRendition)
+    ]
+    previous = None
+    for name in heapq.merge(*streams):
+        if name != previous:
+            yield name
+            previous = name
+
+
+def iter_storage_objects(storage):
+    """버킷의 미디어 오브젝트를 (저장 키, 마지막 수정 시각)으로 페이지 단위 스트리밍"""
+    prefix = storage._normalize_name("")
+    if not prefix.endswith("/"):
+        prefix += "/"
+    paginator = storage.connection.meta.client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=storage.bucket_name, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            yield obj["Key"][len(prefix) :], obj["LastModified"]
+
+
+def reconcile_storage(delete=False, grace=None, storage=None, db_names=None):
+    """
+    버킷과 DB의 저장 키를 정렬 병합하여 고아 오브젝트를 찾고 통계를 반환합니다.
+    업로드 직후(직접 업로드 완료 대기 등)의 오브젝트는 grace 기간 동안 제외하며,
+    delete=True이면 고아 오브젝트를 DeleteObjects로 삭제합니다.
+    """
+    storage = storage or Media._meta.get_field("file").storage
+    if grace is None:
+        grace = timedelta(hours=getattr(settings, "MEDIA_ORPHAN_GRACE_HOURS", 48))
+    cutoff = timezone.now() - grace
+    db_names = iter(db_names if db_names is not None else iter_db_names())
+
+    stats = {
+        "scanned_count": 0,
+        "orphan_count": 0,
+        "recent_orphan_count": 0,
+        "missing_count": 0,
+        "deleted_count": 0,
+        "error_count": 0,
+    }
+    pending = []
+
+    def flush():
+        deleted_count, errors = delete_files([(storage, name) for name in pending])
+        stats["deleted_count"] += deleted_count
+        stats["error_count"] += len(errors)
+        pending.clear()
+
+    db_name = next(db_names, None)
+    for name, last_modified in iter_storage_objects(storage):
+        stats["scanned_count"] += 1
+        # DB에만 있는 키(오브젝트가 없는 행)는 건너뛰며 집계
+        while db_name is not None and db_name < name:
+            stats["missing_count"] += 1
+            db_name = next(db_names, None)
+        if db_name == name:
+            db_name = next(db_names, None)
+            continue
+
+        if last_modified > cutoff:
+            stats["recent_orphan_count"] += 1
+            continue
+        stats["orphan_count"] += 1
+        logger.info(f"고아 오브젝트: {name} ({last_modified.isoformat()})")
+        if delete:
+            pending.append(name)
+            if len(pending) >= MAX_KEYS_PER_REQUEST:
+                flush()
+
+    while db_name is not None:
+        stats["missing_count"] += 1
+        db_name = next(db_names, None)
+    if pending:
+        flush()
+    return stats
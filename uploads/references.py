@@ -0,0 +1,176 @@
+# uploads/references.py
+# 미디어 참조 색인(MediaReference) 관리
+# Media FK/M2M 또는 CKEditor5Field를 가진 모델이 저장/삭제될 때 해당 객체의 참조만 갱신하여
+# 사용 여부 확인에 전체 데이터베이스 스캔이 필요 없도록 함
+from functools import lru_cache
+from django.apps import apps
+from django.db import models
+from django_ckeditor_5.fields import CKEditor5Field
+from parler.models import TranslatedFieldsModelMixin
+from .extractors import extract_media_names
+from .models import Media, MediaReference
+from .utils import update_media_usage
+
+
+@lru_cache(maxsize=None)
+def get_reference_fields(model):
+    """
+    모델에서 Media를 참조하는 필드 목록을 (FK, M2M, CKEditor 필드) 튜플로 반환합니다.
+    참조 필드가 없거나 색인 대상이 아닌 모델은 None을 반환합니다.
+    """
+    # uploads 앱 자체 모델(파생 이미지, 색인)과 M2M 중간 테이블은 제외
+    if model._meta.app_label == "uploads" or model._meta.auto_created:
+        return None
+
+    fk_fields, m2m_fields, html_fields = [], [], []
+    for field in model._meta.get_fields():
+        if isinstance(field, CKEditor5Field):
+            html_fields.append(field.name)
+        elif field.auto_created or field.related_model is not Media:
+            # 역참조 관계는 반대편 모델에서 처리
+            continue
+        elif isinstance(field, (models.ForeignKey, models.OneToOneField)):
+            fk_fields.append(field)
+        elif isinstance(field, models.ManyToManyField):
+            m2m_fields.append(field)
+
+    if not (fk_fields or m2m_fields or html_fields):
+        return None
+    return fk_fields, m2m_fields, html_fields
+
+
+def get_reference_models():
+    """참조 필드가 있는 모든 모델"""
+    return [model for model in apps.get_models() if get_reference_fields(model)]
+
+
+def get_source(instance):
+    """
+    색인에 기록할 (원본 모델 라벨, 원본 pk, 언어)를 반환합니다.
+    parler 번역 모델은 번역 행이 아닌 원본(master) 객체 기준으로 기록합니다.
+    """
+    if isinstance(instance, TranslatedFieldsModelMixin):
+        master_model = type(instance).master.field.related_model
+        return (
+            master_model._meta.label_lower,
+            instance.master_id,
+            instance.language_code,
+        )
+    return type(instance)._meta.label_lower, instance.pk, ""
+
+
+def collect_references(instance):
+    """인스턴스가 현재 참조하는 (필드명, Media id) 집합을 계산"""
+    fk_fields, m2m_fields, html_fields = get_reference_fields(type(instance))
+    references = set()
+    for field in fk_fields:
+        media_id = getattr(instance, field.attname)
+        if media_id:
+            references.add((field.name, media_id))
+    for field in m2m_fields:
+        # prefetch_related로 미리 읽은 경우 추가 쿼리 없음
+        for media in getattr(instance, field.name).all():
+            references.add((field.name, media.id))
+
+    names_by_field = {
+        field_name: extract_media_names(getattr(instance, field_name))
+        for field_name in html_fields
+    }
+    all_names = set().union(*names_by_field.values())
+    if all_names:
+        # 콘텐츠 안의 모든 경로를 한 번의 쿼리로 Media id로 변환
+        ids_by_name = dict(
+            Media.objects.filter(file__in=all_names).values_list("file", "id")
+        )
+        for field_name, names in names_by_field.items():
+            for name in names:
+                if name in ids_by_name:
+                    references.add((field_name, ids_by_name[name]))
+    return references
+
+
+def sync_references(instance, refresh_usage=True):
+    """
+    인스턴스의 참조 색인을 현재 값과 일치시키고 변경된 Media id 집합을 반환합니다.
+    refresh_usage가 True이면 변경된 Media의 is_used_cached도 함께 갱신합니다.
+    """
+    fields = get_reference_fields(type(instance))
+    if not fields or instance.pk is None:
+        return set()
+
+    source_model, source_pk, language = get_source(instance)
+    field_names = [field.name for field in fields[0] + fields[1]] + fields[2]
+    existing = MediaReference.objects.filter(
+        source_model=source_model,
+        source_pk=source_pk,
+        language=language,
+        field__in=field_names,
+    )
+    current = {
+        (field, media_id): pk
+        for pk, field, media_id in existing.values_list("pk", "field", "media_id")
+    }
+    references = collect_references(instance)
+
+    stale = set(current) - references
+    added = references - set(current)
+    if stale:
+        MediaReference.objects.filter(pk__in=[current[key] for key in stale]).delete()
+    if added:
+        MediaReference.objects.bulk_create(
+            [
+                MediaReference(
+                    source_model=source_model,
+                    source_pk=source_pk,
+                    field=field,
+                    language=language,
+                    media_id=media_id,
+                )
+                for field, media_id in added
+            ],
+            ignore_conflicts=True,
+        )
+
+    changed = {media_id for _, media_id in stale | added}
+    if refresh_usage and changed:
+        update_media_usage(changed)
+    return changed
+
+
+def delete_references(instance, refresh_usage=True):
+    """삭제된 객체(또는 번역)의 참조 색인을 제거하고 영향받은 Media id 집합을 반환"""
+    if not get_reference_fields(type(instance)):
+        return set()
+
+    source_model, source_pk, language = get_source(instance)
+    references = MediaReference.objects.filter(
+        source_model=source_model, source_pk=source_pk
+    )
+    # 번역 행 삭제는 해당 언어의 참조만, 원본 객체 삭제는 모든 언어의 참조를 제거
+    if language:
+        references = references.filter(language=language)
+    changed = set(references.values_list("media_id", flat=True))
+    references.delete()
+    if refresh_usage and changed:
+        update_media_usage(changed)
+    return changed
+
+
+def rebuild_media_references(batch_size=500):
+    """
+    모든 참조 모델을 순회하여 색인을 다시 만듭니다.
+    최초 도입 시나 시그널을 거치지 않은 대량 변경(update(), 데이터 이전) 후에만 사용합니다.
+    """
+    # 삭제된 객체의 남은 참조까지 정리하기 위해 색인을 비우고 다시 채움
+    MediaReference.objects.all().delete()
+    synced_count = 0
+    for model in get_reference_models():
+        queryset = model.objects.order_by("pk")
+        m2m_fields = get_reference_fields(model)[1]
+        if m2m_fields:
+            queryset = queryset.prefetch_related(*[f.name for f in m2m_fields])
+        for instance in queryset.iterator(chunk_size=batch_size):
+            sync_references(instance, refresh_usage=False)
+            synced_count += 1
+    update_media_usage()
+    return synced_count
@@ -0,0 +1,117 @@
+# uploads/renditions.py
+# 원본 이미지에서 반응형 파생 이미지(폭별 WebP/AVIF)를 생성하여 원본 옆에 저장
+import base64
+import io
+import logging
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, features
+from .keys import rendition_name
+from .models import MediaRendition
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = {"jpg", "jpeg", "png", "gif", "webp", "avif"}
+
+# Pillow 저장 포맷 이름과 지원 여부 확인용 기능 이름
+PILLOW_FORMATS = {"webp": "WEBP", "avif": "AVIF", "jpeg": "JPEG"}
+
+
+def is_image(name):
+    return name.rsplit(".", 1)[-1].lower() in IMAGE_EXTENSIONS
+
+
+def get_rendition_formats():
+    """설정된 포맷 중 현재 Pillow 빌드에서 인코딩 가능한 포맷만 반환"""
+    formats = getattr(settings, "MEDIA_RENDITION_FORMATS", ["webp"])
+    return [
+        fmt
+        for fmt in formats
+        if fmt in PILLOW_FORMATS and (fmt == "jpeg" or features.check(fmt))
+    ]
+
+
+def open_original(media):
+    """스토리지에서 원본 이미지를 읽어 Pillow 이미지로 반환"""
+    with media.file.open("rb") as f:
+        image = Image.open(io.BytesIO(f.read()))
+        image.load()
+    return ImageOps.exif_transpose(image)
+
+
+def build_placeholder(image):
+    """긴 변이 MEDIA_PLACEHOLDER_SIZE인 저화질 이미지를 base64 data URI로 반환"""
+    size = getattr(settings, "MEDIA_PLACEHOLDER_SIZE", 20)
+    thumbnail = image.copy()
+    thumbnail.thumbnail((size, size), Image.Resampling.LANCZOS)
+    if thumbnail.mode not in ("RGB", "RGBA"):
+        thumbnail = thumbnail.convert("RGBA" if "A" in thumbnail.getbands() else "RGB")
+
+    # WebP를 지원하지 않는 Pillow 빌드에서는 JPEG으로 대체
+    fmt = "webp" if features.check("webp") else "jpeg"
+    if fmt == "jpeg":
+        thumbnail = thumbnail.convert("RGB")
+    buffer = io.BytesIO()
+    thumbnail.save(buffer, format=PILLOW_FORMATS[fmt], quality=40)
+    encoded = base64.b64encode(buffer.getvalue()).decode()
+    return f"data:image/{fmt};base64,{encoded}"
+
+
+def generate_placeholder(media, image=None):
+    """Media의 플레이스홀더를 생성하여 저장하고 생성 여부를 반환"""
+    if not media.file or not is_image(media.file.name):
+        return False
+
+    image = image or open_original(media)
+    media.placeholder = build_placeholder(image)
+    media.save(update_fields=["placeholder"])
+    return True
+
+
+def generate_renditions(media, image=None):
+    """설정된 폭과 포맷 조합으로 파생 이미지를 만들고 생성한 개수를 반환"""
+    if not media.file or not is_image(media.file.name):
+        return 0
+
+    image = image or open_original(media)
+    # 애니메이션 GIF 등은 첫 프레임만 남으므로 생성하지 않음
+    if getattr(image, "is_animated", False):
+        return 0
+
+    storage = media.file.storage
+    quality = getattr(settings, "MEDIA_RENDITION_QUALITY", 80)
+    widths = sorted(getattr(settings, "MEDIA_RENDITION_WIDTHS", [640, 1280]))
+    existing = set(media.renditions.values_list("format", "width"))
+
+    created = 0
+    for width in widths:
+        # 원본보다 큰 크기로 확대하지 않음
+        if width >= image.width:
+            break
+        resized = image.copy()
+        resized.thumbnail((width, image.height), Image.Resampling.LANCZOS)
+        if resized.mode not in ("RGB", "RGBA"):
+            resized = resized.convert("RGBA" if "A" in resized.getbands() else "RGB")
+
+        for fmt in get_rendition_formats():
+            if (fmt, width) in existing:
+                continue
+            buffer = io.BytesIO()
+            output = resized.convert("RGB") if fmt == "jpeg" else resized
+            output.save(buffer, format=PILLOW_FORMATS[fmt], quality=quality)
+
+            content = ContentFile(buffer.getvalue())
+            content.content_type = f"image/{fmt}"
+            name = storage.save(
+                rendition_name(media.file.name, width, fmt), content
+            )
+            MediaRendition.objects.create(
+                media=media,
+                file=name,
+                format=fmt,
+                width=width,
+                height=resized.height,
+                size=content.size,
+            )
+            created += 1
+    return created
@@ -0,0 +1,145 @@
+# uploads/resumable.py
+# 연결이 끊겨도 이어서 보낼 수 있는 청크 업로드 (tus 방식의 오프셋 프로토콜)
+# 청크 하나가 R2 멀티파트 업로드의 파트 하나가 되며, 요청 본문을 임시 파일로 받지 않고
+# 파트 크기만큼만 메모리에 읽어 바로 전송함. 진행 상태는 Redis 캐시에 보관
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core.cache import cache
+from .direct import UPLOAD_STATE_TIMEOUT, _cache_key, finish_direct_upload
+from .keys import unique_name
+from .models import Media
+from .multipart import _upload_part
+from .streaming import get_part_size
+
+# 같은 업로드에 청크가 동시에 들어오지 않도록 잡는 잠금의 유효 시간 (초)
+CHUNK_LOCK_TIMEOUT = 60 * 10
+
+
+class UploadConflict(ValueError):
+    """청크 오프셋이 서버 상태와 다르거나 다른 요청이 전송 중인 경우"""
+
+
+def _lock_key(name):
+    return f"{_cache_key(name)}:lock"
+
+
+def _get_state(name):
+    state = cache.get(_cache_key(name))
+    if not state or "parts" not in state:
+        raise ValueError("알 수 없거나 만료된 업로드입니다.")
+    return state
+
+
+def get_upload_offset(state):
+    """지금까지 전송이 완료된 바이트 수 (다음 청크의 시작 위치)"""
+    return min(len(state["parts"]) * state["part_size"], state["size"])
+
+
+def start_resumable_upload(filename, size, hash_value):
+    """
+    멀티파트 업로드를 시작하고 상태를 캐시에 저장합니다.
+    클라이언트는 part_size 단위로 청크를 나누어 offset 순서대로 전송합니다.
+    """
+    storage = Media._meta.get_field("file").storage
+    name = unique_name(filename)
+    key = storage._normalize_name(name)
+    upload_id = storage.connection.meta.client.create_multipart_upload(
+        Bucket=storage.bucket_name, Key=key, **storage._get_write_parameters(key)
+    )["UploadId"]
+    # 완료 처리는 직접 업로드와 같은 상태 형식을 사용하여 finish_direct_upload에 맡김
+    state = {
+        "size": size,
+        "hash_value": hash_value,
+        "title": filename,
+        "upload_id": upload_id,
+        "part_size": get_part_size(),
+        "parts": [],
+    }
+    cache.set(_cache_key(name), state, timeout=UPLOAD_STATE_TIMEOUT)
+    return {"key": name, "part_size": state["part_size"], "offset": 0}
+
+
+def get_resumable_upload(name):
+    state = _get_state(name)
+    return {
+        "key": name,
+        "size": state["size"],
+        "part_size": state["part_size"],
+        "offset": get_upload_offset(state),
+    }
+
+
+def upload_chunk(name, offset, stream, length):
+    """
+    offset 위치의 청크를 stream에서 읽어 멀티파트 파트로 전송합니다.
+    청크 길이는 part_size와 같아야 하며 마지막 청크만 더 짧을 수 있습니다.
+    마지막 청크를 받으면 업로드를 완료하고 해시 중복 처리를 거쳐 Media를 생성합니다.
+    모든 청크를 받은 뒤 완료만 실패한 경우 offset == size, 길이 0으로 다시 요청하면
+    파트 전송 없이 완료만 재시도합니다.
+    (다음 offset, Media 또는 None)을 반환합니다.
+    """
+    if not cache.add(_lock_key(name), 1, timeout=CHUNK_LOCK_TIMEOUT):
+        raise UploadConflict("이 업로드의 다른 청크가 전송 중입니다.")
+    try:
+        state = _get_state(name)
+        expected = get_upload_offset(state)
+        if offset != expected:
+            raise UploadConflict(f"청크 오프셋이 일치하지 않습니다. (현재 {expected})")
+
+        if offset < state["size"]:
+            _upload_chunk_part(name, state, offset, stream, length)
+            offset += length
+            if offset < state["size"]:
+                return offset, None
+        elif length:
+            raise ValueError("모든 청크를 이미 받았습니다. 완료만 다시 요청하세요.")
+
+        # 완료는 잠금 안에서 처리하여 재시도 요청이 겹쳐도 한 번만 실행되도록 함
+        media, _created = finish_direct_upload(name, state["parts"])
+        return offset, media
+    finally:
+        cache.delete(_lock_key(name))
+
+
+def _upload_chunk_part(name, state, offset, stream, length):
+    """청크 하나를 파트로 전송하고 상태에 기록 (실패 시 상태는 그대로 두어 재전송 가능)"""
+    part_size = state["part_size"]
+    if length != min(part_size, state["size"] - offset):
+        raise ValueError(f"청크 크기는 {part_size} 바이트여야 합니다.")
+
+    # 끊긴 연결은 덜 읽힌 본문으로 나타나며, 이 경우 상태를 바꾸지 않아 재전송 가능
+    body = stream.read(length) if stream else b""
+    if len(body) != length:
+        raise ValueError("청크 본문이 중간에 끊겼습니다.")
+
+    storage = Media._meta.get_field("file").storage
+    try:
+        part = _upload_part(
+            storage.connection.meta.client,
+            storage.bucket_name,
+            storage._normalize_name(name),
+            state["upload_id"],
+            offset // part_size + 1,
+            body,
+            getattr(settings, "MEDIA_MULTIPART_MAX_RETRIES", 3),
+        )
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "NoSuchUpload":
+            cache.delete(_cache_key(name))
+            raise ValueError("만료되었거나 취소된 업로드입니다.")
+        # 일시적인 저장소 오류는 같은 offset으로 다시 보내면 됨
+        raise UploadConflict(f"청크 전송에 실패했습니다. 다시 시도하세요. ({e})")
+    state["parts"].append(part)
+    cache.set(_cache_key(name), state, timeout=UPLOAD_STATE_TIMEOUT)
+
+
+def abort_resumable_upload(name):
+    """전송 중인 업로드를 취소하고 R2에 올라간 파트를 삭제합니다."""
+    state = _get_state(name)
+    storage = Media._meta.get_field("file").storage
+    storage.connection.meta.client.abort_multipart_upload(
+        Bucket=storage.bucket_name,
+        Key=storage._normalize_name(name),
+        UploadId=state["upload_id"],
+    )
+    cache.delete(_cache_key(name))
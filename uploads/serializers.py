@@ -1,9 +1,86 @@
-# uploads/serializers.py
+from django.conf import settings
 from rest_framework import serializers
-from .models import Media
+from .models import Media, MediaRendition
+from .versioning import get_resolver
+
+
+class MediaListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        # 목록 전체의 해시값을 한 번에 등록하여 URL 생성 시 추가 쿼리 방지
+        items = data.all() if hasattr(data, "all") else data
+        get_resolver().prime(items)
+        return super().to_representation(items)
+
+
+class MediaRenditionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = MediaRendition
+        fields = ["file", "format", "width", "height"]
 
 
 class MediaSerializer(serializers.ModelSerializer):
+    # 뷰에서 prefetch_related("...__renditions")로 미리 읽은 행을 사용
+    renditions = MediaRenditionSerializer(many=True, read_only=True)
+    srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = Media
-        fields = ["id", "file", "title"]
+        fields = [
+            "id",
+            "file",
+            "title",
+            "content_type",
+            "byte_size",
+            "width",
+            "height",
+            "duration",
+            "placeholder",
+            "renditions",
+            "srcset",
+        ]
+        list_serializer_class = MediaListSerializer
+
+    def get_srcset(self, obj):
+        """포맷별 srcset 문자열 (예: {"webp": "url 640w, url 1280w"})"""
+        srcset = {}
+        for rendition in obj.renditions.all():
+            srcset.setdefault(rendition.format, []).append(
+                f"{rendition.file.url} {rendition.width}w"
+            )
+        return {fmt: ", ".join(candidates) for fmt, candidates in srcset.items()}
+
+    def to_representation(self, instance):
+        # 이미 로드된 인스턴스의 해시값을 사용하므로 URL 생성 시 DB 조회 없음
+        get_resolver().prime([instance])
+        return super().to_representation(instance)
+
+
+class DirectUploadStartSerializer(serializers.Serializer):
+    filename = serializers.CharField(max_length=200)
+    size = serializers.IntegerField(min_value=1)
+    sha256 = serializers.RegexField(r"^[0-9a-f]{64}$")
+
+    def validate_size(self, value):
+        max_size = getattr(settings, "CKEDITOR_5_MAX_FILE_SIZE", 1024) * 1024 * 1024
+        if value > max_size:
+            raise serializers.ValidationError("허용된 최대 파일 크기를 초과했습니다.")
+        return value
+
+
+class DirectUploadPartSerializer(serializers.Serializer):
+    """멀티파트 업로드 완료 요청의 파트 (S3 CompleteMultipartUpload 형식)"""
+
+    ETag = serializers.CharField(max_length=200)
+    # S3/R2 멀티파트 업로드의 파트 번호 범위
+    PartNumber = serializers.IntegerField(min_value=1, max_value=10000)
+
+
+class DirectUploadCompleteSerializer(serializers.Serializer):
+    key = serializers.CharField()
+    parts = DirectUploadPartSerializer(many=True, required=False)
+
+    def validate_parts(self, value):
+        part_numbers = [part["PartNumber"] for part in value]
+        if len(set(part_numbers)) != len(part_numbers):
+            raise serializers.ValidationError("파트 번호가 중복되었습니다.")
+        return value
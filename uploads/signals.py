@@ -1,13 +1,61 @@
 # 미디어 파일 삭제 시 R2 스토리지에서 실제 파일도 함께 삭제하는 시그널 처리
 # post_delete 이벤트 감지 및 처리
+# Media나 파생 이미지가 바뀌면 media_changed 시그널로 참조하는 콘텐츠에 알림
+from contextlib import contextmanager
+from contextvars import ContextVar
 from django.core.files.storage import default_storage
-from django.db.models.signals import post_delete
-from django.dispatch import receiver
-from .models import Media
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import Signal, receiver
+from .deletion import defer_file_delete
+from .models import Media, MediaRendition
+from .references import delete_references, get_reference_fields, sync_references
+from .versioning import invalidate_media_version
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Media 파일, 파생 이미지, 플레이스홀더, 메타데이터가 바뀌었음을 알리는 시그널
+# 인자: media_ids (변경된 Media id 목록)
+media_changed = Signal()
+
+_pending_media_changes = ContextVar("pending_media_changes", default=None)
+
+
+def notify_media_changed(*media_ids):
+    """
+    media_changed 시그널을 보냅니다.
+    batch_media_changes() 블록 안이면 id를 모아 두었다가 블록이 끝날 때 한 번에 보냅니다.
+    """
+    pending = _pending_media_changes.get()
+    if pending is not None:
+        pending.update(media_ids)
+        return
+    if media_ids:
+        media_changed.send(sender=Media, media_ids=sorted(set(media_ids)))
+
+
+@contextmanager
+def batch_media_changes():
+    """파생 이미지 여러 개를 만드는 작업 등에서 media_changed를 블록 끝에 한 번만 보냄"""
+    pending = set()
+    token = _pending_media_changes.set(pending)
+    try:
+        yield
+    finally:
+        _pending_media_changes.reset(token)
+        notify_media_changed(*pending)
+
+
+def _is_deleting_media(origin):
+    """Media 삭제에 딸려 지워지는 경우인지 (참조 색인도 함께 지워지므로 알릴 필요 없음)"""
+    return isinstance(origin, Media) or getattr(origin, "model", None) is Media
+
 
 @receiver(post_delete, sender=Media)
 def delete_media_file_on_delete(sender, instance, **kwargs):
@@ -19,6 +67,10 @@ def delete_media_file_on_delete(sender, instance, **kwargs):
         return
 
     file_name = instance.file.name
+    invalidate_media_version(file_name)
+    # 대량 삭제 중이면 DeleteObjects로 모아서 삭제하도록 넘김
+    if defer_file_delete(instance.file):
+        return
 
     try:
         # 방법 1: FileField의 delete 메서드 사용
@@ -34,3 +86,98 @@ def delete_media_file_on_delete(sender, instance, **kwargs):
             logger.info(f"파일 삭제 성공(default_storage): {file_name}")
         except Exception as e2:
             logger.error(f"모든 파일 삭제 시도 실패: {file_name} - {e2}")
+
+
+@receiver(post_save, sender=Media)
+def invalidate_media_version_on_save(sender, instance, **kwargs):
+    """Media 저장 시 캐시된 URL 버전(해시값)을 무효화합니다."""
+    if instance.file:
+        invalidate_media_version(instance.file.name)
+
+
+@receiver(post_save, sender=Media)
+def generate_renditions_on_create(sender, instance, created, **kwargs):
+    """새 이미지 Media가 생성되면 커밋 후 파생 이미지 생성 작업을 예약합니다."""
+    from .renditions import is_image
+    from .tasks import generate_media_renditions_async
+
+    if created and instance.file and is_image(instance.file.name):
+        transaction.on_commit(
+            lambda: generate_media_renditions_async.delay(instance.id)
+        )
+
+
+@receiver(post_save, sender=Media)
+def notify_media_change_on_save(sender, instance, created, **kwargs):
+    """기존 Media가 저장되면(플레이스홀더, 메타데이터 등) 참조하는 콘텐츠에 알립니다."""
+    if not created:
+        notify_media_changed(instance.id)
+
+
+@receiver(pre_delete, sender=Media)
+def notify_media_change_on_delete(sender, instance, **kwargs):
+    """
+    Media가 삭제되면 참조하는 콘텐츠에 알립니다.
+    참조 색인이 함께 지워지기 전에 찾아야 하므로 batch_media_changes()와 관계없이 바로 보냅니다.
+    """
+    media_changed.send(sender=Media, media_ids=[instance.id])
+
+
+@receiver(post_save, sender=MediaRendition)
+@receiver(post_delete, sender=MediaRendition)
+def notify_media_change_on_rendition_change(sender, instance, origin=None, **kwargs):
+    """파생 이미지가 추가/삭제되면 원본 Media를 참조하는 콘텐츠에 알립니다."""
+    if not _is_deleting_media(origin):
+        notify_media_changed(instance.media_id)
+
+
+@receiver(post_delete, sender=MediaRendition)
+def delete_rendition_file_on_delete(sender, instance, **kwargs):
+    """파생 이미지 레코드가 삭제되면 스토리지의 파일도 삭제합니다."""
+    if not instance.file or defer_file_delete(instance.file):
+        return
+    try:
+        instance.file.delete(save=False)
+    except Exception as e:
+        logger.error(f"파생 이미지 파일 삭제 실패: {instance.file.name} - {e}")
+
+
+@receiver(post_save)
+def sync_media_references_on_save(sender, instance, raw=False, **kwargs):
+    """Media를 참조하는 모델이 저장되면 해당 객체의 참조 색인만 갱신합니다."""
+    # fixture 로드(raw) 중에는 관련 행이 아직 없을 수 있으므로 건너뜀
+    if raw or not get_reference_fields(sender):
+        return
+    sync_references(instance)
+
+
+@receiver(post_delete)
+def delete_media_references_on_delete(sender, instance, **kwargs):
+    """Media를 참조하는 객체가 삭제되면 참조 색인에서 제거합니다."""
+    if get_reference_fields(sender):
+        delete_references(instance)
+
+
+@receiver(m2m_changed)
+def sync_media_references_on_m2m_change(
+    sender, instance, action, reverse, model, pk_set, **kwargs
+):
+    """Media M2M 필드가 변경되면 원본 객체의 참조 색인을 갱신합니다."""
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        if model is Media and get_reference_fields(type(instance)):
+            sync_references(instance)
+        return
+
+    # Media 쪽에서 변경한 경우(media.<related_name>.add(...)) 상대 객체들을 갱신
+    if isinstance(instance, Media) and get_reference_fields(model):
+        if action == "post_clear":
+            # clear는 pk_set이 없으므로 변경 전 색인에 기록된 객체를 대상으로 함
+            pks = instance.references.filter(
+                source_model=model._meta.label_lower
+            ).values_list("source_pk", flat=True)
+        else:
+            pks = pk_set or []
+        for source in model.objects.filter(pk__in=list(pks)):
+            sync_references(source)
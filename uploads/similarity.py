@@ -0,0 +1,261 @@
+# uploads/similarity.py
+# 지각 해시(dHash)로 다시 내보낸(화질/크기만 다른) 같은 이미지를 찾아 하나로 합치는 기능
+# 해시 간 해밍 거리 검색은 메모리에 만드는 BK-트리로 처리하여 전체 쌍을 비교하지 않음
+import io
+import logging
+from collections import defaultdict
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from PIL import Image
+from .deletion import batch_file_deletes
+from .extractors import replace_media_names
+from .models import Media, MediaReference
+from .references import get_reference_fields
+from .renditions import is_image, open_original
+from .utils import update_media_usage
+
+logger = logging.getLogger(__name__)
+
+# dHash 한 변의 크기 (8이면 64비트 해시)
+HASH_SIZE = 8
+
+
+def dhash(image, size=HASH_SIZE):
+    """
+    이미지의 차이 해시(dHash)를 16진수 문자열로 반환합니다.
+    흑백으로 (size+1)x size 크기로 줄인 뒤 가로로 이웃한 픽셀의 밝기 비교 결과를 비트로 씁니다.
+    """
+    gray = image.convert("L").resize((size + 1, size), Image.Resampling.LANCZOS)
+    pixels = gray.tobytes()
+    bits = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for col in range(size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return f"{bits:0{size * size // 4}x}"
+
+
+def hamming_distance(a, b):
+    return (a ^ b).bit_count()
+
+
+class BKTree:
+    """해밍 거리 기준 BK-트리 (거리 d 이내 검색 시 삼각 부등식으로 하위 트리를 건너뜀)"""
+
+    def __init__(self):
+        self.root = None
+
+    def add(self, value):
+        if self.root is None:
+            self.root = (value, {})
+            return
+        node = self.root
+        while True:
+            distance = hamming_distance(value, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (value, {})
+                return
+            node = child
+
+    def search(self, value, max_distance):
+        """value와의 거리가 max_distance 이하인 값 목록"""
+        if self.root is None:
+            return []
+        found = []
+        stack = [self.root]
+        while stack:
+            node_value, children = stack.pop()
+            distance = hamming_distance(value, node_value)
+            if distance <= max_distance:
+                found.append(node_value)
+            for child_distance, child in children.items():
+                if abs(child_distance - distance) <= max_distance:
+                    stack.append(child)
+        return found
+
+
+def open_hash_source(media):
+    """
+    해시 계산에 쓸 이미지를 엽니다.
+    dHash는 9x8로 줄여 계산하므로 가장 작은 파생 이미지가 있으면 원본 대신 사용합니다.
+    """
+    rendition = media.renditions.order_by("width").first()
+    if rendition is None:
+        return open_original(media)
+    with rendition.file.open("rb") as f:
+        image = Image.open(io.BytesIO(f.read()))
+        image.load()
+    return image
+
+
+def generate_perceptual_hash(media, image=None):
+    """Media의 지각 해시를 계산하여 저장하고 계산 여부를 반환"""
+    if not media.file or not is_image(media.file.name):
+        return False
+
+    image = image or open_hash_source(media)
+    media.perceptual_hash = dhash(image)
+    media.save(update_fields=["perceptual_hash"])
+    return True
+
+
+def get_max_distance(max_distance=None):
+    if max_distance is None:
+        max_distance = getattr(settings, "MEDIA_NEAR_DUPLICATE_DISTANCE", 6)
+    return max_distance
+
+
+def find_near_duplicate_clusters(max_distance=None):
+    """
+    중심 이미지와 지각 해시의 해밍 거리가 max_distance 이하인 이미지 묶음을 찾습니다.
+    Media id 목록의 리스트를 크기가 큰 묶음부터 반환합니다.
+    """
+    max_distance = get_max_distance(max_distance)
+
+    ids_by_hash = defaultdict(list)
+    for media_id, value in (
+        Media.objects.exclude(perceptual_hash="")
+        .values_list("id", "perceptual_hash")
+        .iterator()
+    ):
+        ids_by_hash[int(value, 16)].append(media_id)
+
+    tree = BKTree()
+    for value in ids_by_hash:
+        tree.add(value)
+    neighbors = {value: tree.search(value, max_distance) for value in ids_by_hash}
+
+    # 거리 이내로 이어지는 해시를 모두 묶으면 연쇄로 서로 먼 이미지까지 한 묶음이 되므로
+    # 이웃이 많은 해시부터 중심으로 삼아 아직 묶이지 않은 이웃만 묶음에 넣음
+    clusters = []
+    assigned = set()
+    for center in sorted(neighbors, key=lambda value: (-len(neighbors[value]), value)):
+        if center in assigned:
+            continue
+        members = [value for value in neighbors[center] if value not in assigned]
+        assigned.update(members)
+        media_ids = sorted(
+            media_id for value in members for media_id in ids_by_hash[value]
+        )
+        if len(media_ids) > 1:
+            clusters.append(media_ids)
+    return sorted(clusters, key=len, reverse=True)
+
+
+def split_by_distance(keep, medias, max_distance=None):
+    """
+    keep을 제외한 Media 목록을 keep과의 지각 해시 거리가 max_distance 이하인 것과
+    나머지로 나눕니다. 지각 해시가 없으면 거리를 알 수 없으므로 나머지로 분류합니다.
+    """
+    max_distance = get_max_distance(max_distance)
+    near, far = [], []
+    for media in medias:
+        if media.id == keep.id:
+            continue
+        if keep.perceptual_hash and media.perceptual_hash:
+            distance = hamming_distance(
+                int(keep.perceptual_hash, 16), int(media.perceptual_hash, 16)
+            )
+            if distance <= max_distance:
+                near.append(media)
+                continue
+        far.append(media)
+    return near, far
+
+
+def _repoint_source(model, source_pk, languages, duplicate_ids, keep, replacements):
+    """원본 객체 하나의 FK/M2M/CKEditor 참조를 중복 Media에서 keep으로 바꿔 저장"""
+    # 번역에만 CKEditor 필드가 있는 모델(HomeSection 등)은 원본 모델에 참조 필드가 없음
+    fk_fields, m2m_fields, html_fields = get_reference_fields(model) or ([], [], [])
+    instance = model.objects.select_for_update().get(pk=source_pk)
+
+    changed = False
+    for field in fk_fields:
+        if getattr(instance, field.attname) in duplicate_ids:
+            setattr(instance, field.attname, keep.id)
+            changed = True
+    for field_name in html_fields if "" in languages else []:
+        content = getattr(instance, field_name) or ""
+        replaced = replace_media_names(content, replacements)
+        if replaced != content:
+            setattr(instance, field_name, replaced)
+            changed = True
+    if changed:
+        # save()를 거쳐 참조 색인, 변경 시각, 캐시 무효화 시그널이 그대로 동작하도록 함
+        instance.save()
+
+    for field in m2m_fields:
+        manager = getattr(instance, field.name)
+        present = set(
+            manager.filter(id__in=duplicate_ids).values_list("id", flat=True)
+        )
+        if present:
+            manager.remove(*present)
+            manager.add(keep)
+
+    # parler 번역 행의 CKEditor 필드
+    translated_languages = [language for language in languages if language]
+    if translated_languages and hasattr(instance, "translations"):
+        for translation in instance.translations.filter(
+            language_code__in=translated_languages
+        ):
+            updated_fields = []
+            translation_fields = get_reference_fields(type(translation))
+            for field_name in translation_fields[2] if translation_fields else []:
+                content = getattr(translation, field_name) or ""
+                replaced = replace_media_names(content, replacements)
+                if replaced != content:
+                    setattr(translation, field_name, replaced)
+                    updated_fields.append(field_name)
+            if updated_fields:
+                translation.save()
+
+
+def merge_media(keep, duplicates):
+    """
+    중복 Media를 참조하는 모든 FK/M2M/CKEditor 콘텐츠를 keep으로 바꾸고
+    더 이상 참조되지 않는 중복 Media를 삭제합니다. 모든 변경은 트랜잭션 하나에서 처리하며
+    파일은 커밋 후 DeleteObjects로 일괄 삭제합니다. (삭제 수, 남은 중복 id 목록)을 반환합니다.
+    """
+    duplicates = [media for media in duplicates if media.id != keep.id]
+    duplicate_ids = {media.id for media in duplicates}
+    if not duplicate_ids:
+        return 0, []
+    replacements = {media.file.name: keep.file.name for media in duplicates}
+
+    with batch_file_deletes(), transaction.atomic():
+        languages_by_source = defaultdict(set)
+        for source_model, source_pk, language in MediaReference.objects.filter(
+            media_id__in=duplicate_ids
+        ).values_list("source_model", "source_pk", "language"):
+            languages_by_source[(source_model, source_pk)].add(language)
+
+        for (source_model, source_pk), languages in languages_by_source.items():
+            _repoint_source(
+                apps.get_model(source_model),
+                source_pk,
+                languages,
+                duplicate_ids,
+                keep,
+                replacements,
+            )
+
+        # 파생 이미지 키(srcset) 등 바꿀 수 없는 참조가 남은 Media는 삭제하지 않음
+        remaining_ids = set(
+            MediaReference.objects.filter(media_id__in=duplicate_ids).values_list(
+                "media_id", flat=True
+            )
+        )
+        deleted = Media.objects.filter(id__in=duplicate_ids - remaining_ids).delete()
+        update_media_usage({keep.id} | remaining_ids)
+
+    deleted_count = deleted[1].get(Media._meta.label, 0)
+    logger.info(
+        f"유사 이미지 병합: {keep.file.name} <- {deleted_count}개 삭제, "
+        f"{len(remaining_ids)}개 참조 남음"
+    )
+    return deleted_count, sorted(remaining_ids)
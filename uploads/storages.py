@@ -1,12 +1,32 @@
 # uploads/storages.py
 import os
 from django.conf import settings
+from boto3.s3.transfer import TransferConfig
 from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name
+from .keys import is_immutable
+from .multipart import multipart_upload
+from .streaming import get_part_size
+from .versioning import get_resolver
+
+
+def get_cache_control(content_type):
+    """콘텐츠 타입별 Cache-Control 값을 설정(MEDIA_CACHE_CONTROL)에서 조회"""
+    policies = getattr(settings, "MEDIA_CACHE_CONTROL", {})
+    major_type = (content_type or "").split("/")[0]
+    return (
+        policies.get(content_type)
+        or policies.get(f"{major_type}/*")
+        or policies.get("default", "public, max-age=31536000, immutable")
+    )
 
 
 class BaseR2Storage(S3Boto3Storage):
     """R2 공통 설정을 위한 기본 클래스"""
 
+    multipart_concurrency = getattr(settings, "MEDIA_MULTIPART_CONCURRENCY", 4)
+    multipart_max_retries = getattr(settings, "MEDIA_MULTIPART_MAX_RETRIES", 3)
+
     def __init__(self, *args, **kwargs):
         kwargs["bucket_name"] = getattr(settings, "R2_BUCKET_NAME", "")
         kwargs["region_name"] = getattr(settings, "R2_REGION", "auto")
@@ -14,8 +34,31 @@ class BaseR2Storage(S3Boto3Storage):
         kwargs["access_key"] = getattr(settings, "R2_ACCESS_KEY_ID", "")
         kwargs["secret_key"] = getattr(settings, "R2_SECRET_ACCESS_KEY", "")
         kwargs["file_overwrite"] = False
+        # 일반 업로드(upload_fileobj)도 같은 파트 크기와 동시성으로 멀티파트 전송
+        kwargs["transfer_config"] = TransferConfig(
+            multipart_threshold=get_part_size(),
+            multipart_chunksize=get_part_size(),
+            max_concurrency=self.multipart_concurrency,
+        )
         super().__init__(*args, **kwargs)
 
+    def save_multipart(self, name, parts, content=None):
+        """
+        파트 단위 바이트 청크를 병렬 멀티파트 업로드로 전송합니다.
+        실패한 파트는 재시도하고, 최종 실패 시 업로드를 중단(abort)합니다.
+        """
+        key = self._normalize_name(clean_name(name))
+        multipart_upload(
+            self.connection.meta.client,
+            self.bucket_name,
+            key,
+            parts,
+            params=self._get_write_parameters(key, content),
+            concurrency=self.multipart_concurrency,
+            max_retries=self.multipart_max_retries,
+        )
+        return clean_name(name)
+
 
 class StaticStorage(BaseR2Storage):
     """정적 파일용 스토리지 (/static/)"""
@@ -32,33 +75,27 @@ class MediaStorage(BaseR2Storage):
 
     location = "media"
 
+    def get_available_name(self, name, max_length=None):
+        # 해시 기반/고유 키는 같은 이름이면 같은 내용이므로 존재 확인(HEAD 요청) 생략
+        if is_immutable(name):
+            return name
+        return super().get_available_name(name, max_length)
+
     def url(self, name):
         public_domain = getattr(settings, "MEDIA_PUBLIC_DOMAIN")
-        # Media 객체에서 해당 파일의 해시값 가져오기
+        # 해시 기반/고유 키는 URL 자체가 버전이므로 쿼리스트링 불필요
+        if is_immutable(name):
+            return f"{public_domain}/media/{name}"
+        # 요청 단위 리졸버에서 해시값 조회 (로드된 인스턴스 또는 일괄 IN 쿼리)
         try:
-            # 상대 경로(name)로 Media 객체 필터링
-            from uploads.models import Media
-
-            media = Media.objects.filter(file=name).first()
-            hash_param = (
-                f"?v={media.hash_value[:8]}" if media and media.hash_value else ""
-            )
+            hash_value = get_resolver().get(name)
+            hash_param = f"?v={hash_value[:8]}" if hash_value else ""
         except Exception:
             hash_param = ""
         return f"{public_domain}/media/{name}{hash_param}"
 
-    def _save(self, name, content):
-        name = super()._save(name, content)
-        # 캐시 헤더 설정
-        params = {
-            "ContentType": self.get_object_parameters(name).get("ContentType", ""),
-            "CacheControl": "public, max-age=31536000, immutable",
-        }
-        self.connection.meta.client.copy_object(
-            CopySource={"Bucket": self.bucket_name, "Key": self.location + "/" + name},
-            Bucket=self.bucket_name,
-            Key=self.location + "/" + name,
-            MetadataDirective="REPLACE",
-            **params,
-        )
-        return name
+    def _get_write_parameters(self, name, content=None):
+        # 최초 업로드(PUT/멀티파트) 요청에 ContentType과 CacheControl을 함께 전송
+        params = super()._get_write_parameters(name, content)
+        params.setdefault("CacheControl", get_cache_control(params["ContentType"]))
+        return params
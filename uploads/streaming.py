@@ -0,0 +1,65 @@
+# uploads/streaming.py
+# 대용량 미디어를 한 번만 읽으면서 SHA-256 해시 계산과 R2 멀티파트 업로드를 동시에 수행
+# 메모리 사용량은 파트 크기(MEDIA_MULTIPART_PART_SIZE) 하나로 제한됨
+import hashlib
+from django.conf import settings
+from .keys import unique_name
+
+# S3/R2 멀티파트 업로드의 최소 파트 크기 (마지막 파트 제외)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+def get_part_size():
+    part_size = getattr(settings, "MEDIA_MULTIPART_PART_SIZE", MIN_PART_SIZE)
+    return max(part_size, MIN_PART_SIZE)
+
+
+def iter_file_chunks(file_obj, chunk_size=64 * 1024):
+    """파일 전체를 메모리에 올리지 않고 청크 단위로 읽기"""
+    if hasattr(file_obj, "chunks"):
+        yield from file_obj.chunks()
+        return
+    file_obj.seek(0)
+    while chunk := file_obj.read(chunk_size):
+        yield chunk
+
+
+def iter_hashed_parts(file_obj, part_size, hasher):
+    """읽은 청크로 해시를 갱신하면서 part_size 크기의 파트로 묶어 반환"""
+    buffer = bytearray()
+    yielded = False
+    for chunk in iter_file_chunks(file_obj):
+        hasher.update(chunk)
+        buffer += chunk
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+            yielded = True
+    if buffer or not yielded:
+        yield bytes(buffer)
+
+
+def stream_media_upload(file_obj, storage=None):
+    """
+    파일을 한 번 읽으며 해시 계산과 멀티파트 업로드를 함께 수행합니다.
+    해시를 업로드 후에야 알 수 있으므로 고유 키(u/<uuid>.<ext>)에 저장하고
+    (저장 키, 해시값, 바이트 크기)를 반환합니다.
+    """
+    if storage is None:
+        from .models import Media
+
+        storage = Media._meta.get_field("file").storage
+
+    hasher = hashlib.sha256()
+    size = 0
+
+    def counted(parts):
+        nonlocal size
+        for part in parts:
+            size += len(part)
+            yield part
+
+    name = unique_name(file_obj.name)
+    parts = iter_hashed_parts(file_obj, get_part_size(), hasher)
+    name = storage.save_multipart(name, counted(parts), content=file_obj)
+    return name, hasher.hexdigest(), size
@@ -1,7 +1,30 @@
 # uploads/tasks.py
+import hashlib
 import logging
-from celery import shared_task
-from .utils import update_media_usage, clean_unused_media
+import math
+from celery import chord, shared_task
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Max
+from django.utils import timezone
+from .deletion import batch_file_deletes
+from .gc import (
+    STAGE_DONE,
+    STAGE_SCAN,
+    STAGE_SWEEP,
+    acquire_run_lock,
+    get_last_run_id,
+    get_locked_run_id,
+    get_progress,
+    mark_model_scanned,
+    new_run_id,
+    release_run_lock,
+    reset_scanned,
+    store_progress,
+)
+from .models import Media
+from .signals import batch_media_changes
+from .utils import update_media_usage
 
 logger = logging.getLogger(__name__)
 
@@ -19,17 +42,59 @@ def update_media_usage_async():
 
 
 @shared_task
-def clean_unused_media_async():
-    """사용되지 않는 미디어 파일을 비동기적으로 정리합니다."""
+def scan_media_usage_async():
+    """참조 색인 대신 전체 콘텐츠를 스캔하여 미디어 사용 여부를 다시 계산합니다."""
+    from .usage import scan_media_usage
+
+    try:
+        stats = scan_media_usage()
+        return {"status": "success", **stats}
+    except Exception as e:
+        logger.error(f"미디어 사용 여부 스캔 실패: {e}")
+        return {"status": "error", "message": str(e)}
+
+
+@shared_task
+def rescan_media_references_async(full=False):
+    """마지막 스캔 이후 변경된 콘텐츠만 다시 스캔하여 참조 색인과 사용 여부를 갱신합니다."""
+    from .usage import rescan_changed_references
+
+    try:
+        stats = rescan_changed_references(full=full)
+        return {"status": "success", **stats}
+    except Exception as e:
+        logger.error(f"미디어 참조 증분 스캔 실패: {e}")
+        return {"status": "error", "message": str(e)}
+
+
+@shared_task
+def clean_unused_media_async(resume=True, full=False):
+    """
+    미사용 미디어 정리 워크플로를 시작합니다.
+    모델별 참조 스캔을 병렬로 실행(chord)한 뒤 결과를 병합하고 청크 단위로 삭제하며,
+    이전 실행이 중간에 중단되었다면 새로 시작하지 않고 이어서 진행합니다.
+    기본은 마지막 스캔 이후 변경된 행만 다시 스캔하며, full=True이면 전체 콘텐츠를 스캔합니다.
+    """
     try:
-        # 먼저 사용 여부 체크
-        update_media_usage()
-        # 미사용 파일 정리
-        deleted_count = clean_unused_media()
-        logger.info(f"미사용 미디어 정리 완료: {deleted_count}개 항목 삭제")
-        return {"status": "success", "deleted_count": deleted_count}
+        last_progress = get_progress(get_last_run_id())
+        resuming = resume and last_progress and last_progress["stage"] != STAGE_DONE
+        run_id = last_progress["run_id"] if resuming else new_run_id()
+        # 예약 실행이 진행 중일 때 관리자가 다시 실행해도 같은 작업이 겹치지 않도록 함
+        if not acquire_run_lock(run_id):
+            locked_run_id = get_locked_run_id()
+            logger.info(f"미사용 미디어 정리가 이미 진행 중입니다: {locked_run_id}")
+            return {"status": "skipped", "run_id": locked_run_id}
     except Exception as e:
-        logger.error(f"미사용 미디어 정리 실패: {e}")
+        logger.error(f"미사용 미디어 정리 시작 실패: {e}")
+        return {"status": "error", "message": str(e)}
+
+    try:
+        if resuming:
+            return resume_media_gc(last_progress)
+        return start_media_gc(run_id, full=full)
+    except Exception as e:
+        release_run_lock(run_id)
+        logger.error(f"미사용 미디어 정리 시작 실패: {e}")
         return {"status": "error", "message": str(e)}
 
 
@@ -40,3 +105,291 @@ def clean_unused_media_task():
     Celery Beat에 의해 스케줄링 됨
     """
     return clean_unused_media_async()
+
+
+def start_media_gc(run_id, full=False):
+    from .references import get_reference_models
+
+    labels = [model._meta.label for model in get_reference_models()]
+    # 스캔 도중 업로드된 파일은 아직 참조되지 않았을 수 있으므로 삭제 대상에서 제외
+    max_id = Media.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+    # 같은 run_id로 스캔을 다시 시작하면 이전 시도의 모델 완료 수가 섞이지 않도록 초기화
+    reset_scanned(run_id)
+    store_progress(
+        run_id,
+        stage=STAGE_SCAN,
+        started_at=timezone.now().isoformat(),
+        models_total=len(labels),
+        max_id=max_id,
+        last_id=0,
+        deleted_count=0,
+        chunks_done=0,
+        full=full,
+        error=None,
+    )
+    # 스캔/병합 태스크가 실패하면 삭제 단계에 도달하지 못하므로 errback에서 잠금을 풂
+    chord(scan_media_references_task.s(run_id, label, full) for label in labels)(
+        reduce_media_references_task.s(run_id).on_error(
+            media_gc_failed_task.s(run_id)
+        )
+    )
+    logger.info(f"미사용 미디어 정리 시작: {run_id} ({len(labels)}개 모델)")
+    return {"status": "started", "run_id": run_id}
+
+
+def resume_media_gc(progress):
+    run_id = progress["run_id"]
+    if progress["stage"] == STAGE_SWEEP:
+        # 사용 여부 계산은 끝났으므로 마지막으로 완료된 청크 다음부터 삭제
+        sweep_unused_media_task.delay(run_id)
+    else:
+        start_media_gc(run_id, full=progress.get("full", False))
+    logger.info(f"미사용 미디어 정리 재개: {run_id} ({progress['stage']})")
+    return {"status": "resumed", "run_id": run_id, "stage": progress["stage"]}
+
+
+@shared_task
+def scan_media_references_task(run_id, model_label, full=False):
+    """
+    모델 하나의 참조를 스캔합니다.
+    기본(증분)은 워터마크 이후 변경된 행만 참조 색인에 반영하고 빈 목록을 반환하며,
+    full=True이면 색인과 별개로 전체 행을 스캔하여 사용 중인 Media id 목록을 반환합니다.
+    """
+    from django.apps import apps
+    from .usage import (
+        collect_model_media_ids,
+        get_watermark,
+        rescan_model_references,
+        set_watermark,
+    )
+
+    model = apps.get_model(model_label)
+    if full:
+        media_ids = sorted(collect_model_media_ids(model))
+    else:
+        scanned_at = timezone.now()
+        rescan_model_references(model, since=get_watermark(model))
+        set_watermark(model, scanned_at)
+        media_ids = []
+    mark_model_scanned(run_id)
+    return media_ids
+
+
+@shared_task
+def reduce_media_references_task(results, run_id):
+    """모델별 스캔 결과를 병합하여 is_used_cached를 갱신한 뒤 삭제 단계를 시작합니다."""
+    from .models import MediaReference
+    from .usage import apply_media_usage
+
+    referenced_ids = set().union(*results)
+    # 증분 스캔 결과와 스캔 이후 저장된 콘텐츠의 참조는 참조 색인에 반영되어 있음
+    referenced_ids.update(
+        MediaReference.objects.values_list("media_id", flat=True).distinct()
+    )
+    updated_count = apply_media_usage(referenced_ids)
+
+    progress = get_progress(run_id)
+    chunk_size = getattr(settings, "MEDIA_GC_CHUNK_SIZE", 500)
+    unused_total = Media.objects.filter(
+        is_used_cached=False, id__lte=progress["max_id"]
+    ).count()
+    store_progress(
+        run_id,
+        stage=STAGE_SWEEP,
+        referenced_count=len(referenced_ids),
+        updated_count=updated_count,
+        unused_total=unused_total,
+        chunks_total=math.ceil(unused_total / chunk_size),
+    )
+    sweep_unused_media_task.delay(run_id)
+    return {"status": "success", "run_id": run_id, "updated_count": updated_count}
+
+
+@shared_task
+def media_gc_failed_task(request, exc, traceback, run_id):
+    """
+    참조 스캔 chord(모델별 스캔 또는 병합)가 실패하면 호출되는 errback
+    실패를 진행 상황에 기록하고 실행 잠금을 풀어 다음 실행이 스캔부터 재개하도록 합니다.
+    """
+    try:
+        store_progress(
+            run_id,
+            error=f"{request.task}: {exc}",
+            failed_at=timezone.now().isoformat(),
+        )
+    finally:
+        release_run_lock(run_id)
+    logger.error(f"미사용 미디어 참조 스캔 실패: {run_id} ({request.task}) - {exc}")
+
+
+@shared_task
+def sweep_unused_media_task(run_id):
+    """미사용 Media를 id 순서대로 청크 단위로 삭제하고 청크마다 진행 상황을 기록합니다."""
+    progress = get_progress(run_id)
+    if not progress or progress["stage"] != STAGE_SWEEP:
+        return {"status": "skipped", "run_id": run_id}
+
+    chunk_size = getattr(settings, "MEDIA_GC_CHUNK_SIZE", 500)
+    last_id = progress["last_id"]
+    deleted_count = progress["deleted_count"]
+    chunks_done = progress["chunks_done"]
+    file_errors = progress.get("file_error_count", 0)
+    try:
+        while True:
+            media_ids = list(
+                Media.objects.filter(
+                    is_used_cached=False,
+                    id__gt=last_id,
+                    id__lte=progress["max_id"],
+                )
+                .order_by("id")
+                .values_list("id", flat=True)[:chunk_size]
+            )
+            if not media_ids:
+                break
+            # 스캔 이후 다시 사용된 파일은 시그널로 is_used_cached가 갱신되므로 재확인
+            # 원본/파생 이미지 파일은 청크 단위로 모아 DeleteObjects로 삭제
+            with batch_file_deletes() as file_result:
+                _, deleted = Media.objects.filter(
+                    id__in=media_ids, is_used_cached=False
+                ).delete()
+            # 함께 삭제된 파생 이미지 등은 제외하고 Media 수만 집계
+            deleted_count += deleted.get(Media._meta.label, 0)
+            file_errors += len(file_result["errors"])
+            chunks_done += 1
+            last_id = media_ids[-1]
+            store_progress(
+                run_id,
+                last_id=last_id,
+                deleted_count=deleted_count,
+                file_error_count=file_errors,
+                chunks_done=chunks_done,
+            )
+    except Exception as e:
+        # 잠금을 풀어 다음 실행이 마지막 청크 다음부터 재개할 수 있도록 함
+        release_run_lock(run_id)
+        logger.error(f"미사용 미디어 삭제 중단: {run_id} (마지막 id {last_id}) - {e}")
+        return {"status": "error", "run_id": run_id, "message": str(e)}
+
+    store_progress(run_id, stage=STAGE_DONE, finished_at=timezone.now().isoformat())
+    release_run_lock(run_id)
+    logger.info(f"미사용 미디어 정리 완료: {run_id} ({deleted_count}개 삭제)")
+    return {"status": "success", "run_id": run_id, "deleted_count": deleted_count}
+
+
+def _correct_media_hash(media, hash_value):
+    """해시가 잘못 기록된 Media를 실제 해시로 고치거나 같은 내용의 기존 Media로 병합"""
+    from .similarity import merge_media
+
+    existing = Media.objects.filter(hash_value=hash_value).exclude(pk=media.pk).first()
+    if existing is None:
+        try:
+            with transaction.atomic():
+                media.hash_value = hash_value
+                # save()로 URL 버전(해시값) 캐시와 응답 캐시도 무효화
+                media.save(update_fields=["hash_value"])
+            return {"status": "corrected", "media_id": media.id}
+        except IntegrityError:
+            # 그 사이 같은 내용이 업로드됨
+            existing = Media.objects.get(hash_value=hash_value)
+
+    merge_media(existing, [media])
+    return {"status": "merged", "media_id": existing.id}
+
+
+@shared_task
+def verify_media_hash_async(media_id):
+    """
+    직접 업로드된 파일을 스토리지에서 스트리밍으로 읽어 해시값을 검증합니다.
+    해시가 일치하지 않아도 그 사이 콘텐츠가 이 Media를 참조했을 수 있으므로
+    (Resource.file은 CASCADE) 삭제하지 않고 실제 해시로 고치며,
+    같은 내용의 Media가 이미 있으면 참조를 그쪽으로 옮겨 병합합니다.
+    """
+    try:
+        media = Media.objects.get(id=media_id)
+    except Media.DoesNotExist:
+        return {"status": "error", "message": "Media가 존재하지 않습니다."}
+
+    try:
+        storage = media.file.storage
+        body = storage.connection.meta.client.get_object(
+            Bucket=storage.bucket_name, Key=storage._normalize_name(media.file.name)
+        )["Body"]
+        sha256 = hashlib.sha256()
+        for chunk in body.iter_chunks(chunk_size=1024 * 1024):
+            sha256.update(chunk)
+
+        hash_value = sha256.hexdigest()
+        if hash_value == media.hash_value:
+            return {"status": "success", "media_id": media_id}
+        logger.warning(
+            f"해시 불일치: {media.file.name} - 요청 {media.hash_value}, 실제 {hash_value}"
+        )
+        return _correct_media_hash(media, hash_value)
+    except Exception as e:
+        logger.error(f"미디어 해시 검증 실패: {media_id} - {e}")
+        return {"status": "error", "message": str(e)}
+
+
+@shared_task
+def generate_media_renditions_async(media_id):
+    """
+    이미지 Media의 반응형 파생 이미지(폭별 WebP/AVIF), 플레이스홀더, 지각 해시를 생성합니다.
+    원본은 한 번만 내려받아 모든 작업에 함께 사용합니다.
+    """
+    from .renditions import (
+        generate_placeholder,
+        generate_renditions,
+        is_image,
+        open_original,
+    )
+    from .similarity import generate_perceptual_hash
+
+    try:
+        media = Media.objects.get(id=media_id)
+        if not media.file or not is_image(media.file.name):
+            return {"status": "skipped", "media_id": media_id}
+        image = open_original(media)
+        # 플레이스홀더와 파생 이미지 변경은 작업이 끝난 뒤 한 번만 알림
+        with batch_media_changes():
+            if not media.placeholder:
+                generate_placeholder(media, image=image)
+            if not media.perceptual_hash:
+                generate_perceptual_hash(media, image=image)
+            created_count = generate_renditions(media, image=image)
+        logger.info(f"파생 이미지 생성 완료: {media.file.name} ({created_count}개)")
+        return {"status": "success", "created_count": created_count}
+    except Exception as e:
+        logger.error(f"파생 이미지 생성 실패: {media_id} - {e}")
+        return {"status": "error", "message": str(e)}
+
+
+@shared_task
+def extract_media_metadata_async(media_id):
+    """스토리지의 오브젝트를 Range GET으로 부분만 읽어 메타데이터를 저장합니다."""
+    from .metadata import extract_remote_metadata
+
+    try:
+        media = Media.objects.get(id=media_id)
+        media.apply_metadata(extract_remote_metadata(media))
+        media.save(
+            update_fields=["content_type", "byte_size", "width", "height", "duration"]
+        )
+        return {"status": "success", "media_id": media_id}
+    except Exception as e:
+        logger.error(f"미디어 메타데이터 추출 실패: {media_id} - {e}")
+        return {"status": "error", "message": str(e)}
+
+
+@shared_task
+def reconcile_media_storage_async(delete=False):
+    """버킷과 DB를 대조하여 고아 오브젝트를 보고하거나 삭제합니다."""
+    from .reconcile import reconcile_storage
+
+    try:
+        stats = reconcile_storage(delete=delete)
+        logger.info(f"미디어 스토리지 대조 완료: {stats}")
+        return {"status": "success", **stats}
+    except Exception as e:
+        logger.error(f"미디어 스토리지 대조 실패: {e}")
+        return {"status": "error", "message": str(e)}
@@ -0,0 +1,1485 @@
+import base64
+import hashlib
+import importlib
+import io
+import random
+import struct
+import threading
+from datetime import timedelta
+from unittest import mock
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.utils import timezone
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from PIL import Image
+from rest_framework.test import APIRequestFactory, force_authenticate
+from homepage.models.news_models import News
+from homepage.models.resource_models import Resource
+from . import (
+    deletion,
+    direct,
+    extractors,
+    gc,
+    metadata,
+    multipart,
+    reconcile,
+    renditions,
+    resumable,
+    similarity,
+    streaming,
+    tasks,
+    usage,
+)
+from .bulk import bulk_upload_media
+from .dedup import save_unique_media
+from .keys import (
+    content_addressed_name,
+    is_content_addressed,
+    is_immutable,
+    rendition_name,
+    unique_name,
+)
+from .models import Media, MediaReference, MediaRendition
+from .references import rebuild_media_references
+from .serializers import DirectUploadCompleteSerializer, MediaSerializer
+from .similarity import find_near_duplicate_clusters, merge_media
+from .storages import get_cache_control
+from .utils import clean_unused_media, rewrite_media_references
+from .versioning import (
+    MediaVersionResolver,
+    get_resolver,
+    invalidate_media_version,
+    media_version_scope,
+)
+from .views import (
+    DirectUploadCompleteView,
+    MediaBulkUploadView,
+    ResumableUploadView,
+    handle_media_upload,
+    handle_streaming_media_upload,
+)
+
+HASH_VALUE = "ab" * 32
+
+
+def make_image(width=800, height=400, fmt="PNG"):
+    """테스트용 이미지와 그 파일 바이트"""
+    image = Image.new("RGB", (width, height), (200, 40, 40))
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt)
+    return image, buffer.getvalue()
+
+
+def mp4_box(box_type, body):
+    return struct.pack(">I4s", len(body) + 8, box_type) + body
+
+
+def make_mp4(width=1920, height=1080, duration_ms=12500, rotated=False, mdat=b""):
+    """ftyp, mdat, moov(mvhd, trak/tkhd) 순서의 최소 MP4"""
+    mvhd = struct.pack(">4xIIII", 0, 0, 1000, duration_ms) + bytes(80)
+    a, b = (0, 0x10000) if rotated else (0x10000, 0)
+    matrix = struct.pack(">9i", a, b, 0, -b, a, 0, 0, 0, 0x40000000)
+    tkhd = (
+        struct.pack(">4x5I", 0, 0, 1, 0, duration_ms)
+        + bytes(16)
+        + matrix
+        + struct.pack(">II", width << 16, height << 16)
+    )
+    trak = mp4_box(b"trak", mp4_box(b"tkhd", tkhd))
+    moov = mp4_box(b"moov", mp4_box(b"mvhd", mvhd) + trak)
+    return mp4_box(b"ftyp", b"isom") + mp4_box(b"mdat", mdat) + moov
+
+
+def client_error(code, operation="HeadObject"):
+    return ClientError({"Error": {"Code": code, "Message": code}}, operation)
+
+
+class StorageMockMixin:
+    """Media 스토리지의 boto3 클라이언트와 삭제를 mock으로 바꿈"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.storage = Media._meta.get_field("file").storage
+        self.storage.bucket_name  # LazyObject 초기화
+        # default_storage(LazyObject)가 감싼 실제 스토리지 클래스를 패치
+        storage_class = type(getattr(self.storage, "_wrapped", self.storage))
+        self.s3 = mock.Mock()
+        connection = mock.patch.object(
+            storage_class,
+            "connection",
+            new_callable=mock.PropertyMock,
+            return_value=mock.Mock(meta=mock.Mock(client=self.s3)),
+        )
+        connection.start()
+        self.addCleanup(connection.stop)
+        delete = mock.patch.object(storage_class, "delete")
+        self.storage_delete = delete.start()
+        self.addCleanup(delete.stop)
+
+
+class DirectUploadCompleteSerializerTests(TestCase):
+    def validate(self, parts):
+        return DirectUploadCompleteSerializer(data={"key": "a.png", "parts": parts})
+
+    def test_accepts_parts_and_converts_part_numbers(self):
+        serializer = self.validate([{"ETag": '"e2"', "PartNumber": "2"}])
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data["parts"][0]["PartNumber"], 2)
+
+    def test_rejects_malformed_parts(self):
+        for parts in (
+            [{"PartNumber": 1}],
+            [{"ETag": '"e1"'}],
+            [{"ETag": '"e1"', "PartNumber": "one"}],
+            [{"ETag": '"e1"', "PartNumber": 0}],
+            [{"ETag": '"e1"', "PartNumber": 10001}],
+            [{"ETag": '"e1"', "PartNumber": 1}, {"ETag": '"e2"', "PartNumber": 1}],
+            "not-a-list",
+        ):
+            with self.subTest(parts=parts):
+                self.assertFalse(self.validate(parts).is_valid())
+
+
+class FinishDirectUploadTests(StorageMockMixin, TestCase):
+    def start(self, size=10):
+        with mock.patch.object(direct, "get_part_size", return_value=5):
+            self.s3.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+            return direct.start_direct_upload("a.png", size, HASH_VALUE)["key"]
+
+    def test_unknown_upload_is_rejected(self):
+        with self.assertRaises(ValueError):
+            direct.finish_direct_upload("unknown.png")
+
+    def test_rejected_parts_keep_state_for_retry(self):
+        name = self.start()
+        self.s3.complete_multipart_upload.side_effect = client_error(
+            "InvalidPart", "CompleteMultipartUpload"
+        )
+        with self.assertRaises(ValueError):
+            direct.finish_direct_upload(name, [{"ETag": '"e1"', "PartNumber": 1}])
+        self.assertIsNotNone(cache.get(direct._cache_key(name)))
+        self.assertFalse(Media.objects.exists())
+
+    def test_missing_multipart_object_is_aborted_and_forgotten(self):
+        name = self.start()
+        self.s3.complete_multipart_upload.side_effect = client_error(
+            "NoSuchUpload", "CompleteMultipartUpload"
+        )
+        self.s3.head_object.side_effect = client_error("404")
+        with self.assertRaises(ValueError):
+            direct.finish_direct_upload(name, [{"ETag": '"e1"', "PartNumber": 1}])
+        self.s3.abort_multipart_upload.assert_called_once()
+        self.assertIsNone(cache.get(direct._cache_key(name)))
+
+    def test_size_mismatch_deletes_object(self):
+        name = self.start(size=3)
+        self.s3.head_object.return_value = {"ContentLength": 4}
+        with self.assertRaises(ValueError):
+            direct.finish_direct_upload(name)
+        self.storage_delete.assert_called_once_with(name)
+        self.assertFalse(Media.objects.exists())
+
+    def test_checksum_mismatch_deletes_object(self):
+        name = self.start(size=3)
+        self.s3.head_object.return_value = {
+            "ContentLength": 3,
+            "ChecksumSHA256": direct._sha256_base64("cd" * 32),
+        }
+        with self.assertRaises(ValueError):
+            direct.finish_direct_upload(name)
+        self.storage_delete.assert_called_once_with(name)
+
+    def test_verified_single_put_creates_media(self):
+        name = self.start(size=3)
+        self.s3.head_object.return_value = {
+            "ContentLength": 3,
+            "ContentType": "image/png",
+            "ChecksumSHA256": direct._sha256_base64(HASH_VALUE),
+        }
+        media, created = direct.finish_direct_upload(name)
+        self.assertTrue(created)
+        self.assertEqual(media.file.name, name)
+        self.assertEqual(media.hash_value, HASH_VALUE)
+        self.assertIsNone(cache.get(direct._cache_key(name)))
+
+    def test_duplicate_returns_existing_media_and_deletes_upload(self):
+        existing = Media.objects.create(file="existing.png", hash_value=HASH_VALUE)
+        name = self.start(size=3)
+        self.s3.head_object.return_value = {
+            "ContentLength": 3,
+            "ChecksumSHA256": direct._sha256_base64(HASH_VALUE),
+        }
+        media, created = direct.finish_direct_upload(name)
+        self.assertFalse(created)
+        self.assertEqual(media.pk, existing.pk)
+        self.storage_delete.assert_called_once_with(name)
+        self.assertEqual(Media.objects.count(), 1)
+
+    def test_multipart_parts_are_sent_in_order(self):
+        name = self.start()
+        self.s3.head_object.return_value = {"ContentLength": 10}
+        direct.finish_direct_upload(
+            name,
+            [{"ETag": '"e2"', "PartNumber": 2}, {"ETag": '"e1"', "PartNumber": 1}],
+        )
+        parts = self.s3.complete_multipart_upload.call_args.kwargs["MultipartUpload"]
+        self.assertEqual([part["PartNumber"] for part in parts["Parts"]], [1, 2])
+
+
+class DirectUploadCompleteViewTests(StorageMockMixin, TestCase):
+    def post(self, data):
+        user = get_user_model().objects.create_user(
+            "admin", password="x", is_staff=True
+        )
+        request = APIRequestFactory().post(
+            "/api/uploads/direct/complete/", data, format="json"
+        )
+        force_authenticate(request, user=user)
+        return DirectUploadCompleteView.as_view()(request)
+
+    def test_malformed_parts_answer_400(self):
+        response = self.post({"key": "a.png", "parts": [{"PartNumber": "x"}]})
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_upload_answers_400(self):
+        response = self.post({"key": "unknown.png"})
+        self.assertEqual(response.status_code, 400)
+
+
+class VerifyMediaHashTests(StorageMockMixin, TestCase):
+    content = b"uploaded content"
+
+    def setUp(self):
+        super().setUp()
+        body = mock.Mock()
+        body.iter_chunks.return_value = [self.content]
+        self.s3.get_object.return_value = {"Body": body}
+        self.s3.delete_objects.return_value = {}
+        self.actual_hash = hashlib.sha256(self.content).hexdigest()
+
+    def test_matching_hash_keeps_media(self):
+        media = Media.objects.create(file="a.bin", hash_value=self.actual_hash)
+        result = tasks.verify_media_hash_async(media.id)
+        self.assertEqual(result["status"], "success")
+        self.assertTrue(Media.objects.filter(pk=media.pk).exists())
+
+    def test_mismatch_corrects_hash_without_deleting_references(self):
+        media = Media.objects.create(file="a.bin", hash_value=HASH_VALUE)
+        resource = Resource.objects.create(file=media)
+        result = tasks.verify_media_hash_async(media.id)
+        self.assertEqual(result["status"], "corrected")
+        media.refresh_from_db()
+        self.assertEqual(media.hash_value, self.actual_hash)
+        self.assertTrue(Resource.objects.filter(pk=resource.pk).exists())
+        self.storage_delete.assert_not_called()
+
+    def test_mismatch_merges_into_media_with_actual_hash(self):
+        existing = Media.objects.create(file="b.bin", hash_value=self.actual_hash)
+        media = Media.objects.create(file="a.bin", hash_value=HASH_VALUE)
+        resource = Resource.objects.create(file=media)
+        result = tasks.verify_media_hash_async(media.id)
+        self.assertEqual(result, {"status": "merged", "media_id": existing.id})
+        resource.refresh_from_db()
+        self.assertEqual(resource.file_id, existing.id)
+        self.assertFalse(Media.objects.filter(pk=media.pk).exists())
+
+
+class SaveUniqueMediaTests(StorageMockMixin, TestCase):
+    def test_insert_creates_media_and_sends_post_save(self):
+        receiver = mock.Mock()
+        post_save.connect(receiver, sender=Media)
+        self.addCleanup(post_save.disconnect, receiver, sender=Media)
+        media, created = save_unique_media(Media(file="a.bin", hash_value=HASH_VALUE))
+        self.assertTrue(created)
+        self.assertIsNotNone(media.pk)
+        receiver.assert_called_once()
+        self.assertTrue(receiver.call_args.kwargs["created"])
+
+    def test_losing_insert_returns_winner_and_deletes_its_object(self):
+        # 다른 요청이 같은 해시로 먼저 INSERT한 상태에서 경쟁에 진 경우
+        winner = Media.objects.create(file="winner.bin", hash_value=HASH_VALUE)
+        receiver = mock.Mock()
+        post_save.connect(receiver, sender=Media)
+        self.addCleanup(post_save.disconnect, receiver, sender=Media)
+        media, created = save_unique_media(
+            Media(file="loser.bin", hash_value=HASH_VALUE)
+        )
+        self.assertFalse(created)
+        self.assertEqual(media.pk, winner.pk)
+        self.assertEqual(Media.objects.count(), 1)
+        self.storage_delete.assert_called_once_with("loser.bin")
+        receiver.assert_not_called()
+
+    def test_same_key_is_not_deleted(self):
+        Media.objects.create(file="ab/ab/same.bin", hash_value=HASH_VALUE)
+        save_unique_media(Media(file="ab/ab/same.bin", hash_value=HASH_VALUE))
+        self.storage_delete.assert_not_called()
+
+    def test_media_save_uses_atomic_insert(self):
+        existing = Media.objects.create(file="a.bin", hash_value=HASH_VALUE)
+        media = Media(file="b.bin", hash_value=HASH_VALUE, title="b")
+        with CaptureQueriesContext(connection) as queries:
+            media.save()
+        self.assertTrue(queries[0]["sql"].startswith("INSERT"))
+        self.assertEqual(media.pk, existing.pk)
+        self.assertEqual(media.file.name, "a.bin")
+        self.assertFalse(media._state.adding)
+        self.assertEqual(Media.objects.count(), 1)
+
+    def test_upload_of_known_file_skips_hash_lookup(self):
+        content = b"same bytes"
+        first = handle_media_upload(SimpleUploadedFile("a.txt", content))
+        with CaptureQueriesContext(connection) as queries:
+            second = handle_media_upload(SimpleUploadedFile("b.txt", content))
+        self.assertEqual(first.pk, second.pk)
+        self.assertTrue(queries[0]["sql"].startswith("INSERT"))
+        self.assertEqual(Media.objects.count(), 1)
+
+
+class MediaGarbageCollectionTests(StorageMockMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.s3.delete_objects.return_value = {}
+        self.used = Media.objects.create(file="used.bin", hash_value="11" * 32)
+        self.unused = Media.objects.create(file="unused.bin", hash_value="22" * 32)
+        Resource.objects.create(file=self.used)
+
+    def test_full_run_deletes_only_unused_media(self):
+        result = tasks.clean_unused_media_async(resume=False, full=True)
+        self.assertEqual(result["status"], "started")
+        self.assertEqual(
+            list(Media.objects.values_list("pk", flat=True)), [self.used.pk]
+        )
+        progress = gc.get_progress(result["run_id"])
+        self.assertEqual(progress["stage"], gc.STAGE_DONE)
+        self.assertEqual(progress["deleted_count"], 1)
+        self.assertIsNone(gc.get_locked_run_id())
+        deleted_keys = [
+            item["Key"]
+            for call in self.s3.delete_objects.call_args_list
+            for item in call.kwargs["Delete"]["Objects"]
+        ]
+        self.assertEqual(deleted_keys, [self.storage._normalize_name("unused.bin")])
+
+    def test_media_uploaded_after_scan_start_is_kept(self):
+        def upload_then_sweep(run_id):
+            Media.objects.create(file="late.bin", hash_value="33" * 32)
+            return tasks.sweep_unused_media_task(run_id)
+
+        with mock.patch.object(
+            tasks.sweep_unused_media_task, "delay", side_effect=upload_then_sweep
+        ):
+            tasks.clean_unused_media_async(resume=False, full=True)
+        self.assertTrue(Media.objects.filter(file="late.bin").exists())
+        self.assertFalse(Media.objects.filter(pk=self.unused.pk).exists())
+
+    def test_running_lock_skips_new_run(self):
+        self.assertTrue(gc.acquire_run_lock("other-run"))
+        result = tasks.clean_unused_media_async(resume=False)
+        self.assertEqual(result, {"status": "skipped", "run_id": "other-run"})
+        self.assertTrue(Media.objects.filter(pk=self.unused.pk).exists())
+
+    def test_sweep_resumes_after_last_chunk(self):
+        run_id = gc.new_run_id()
+        gc.store_progress(
+            run_id,
+            stage=gc.STAGE_SWEEP,
+            max_id=self.unused.pk,
+            last_id=self.unused.pk,
+            deleted_count=0,
+            chunks_done=1,
+        )
+        result = tasks.sweep_unused_media_task(run_id)
+        self.assertEqual(result["deleted_count"], 0)
+        self.assertTrue(Media.objects.filter(pk=self.unused.pk).exists())
+
+    def test_chord_failure_releases_lock_and_records_error(self):
+        run_id = gc.new_run_id()
+        gc.acquire_run_lock(run_id)
+        gc.store_progress(run_id, stage=gc.STAGE_SCAN)
+        request = mock.Mock(task="uploads.tasks.scan_media_references_task")
+        tasks.media_gc_failed_task(request, RuntimeError("boom"), None, run_id)
+        self.assertIsNone(gc.get_locked_run_id())
+        progress = gc.get_progress(run_id)
+        self.assertIn("boom", progress["error"])
+        self.assertEqual(progress["stage"], gc.STAGE_SCAN)
+        self.assertIn("boom", gc.format_progress(progress))
+
+    def test_chord_body_has_error_callback(self):
+        with mock.patch.object(tasks, "chord") as chord:
+            tasks.start_media_gc("run-1")
+        body = chord.return_value.call_args.args[0]
+        (errback,) = body.options["link_error"]
+        self.assertEqual(errback["task"], tasks.media_gc_failed_task.name)
+        self.assertEqual(tuple(errback["args"]), ("run-1",))
+
+
+class MediaReferenceRewriteTests(TestCase):
+    def setUp(self):
+        self.domain = settings.MEDIA_PUBLIC_DOMAIN
+
+    def test_replaces_exact_keys_only(self):
+        content = (
+            f'<img src="{self.domain}/media/a.jpg?v=1234abcd" '
+            'srcset="/media/a.jpg 1x, /media/a.jpg.webp 2x">'
+            '<a href="/media/a.jpg#page=2">a.jpg</a>'
+            '<img src="https://other.example.com/media/a.jpg">'
+            "<p>/media/a.jpg</p>"
+        )
+        replaced = extractors.replace_media_names(content, {"a.jpg": "ab/cd/h.jpg"})
+        self.assertEqual(
+            replaced,
+            f'<img src="{self.domain}/media/ab/cd/h.jpg" '
+            'srcset="/media/ab/cd/h.jpg 1x, /media/a.jpg.webp 2x">'
+            '<a href="/media/ab/cd/h.jpg#page=2">a.jpg</a>'
+            '<img src="https://other.example.com/media/a.jpg">'
+            "<p>/media/a.jpg</p>",
+        )
+
+    def test_rewrite_updates_translated_content(self):
+        news = News(date="2024-01-01")
+        news.set_current_language("ko")
+        news.title = "소식"
+        news.content = '<img src="/media/2024/01/01-000000.jpg">'
+        news.save()
+        renamed = {"2024/01/01-000000.jpg": "ab/cd/h.jpg"}
+        self.assertEqual(rewrite_media_references(renamed), 1)
+        self.assertEqual(
+            news.translations.get(language_code="ko").content,
+            '<img src="/media/ab/cd/h.jpg">',
+        )
+        self.assertEqual(rewrite_media_references(renamed), 0)
+
+    def test_migration_copy_matches_extractor(self):
+        migration = importlib.import_module(
+            "uploads.migrations.0006_populate_mediareference"
+        )
+        content = (
+            f'<img src="{self.domain}/media/a.jpg?v=1" srcset="/media/b.jpg 1x, '
+            f'/media/c%20d.jpg 2x"><a href=/media/e.pdf#x>e</a>'
+            '<img src="https://other.example.com/media/f.jpg"><p>/media/g.jpg</p>'
+        )
+        self.assertEqual(
+            migration.extract_media_names(content, extractors.get_media_hosts()),
+            extractors.extract_media_names(content),
+        )
+
+
+class MigrateMediaKeysTests(StorageMockMixin, TestCase):
+    old_name = "2024/01/01-000000.jpg"
+
+    def create_legacy_media(self):
+        """해시값이 기록되지 않은 이전 데이터"""
+        media = Media.objects.create(file=self.old_name)
+        Media.objects.filter(pk=media.pk).update(hash_value=None)
+        return media
+
+    def migrate(self, *args):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("migrate_media_keys", *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue()
+
+    def test_moves_key_and_deletes_old_object_after_commit(self):
+        media = Media.objects.create(file=self.old_name, hash_value=HASH_VALUE)
+        new_name = content_addressed_name(HASH_VALUE, self.old_name)
+        output = self.migrate("--delete-old")
+        self.assertIn("1개 이전", output)
+        media.refresh_from_db()
+        self.assertEqual(media.file.name, new_name)
+        self.s3.copy_object.assert_called_once()
+        self.storage_delete.assert_called_once_with(self.old_name)
+
+    def test_failed_update_deletes_copied_key_and_keeps_old_object(self):
+        other_name = content_addressed_name(HASH_VALUE, "other.png")
+        Media.objects.create(file=other_name, hash_value=HASH_VALUE)
+        media = self.create_legacy_media()
+        with mock.patch.object(Media, "calculate_file_hash", return_value=HASH_VALUE):
+            output = self.migrate("--delete-old")
+        self.assertIn("1개 실패", output)
+        media.refresh_from_db()
+        self.assertEqual(media.file.name, self.old_name)
+        self.storage_delete.assert_called_once_with(
+            content_addressed_name(HASH_VALUE, self.old_name)
+        )
+
+    def test_failed_update_keeps_key_owned_by_other_media(self):
+        new_name = content_addressed_name(HASH_VALUE, self.old_name)
+        Media.objects.create(file=new_name, hash_value=HASH_VALUE)
+        self.create_legacy_media()
+        with mock.patch.object(Media, "calculate_file_hash", return_value=HASH_VALUE):
+            self.migrate("--delete-old")
+        self.storage_delete.assert_not_called()
+
+
+class MergeMediaTests(StorageMockMixin, TestCase):
+    def test_replaces_only_exact_keys_in_content(self):
+        self.s3.delete_objects.return_value = {}
+        keep = Media.objects.create(file="b.jpg", hash_value="11" * 32)
+        duplicate = Media.objects.create(file="a.jpg", hash_value="22" * 32)
+        Media.objects.create(file="a.jpg.webp", hash_value="33" * 32)
+        with self.captureOnCommitCallbacks(execute=True):
+            news = News(date="2024-01-01")
+            news.set_current_language("ko")
+            news.title = "소식"
+            news.content = '<img src="/media/a.jpg"><img src="/media/a.jpg.webp">'
+            news.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            deleted_count, remaining = merge_media(keep, [duplicate])
+        self.assertEqual((deleted_count, remaining), (1, []))
+        self.assertEqual(
+            news.translations.get(language_code="ko").content,
+            '<img src="/media/b.jpg"><img src="/media/a.jpg.webp">',
+        )
+
+
+class NearDuplicateTests(StorageMockMixin, TestCase):
+    def create_media(self, name, perceptual_hash):
+        hash_value = hashlib.sha256(name.encode()).hexdigest()
+        media = Media.objects.create(file=name, hash_value=hash_value)
+        Media.objects.filter(pk=media.pk).update(perceptual_hash=perceptual_hash)
+        media.perceptual_hash = perceptual_hash
+        return media
+
+    def test_clusters_do_not_chain_beyond_max_distance(self):
+        # 이웃한 해시끼리는 거리 6이지만 양 끝은 12 이상 떨어진 사슬
+        chain = [
+            self.create_media(f"{i}.png", f"{value:016x}")
+            for i, value in enumerate((0x0, 0x3F, 0xFFF, 0x3FFFF))
+        ]
+        clusters = find_near_duplicate_clusters(max_distance=6)
+        self.assertEqual(clusters, [[chain[0].id, chain[1].id, chain[2].id]])
+
+    def test_merge_view_skips_duplicates_far_from_keep(self):
+        self.s3.delete_objects.return_value = {}
+        keep = self.create_media("keep.png", f"{0x0:016x}")
+        near = self.create_media("near.png", f"{0x3F:016x}")
+        far = self.create_media("far.png", f"{0xFFF:016x}")
+        user = get_user_model().objects.create_superuser("admin", "a@example.com", "pw")
+        request = RequestFactory().post(
+            "/", {"media": [keep.id, near.id, far.id], "keep": keep.id}
+        )
+        request.user = user
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        admin.site._registry[Media].near_duplicates_view(request)
+        self.assertEqual(
+            set(Media.objects.values_list("id", flat=True)), {keep.id, far.id}
+        )
+        (message,) = [str(m) for m in request._messages]
+        self.assertIn(f"id: {far.id}", message)
+
+
+class ContentAddressedKeyTests(StorageMockMixin, TestCase):
+    def test_key_is_derived_from_hash_and_extension(self):
+        name = content_addressed_name(HASH_VALUE, "사진.JPG")
+        self.assertEqual(name, f"ab/ab/{HASH_VALUE}.jpg")
+        self.assertEqual(
+            content_addressed_name(HASH_VALUE, "README"), f"ab/ab/{HASH_VALUE}"
+        )
+        self.assertEqual(
+            rendition_name(name, 640, "webp"), f"ab/ab/{HASH_VALUE}.w640.webp"
+        )
+
+    def test_immutable_key_formats(self):
+        name = content_addressed_name(HASH_VALUE, "a.png")
+        self.assertTrue(is_content_addressed(name))
+        self.assertTrue(is_immutable(rendition_name(name, 640, "webp")))
+        self.assertTrue(is_immutable(unique_name("video.mp4")))
+        # 디렉터리가 해시 앞부분과 다르거나 이전 날짜 기반 키는 변경 가능한 키
+        self.assertFalse(is_content_addressed(f"cd/ef/{HASH_VALUE}.png"))
+        self.assertFalse(is_immutable("2024/01/01-000000.png"))
+        self.assertFalse(is_immutable(None))
+
+    def test_immutable_keys_skip_exists_probe(self):
+        storage_class = type(getattr(self.storage, "_wrapped", self.storage))
+        with mock.patch.object(storage_class, "exists", return_value=False) as exists:
+            name = content_addressed_name(HASH_VALUE, "a.png")
+            self.assertEqual(self.storage.get_available_name(name), name)
+            exists.assert_not_called()
+            self.storage.get_available_name("2024/01/01-000000.png")
+            exists.assert_called()
+
+    def test_immutable_url_has_no_version_query(self):
+        name = content_addressed_name(HASH_VALUE, "a.png")
+        with self.assertNumQueries(0):
+            url = self.storage.url(name)
+        self.assertEqual(url, f"{settings.MEDIA_PUBLIC_DOMAIN}/media/{name}")
+
+    def test_upload_is_stored_under_content_hash(self):
+        content = b"text bytes"
+        media = handle_media_upload(SimpleUploadedFile("Notes.TXT", content))
+        hash_value = hashlib.sha256(content).hexdigest()
+        self.assertEqual(media.hash_value, hash_value)
+        self.assertEqual(media.file.name, content_addressed_name(hash_value, "x.txt"))
+
+
+class StreamingUploadTests(StorageMockMixin, TestCase):
+    content = b"0123456789ab"
+
+    def setUp(self):
+        super().setUp()
+        self.s3.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        self.s3.upload_part.side_effect = lambda **kwargs: {
+            "ETag": f'"{kwargs["PartNumber"]}"'
+        }
+        part_size = mock.patch.object(streaming, "get_part_size", return_value=5)
+        part_size.start()
+        self.addCleanup(part_size.stop)
+
+    def test_parts_are_cut_while_hashing(self):
+        hasher = hashlib.sha256()
+        file = SimpleUploadedFile("a.bin", self.content)
+        parts = list(streaming.iter_hashed_parts(file, 5, hasher))
+        self.assertEqual(parts, [b"01234", b"56789", b"ab"])
+        self.assertEqual(hasher.hexdigest(), hashlib.sha256(self.content).hexdigest())
+        empty = SimpleUploadedFile("e.bin", b"")
+        self.assertEqual(list(streaming.iter_hashed_parts(empty, 5, hasher)), [b""])
+
+    def test_streaming_upload_hashes_and_uploads_in_one_pass(self):
+        file = SimpleUploadedFile("v.mp4", self.content)
+        media = handle_streaming_media_upload(file)
+        self.assertTrue(is_immutable(media.file.name))
+        self.assertTrue(media.file.name.startswith("u/"))
+        self.assertEqual(media.hash_value, hashlib.sha256(self.content).hexdigest())
+        self.assertEqual(media.byte_size, len(self.content))
+        calls = sorted(
+            self.s3.upload_part.call_args_list, key=lambda c: c.kwargs["PartNumber"]
+        )
+        self.assertEqual(b"".join(c.kwargs["Body"] for c in calls), self.content)
+        completed = self.s3.complete_multipart_upload.call_args.kwargs
+        self.assertEqual(
+            [part["PartNumber"] for part in completed["MultipartUpload"]["Parts"]],
+            [1, 2, 3],
+        )
+
+    def test_duplicate_streaming_upload_reuses_row_and_deletes_object(self):
+        first, second = (
+            handle_streaming_media_upload(SimpleUploadedFile(name, self.content))
+            for name in ("a.mp4", "b.mp4")
+        )
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(Media.objects.count(), 1)
+        (deleted_name,) = self.storage_delete.call_args.args
+        self.assertTrue(deleted_name.startswith("u/"))
+        self.assertNotEqual(deleted_name, first.file.name)
+
+
+@override_settings(MEDIA_MULTIPART_MAX_RETRIES=0)
+class ResumableUploadTests(StorageMockMixin, TestCase):
+    content = b"0123456789ab"
+
+    def setUp(self):
+        super().setUp()
+        self.s3.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        self.s3.upload_part.side_effect = lambda **kwargs: {
+            "ETag": f'"{kwargs["PartNumber"]}"'
+        }
+        self.s3.head_object.return_value = {"ContentLength": len(self.content)}
+        with mock.patch.object(resumable, "get_part_size", return_value=5):
+            self.name = resumable.start_resumable_upload(
+                "video.mp4", len(self.content), HASH_VALUE
+            )["key"]
+
+    def send(self, offset, body=None, length=None):
+        body = self.content[offset : offset + 5] if body is None else body
+        length = len(body) if length is None else length
+        return resumable.upload_chunk(self.name, offset, io.BytesIO(body), length)
+
+    def get_offset(self):
+        return resumable.get_resumable_upload(self.name)["offset"]
+
+    def test_chunks_advance_offset_and_last_chunk_creates_media(self):
+        self.assertEqual(self.send(0), (5, None))
+        self.assertEqual(self.send(5), (10, None))
+        offset, media = self.send(10)
+        self.assertEqual(offset, len(self.content))
+        self.assertEqual(media.file.name, self.name)
+        self.assertEqual(media.hash_value, HASH_VALUE)
+        parts = self.s3.complete_multipart_upload.call_args.kwargs["MultipartUpload"]
+        self.assertEqual([part["PartNumber"] for part in parts["Parts"]], [1, 2, 3])
+
+    def test_wrong_offset_is_a_conflict(self):
+        self.send(0)
+        with self.assertRaises(resumable.UploadConflict):
+            self.send(0)
+        with self.assertRaises(resumable.UploadConflict):
+            self.send(10)
+        self.assertEqual(self.get_offset(), 5)
+
+    def test_interrupted_or_wrong_size_chunk_keeps_offset(self):
+        with self.assertRaises(ValueError):
+            self.send(0, body=b"012", length=5)
+        with self.assertRaises(ValueError):
+            self.send(0, body=b"0123")
+        self.assertEqual(self.get_offset(), 0)
+        self.assertEqual(self.send(0), (5, None))
+
+    def test_storage_error_can_be_retried_at_same_offset(self):
+        self.s3.upload_part.side_effect = [
+            client_error("InternalError", "UploadPart"),
+            {"ETag": '"1"'},
+        ]
+        with self.assertRaises(resumable.UploadConflict):
+            self.send(0)
+        self.assertEqual(self.get_offset(), 0)
+        self.assertEqual(self.send(0), (5, None))
+
+    def test_expired_upload_is_forgotten(self):
+        self.s3.upload_part.side_effect = client_error("NoSuchUpload", "UploadPart")
+        with self.assertRaises(ValueError):
+            self.send(0)
+        with self.assertRaises(ValueError):
+            self.get_offset()
+
+    def test_concurrent_chunk_is_rejected(self):
+        cache.add(resumable._lock_key(self.name), 1)
+        with self.assertRaises(resumable.UploadConflict):
+            self.send(0)
+
+    def test_completion_can_be_retried_with_empty_chunk(self):
+        self.send(0)
+        self.send(5)
+        self.s3.complete_multipart_upload.side_effect = client_error(
+            "InternalError", "CompleteMultipartUpload"
+        )
+        with self.assertRaises(ValueError):
+            self.send(10)
+        self.assertEqual(self.get_offset(), len(self.content))
+        self.s3.complete_multipart_upload.side_effect = None
+        offset, media = self.send(len(self.content), body=b"")
+        self.assertEqual(offset, len(self.content))
+        self.assertEqual(media.file.name, self.name)
+
+    def test_patch_view_reports_offset_and_conflict(self):
+        user = get_user_model().objects.create_user(
+            "admin", password="x", is_staff=True
+        )
+
+        def patch(offset, body):
+            request = APIRequestFactory().patch(
+                "/",
+                body,
+                content_type="application/offset+octet-stream",
+                HTTP_UPLOAD_OFFSET=str(offset),
+            )
+            force_authenticate(request, user=user)
+            return ResumableUploadView.as_view()(request, key=self.name)
+
+        response = patch(0, self.content[:5])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Upload-Offset"], "5")
+        self.assertEqual(patch(0, self.content[:5]).status_code, 409)
+
+
+class MediaVersionResolverTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.storage = Media._meta.get_field("file").storage
+        self.medias = [
+            Media.objects.create(
+                file=f"2024/01/0{i}-000000.png", hash_value=f"{i}" * 64
+            )
+            for i in range(1, 4)
+        ]
+        self.names = [media.file.name for media in self.medias]
+
+    def test_deferred_names_are_resolved_in_one_query(self):
+        resolver = MediaVersionResolver(use_cache=False)
+        resolver.defer(self.names + ["missing.png"])
+        with self.assertNumQueries(1):
+            resolver.resolve()
+            versions = [resolver.get(name) for name in self.names]
+        self.assertEqual(versions, [media.hash_value for media in self.medias])
+        with self.assertNumQueries(0):
+            self.assertEqual(resolver.get("missing.png"), "")
+
+    def test_primed_instances_build_urls_without_queries(self):
+        with media_version_scope(use_cache=False):
+            get_resolver().prime(self.medias)
+            with self.assertNumQueries(0):
+                urls = [self.storage.url(name) for name in self.names]
+        self.assertTrue(urls[0].endswith(f"{self.names[0]}?v=11111111"))
+
+    def test_scope_shares_one_resolver(self):
+        with media_version_scope(use_cache=False):
+            with self.assertNumQueries(1):
+                for _ in range(2):
+                    self.storage.url(self.names[0])
+
+    @override_settings(MEDIA_VERSION_CACHE_ENABLED=True)
+    def test_cached_versions_skip_the_database(self):
+        MediaVersionResolver().get(self.names[0])
+        with self.assertNumQueries(0):
+            self.assertEqual(MediaVersionResolver().get(self.names[0]), "1" * 64)
+        invalidate_media_version(self.names[0])
+        with self.assertNumQueries(1):
+            MediaVersionResolver().get(self.names[0])
+
+
+class CacheControlTests(StorageMockMixin, TestCase):
+    @override_settings(
+        MEDIA_CACHE_CONTROL={
+            "image/svg+xml": "public, max-age=60",
+            "image/*": "public, max-age=3600",
+            "default": "no-cache",
+        }
+    )
+    def test_policy_is_looked_up_by_exact_then_major_type(self):
+        self.assertEqual(get_cache_control("image/svg+xml"), "public, max-age=60")
+        self.assertEqual(get_cache_control("image/png"), "public, max-age=3600")
+        self.assertEqual(get_cache_control("application/pdf"), "no-cache")
+        self.assertEqual(get_cache_control(None), "no-cache")
+
+    def test_cache_control_is_sent_with_the_first_upload(self):
+        storage_class = type(getattr(self.storage, "_wrapped", self.storage))
+        with mock.patch.object(
+            storage_class, "bucket", new_callable=mock.PropertyMock
+        ) as bucket:
+            handle_media_upload(SimpleUploadedFile("notes.txt", b"text"))
+        upload = bucket.return_value.Object.return_value.upload_fileobj
+        params = upload.call_args.kwargs["ExtraArgs"]
+        self.assertEqual(params["ContentType"], "text/plain")
+        self.assertEqual(params["CacheControl"], get_cache_control("text/plain"))
+        self.s3.copy_object.assert_not_called()
+
+
+class MultipartUploadTests(TestCase):
+    def setUp(self):
+        self.s3 = mock.Mock()
+        self.s3.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        self.s3.upload_part.side_effect = lambda **kwargs: {
+            "ETag": f'"{kwargs["PartNumber"]}"'
+        }
+        sleep = mock.patch.object(multipart.time, "sleep")
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def upload(self, parts, **kwargs):
+        return multipart.multipart_upload(
+            self.s3, "bucket", "key", parts, {"ContentType": "video/mp4"}, **kwargs
+        )
+
+    def test_parts_are_completed_in_order(self):
+        self.assertEqual(self.upload([b"a", b"b", b"c"], concurrency=3), "upload-1")
+        self.s3.create_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="key", ContentType="video/mp4"
+        )
+        completed = self.s3.complete_multipart_upload.call_args.kwargs
+        self.assertEqual(
+            completed["MultipartUpload"]["Parts"],
+            [{"ETag": f'"{i}"', "PartNumber": i} for i in (1, 2, 3)],
+        )
+
+    def test_failed_part_is_retried(self):
+        responses = iter([RuntimeError("timeout"), {"ETag": '"1"'}])
+
+        def upload_part(**kwargs):
+            response = next(responses)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        self.s3.upload_part.side_effect = upload_part
+        self.upload([b"a"], max_retries=1)
+        self.assertEqual(self.s3.upload_part.call_count, 2)
+        self.s3.abort_multipart_upload.assert_not_called()
+
+    def test_exhausted_retries_abort_the_upload(self):
+        self.s3.upload_part.side_effect = RuntimeError("timeout")
+        with self.assertRaises(RuntimeError):
+            self.upload([b"a", b"b"], max_retries=2)
+        self.s3.complete_multipart_upload.assert_not_called()
+        self.s3.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="key", UploadId="upload-1"
+        )
+
+    def test_reading_stops_after_a_failed_part(self):
+        self.s3.upload_part.side_effect = RuntimeError("timeout")
+        read = []
+
+        def parts():
+            for i in range(100):
+                read.append(i)
+                yield b"x"
+
+        with self.assertRaises(RuntimeError):
+            self.upload(parts(), concurrency=1, max_retries=0)
+        self.assertLess(len(read), 100)
+
+    def test_parts_in_flight_are_bounded_by_concurrency(self):
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def upload_part(**kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            threading.Event().wait(0.01)
+            with lock:
+                in_flight -= 1
+            return {"ETag": '"e"'}
+
+        self.s3.upload_part.side_effect = upload_part
+        self.upload([b"x"] * 12, concurrency=3)
+        self.assertLessEqual(peak, 3)
+
+
+@override_settings(
+    MEDIA_RENDITION_WIDTHS=[1024, 320, 640], MEDIA_RENDITION_FORMATS=["jpeg"]
+)
+class RenditionTests(StorageMockMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        storage_class = type(getattr(self.storage, "_wrapped", self.storage))
+        save = mock.patch.object(
+            storage_class, "_save", side_effect=lambda name, content: name
+        )
+        self.storage_save = save.start()
+        self.addCleanup(save.stop)
+        self.image, _ = make_image()
+        self.media = Media.objects.create(
+            file=content_addressed_name(HASH_VALUE, "a.png"), hash_value=HASH_VALUE
+        )
+
+    def test_renditions_are_stored_next_to_the_original(self):
+        self.assertEqual(renditions.generate_renditions(self.media, self.image), 2)
+        rows = list(self.media.renditions.order_by("width"))
+        self.assertEqual(
+            [(r.file.name, r.width, r.height) for r in rows],
+            [
+                (rendition_name(self.media.file.name, 320, "jpeg"), 320, 160),
+                (rendition_name(self.media.file.name, 640, "jpeg"), 640, 320),
+            ],
+        )
+        content = self.storage_save.call_args.args[1]
+        self.assertEqual(content.content_type, "image/jpeg")
+
+    def test_existing_renditions_are_not_regenerated(self):
+        renditions.generate_renditions(self.media, self.image)
+        self.assertEqual(renditions.generate_renditions(self.media, self.image), 0)
+        self.assertEqual(self.media.renditions.count(), 2)
+
+    def test_non_images_and_animations_are_skipped(self):
+        document = Media.objects.create(file="a.pdf", hash_value="cd" * 32)
+        self.assertEqual(renditions.generate_renditions(document), 0)
+        frames = [Image.new("RGB", (800, 400), color) for color in ("red", "blue")]
+        buffer = io.BytesIO()
+        frames[0].save(buffer, format="GIF", save_all=True, append_images=frames[1:])
+        animated = Image.open(io.BytesIO(buffer.getvalue()))
+        self.assertEqual(renditions.generate_renditions(self.media, animated), 0)
+
+    def test_task_reads_original_once_and_serializer_lists_srcset(self):
+        with mock.patch.object(
+            renditions, "open_original", return_value=self.image
+        ) as open_original:
+            result = tasks.generate_media_renditions_async(self.media.id)
+        self.assertEqual(result, {"status": "success", "created_count": 2})
+        open_original.assert_called_once()
+        data = MediaSerializer(Media.objects.get(pk=self.media.pk)).data
+        self.assertEqual(
+            [url.split()[-1] for url in data["srcset"]["jpeg"].split(", ")],
+            ["320w", "640w"],
+        )
+
+
+class MediaMetadataTests(StorageMockMixin, TestCase):
+    def test_image_dimensions_follow_exif_orientation(self):
+        image = Image.new("RGB", (80, 40))
+        exif = image.getexif()
+        exif[0x0112] = 6
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", exif=exif)
+        result = metadata.extract_metadata(buffer, "photo.jpg", size=10)
+        self.assertEqual(
+            result,
+            {
+                "content_type": "image/jpeg",
+                "byte_size": 10,
+                "width": 40,
+                "height": 80,
+                "duration": None,
+            },
+        )
+
+    def test_mp4_dimensions_and_duration_come_from_moov(self):
+        result = metadata.extract_metadata(io.BytesIO(make_mp4()), "clip.mp4")
+        self.assertEqual((result["width"], result["height"]), (1920, 1080))
+        self.assertEqual(result["duration"], 12.5)
+        rotated = metadata.extract_metadata(
+            io.BytesIO(make_mp4(rotated=True)), "clip.mov"
+        )
+        self.assertEqual((rotated["width"], rotated["height"]), (1080, 1920))
+
+    def test_broken_file_does_not_fail_extraction(self):
+        result = metadata.extract_metadata(io.BytesIO(b"not an image"), "a.png")
+        self.assertEqual(result["content_type"], "image/png")
+        self.assertIsNone(result["width"])
+
+    def test_remote_extraction_reads_only_needed_ranges(self):
+        content = make_mp4(mdat=bytes(1024 * 1024))
+        self.s3.head_object.return_value = {
+            "ContentLength": len(content),
+            "ContentType": "video/mp4",
+        }
+        ranges = []
+
+        def get_object(Range, **kwargs):
+            start, end = map(int, Range.removeprefix("bytes=").split("-"))
+            ranges.append(end - start + 1)
+            return {"Body": io.BytesIO(content[start : end + 1])}
+
+        self.s3.get_object.side_effect = get_object
+        media = Media.objects.create(file="clip.mp4", hash_value=HASH_VALUE)
+        result = metadata.extract_remote_metadata(media)
+        self.assertEqual(result["duration"], 12.5)
+        self.assertEqual(result["byte_size"], len(content))
+        self.assertLess(sum(ranges), len(content) // 4)
+
+    def test_upload_stores_metadata(self):
+        _, content = make_image(64, 32)
+        media = handle_media_upload(SimpleUploadedFile("a.png", content))
+        media.refresh_from_db()
+        self.assertEqual(
+            (media.content_type, media.byte_size, media.width, media.height),
+            ("image/png", len(content), 64, 32),
+        )
+
+
+class PlaceholderTests(TestCase):
+    def decode(self, placeholder):
+        header, encoded = placeholder.split(",", 1)
+        self.assertRegex(header, r"^data:image/(webp|jpeg);base64$")
+        return Image.open(io.BytesIO(base64.b64decode(encoded)))
+
+    @override_settings(MEDIA_PLACEHOLDER_SIZE=16)
+    def test_placeholder_is_a_small_data_uri(self):
+        image, _ = make_image(800, 400)
+        thumbnail = self.decode(renditions.build_placeholder(image))
+        self.assertEqual(thumbnail.size, (16, 8))
+
+    def test_placeholder_is_saved_once_per_image(self):
+        media = Media.objects.create(file="a.png", hash_value=HASH_VALUE)
+        image, _ = make_image(40, 40)
+        self.assertTrue(renditions.generate_placeholder(media, image))
+        placeholder = Media.objects.get(pk=media.pk).placeholder
+        self.decode(placeholder)
+        document = Media.objects.create(file="a.pdf", hash_value="cd" * 32)
+        self.assertFalse(renditions.generate_placeholder(document))
+
+        media.refresh_from_db()
+        with mock.patch.object(
+            renditions, "open_original", return_value=image
+        ), mock.patch.object(renditions, "generate_placeholder") as generate:
+            tasks.generate_media_renditions_async(media.id)
+        generate.assert_not_called()
+
+
+class MediaReferenceIndexTests(TestCase):
+    def setUp(self):
+        self.image = Media.objects.create(file="image.png", hash_value="11" * 32)
+        self.inline = Media.objects.create(file="inline.png", hash_value="22" * 32)
+        self.news = News(date="2024-01-01", main_image=self.image)
+        self.news.set_current_language("ko")
+        self.news.title = "소식"
+        self.news.content = '<img src="/media/inline.png">'
+        self.news.save()
+
+    def get_index(self):
+        return set(
+            MediaReference.objects.values_list(
+                "source_model", "source_pk", "field", "language", "media_id"
+            )
+        )
+
+    def get_usage(self):
+        return dict(Media.objects.values_list("file", "is_used_cached"))
+
+    def test_save_indexes_fk_and_translated_content(self):
+        self.assertEqual(
+            self.get_index(),
+            {
+                ("homepage.news", self.news.pk, "main_image", "", self.image.id),
+                ("homepage.news", self.news.pk, "content", "ko", self.inline.id),
+            },
+        )
+        self.assertEqual(self.get_usage(), {"image.png": True, "inline.png": True})
+
+    def test_edit_updates_only_changed_references(self):
+        self.news.content = "<p>이미지 없음</p>"
+        self.news.save()
+        self.assertEqual(
+            self.get_index(),
+            {("homepage.news", self.news.pk, "main_image", "", self.image.id)},
+        )
+        self.assertEqual(self.get_usage(), {"image.png": True, "inline.png": False})
+
+    def test_delete_removes_references(self):
+        self.news.translations.get(language_code="ko").delete()
+        self.assertEqual(len(self.get_index()), 1)
+        self.news.delete()
+        self.assertEqual(self.get_index(), set())
+        self.assertEqual(self.get_usage(), {"image.png": False, "inline.png": False})
+
+    def test_rebuild_restores_index(self):
+        expected = self.get_index()
+        MediaReference.objects.all().delete()
+        rebuild_media_references()
+        self.assertEqual(self.get_index(), expected)
+
+
+class MediaUsageScanTests(TestCase):
+    def create_news(self, image, content=""):
+        news = News(date="2024-01-01", main_image=image)
+        news.set_current_language("ko")
+        news.title = "소식"
+        news.content = content
+        news.save()
+        return news
+
+    def create_media(self, count):
+        start = Media.objects.count()
+        return [
+            Media.objects.create(file=f"{i}.png", hash_value=f"{i:064x}")
+            for i in range(start, start + count)
+        ]
+
+    def scan(self):
+        # 색인과 is_used_cached를 일부러 틀리게 만든 뒤 전체 스캔으로 다시 계산
+        MediaReference.objects.all().delete()
+        Media.objects.update(is_used_cached=False)
+        Media.objects.filter(file="stale.png").update(is_used_cached=True)
+        return usage.scan_media_usage()
+
+    def test_scan_flags_media_referenced_by_fields_and_content(self):
+        image, inline, unused = self.create_media(3)
+        stale = Media.objects.create(file="stale.png", hash_value="ff" * 32)
+        self.create_news(image, f'<img src="/media/{inline.file.name}">')
+        stats = self.scan()
+        usage_flags = dict(Media.objects.values_list("id", "is_used_cached"))
+        self.assertEqual(
+            usage_flags,
+            {image.id: True, inline.id: True, unused.id: False, stale.id: False},
+        )
+        self.assertEqual(stats["referenced_count"], 2)
+        self.assertEqual(stats["updated_count"], 3)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        Media.objects.create(file="stale.png", hash_value="ff" * 32)
+        for media in self.create_media(2):
+            self.create_news(media, '<img src="/media/0.png">')
+        baseline = self.scan()["queries"]
+        for media in self.create_media(20):
+            self.create_news(media, f'<img src="/media/{media.file.name}">')
+        self.assertEqual(self.scan()["queries"], baseline)
+
+
+class MediaExtractorTests(TestCase):
+    def test_extracts_keys_from_every_url_attribute(self):
+        domain = settings.MEDIA_PUBLIC_DOMAIN
+        content = (
+            f'<img src="{domain}/media/ab/cd/a.png?v=1234abcd" '
+            "srcset='/media/a.w320.webp 320w, /media/a.w640.webp 640w'>"
+            '<a href=/media/docs/%EC%95%88%EB%82%B4.pdf#page=2>안내</a>'
+            '<video poster="/media/poster.jpg" data-src="/media/clip.mp4?x=1&amp;y=2">'
+            '<img src="https://other.example.com/media/external.png">'
+            '<img src="/static/media/not-media.png">'
+            "<p>/media/plain-text.png</p>"
+        )
+        self.assertEqual(
+            extractors.extract_media_names(content),
+            {
+                "ab/cd/a.png",
+                "a.w320.webp",
+                "a.w640.webp",
+                "docs/안내.pdf",
+                "poster.jpg",
+                "clip.mp4",
+            },
+        )
+
+    def test_content_without_media_is_skipped(self):
+        self.assertEqual(extractors.extract_media_names(None), set())
+        self.assertEqual(extractors.extract_media_names('<img src="/a.png">'), set())
+
+    def test_iterates_only_rows_with_media(self):
+        for content in ('<img src="/media/a.png">', "<p>텍스트</p>"):
+            news = News(date="2024-01-01")
+            news.set_current_language("ko")
+            news.title = "소식"
+            news.content = content
+            news.save()
+        translation_model = News._parler_meta.root_model
+        rows = list(extractors.iter_content_media_names(translation_model, "content"))
+        self.assertEqual([names for _pk, names in rows], [{"a.png"}])
+
+
+class BatchedDeleteTests(StorageMockMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.s3.delete_objects.return_value = {}
+
+    def get_deleted_keys(self):
+        return [
+            [item["Key"] for item in call.kwargs["Delete"]["Objects"]]
+            for call in self.s3.delete_objects.call_args_list
+        ]
+
+    def test_keys_are_sent_in_batches_of_1000(self):
+        names = [f"{i:04d}.png" for i in range(2500)]
+        self.s3.delete_objects.side_effect = lambda **kwargs: {
+            "Errors": [{"Key": "media/0007.png", "Code": "AccessDenied"}]
+            if {"Key": "media/0007.png"} in kwargs["Delete"]["Objects"]
+            else []
+        }
+        deleted_count, errors = deletion.delete_files(
+            [(self.storage, name) for name in names]
+        )
+        batches = self.get_deleted_keys()
+        self.assertEqual(sorted(len(batch) for batch in batches), [500, 1000, 1000])
+        self.assertEqual(
+            sorted(key for batch in batches for key in batch),
+            [f"media/{name}" for name in names],
+        )
+        self.assertEqual(deleted_count, 2499)
+        self.assertEqual(list(errors), ["0007.png"])
+
+    def test_cleanup_deletes_files_in_one_request(self):
+        for i in range(3):
+            Media.objects.create(file=f"{i}.png", hash_value=f"{i}" * 64)
+        self.assertEqual(clean_unused_media(), (0, 3))
+        self.storage_delete.assert_not_called()
+        self.assertEqual(
+            self.get_deleted_keys(), [["media/0.png", "media/1.png", "media/2.png"]]
+        )
+
+    def test_failed_block_deletes_no_files(self):
+        Media.objects.create(file="a.png", hash_value=HASH_VALUE)
+        with self.assertRaises(RuntimeError):
+            with deletion.batch_file_deletes():
+                Media.objects.all().delete()
+                raise RuntimeError("rollback")
+        self.s3.delete_objects.assert_not_called()
+        self.storage_delete.assert_not_called()
+
+
+class ReconcileStorageTests(StorageMockMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.s3.delete_objects.return_value = {}
+        media = Media.objects.create(file="a.png", hash_value="11" * 32)
+        Media.objects.create(file="Z.png", hash_value="22" * 32)
+        Media.objects.create(file="c.png", hash_value="33" * 32)
+        MediaRendition.objects.create(
+            media=media,
+            file="a.w320.webp",
+            format="webp",
+            width=320,
+            height=160,
+            size=1,
+        )
+        old = timezone.now() - timedelta(days=7)
+        new = timezone.now()
+        pages = [
+            {"Contents": [{"Key": "media/Z.png", "LastModified": old}]},
+            {
+                "Contents": [
+                    {"Key": f"media/{name}", "LastModified": modified}
+                    for name, modified in (
+                        ("a.png", old),
+                        ("a.w320.webp", old),
+                        ("orphan-new.png", new),
+                        ("orphan-old.png", old),
+                    )
+                ]
+            },
+        ]
+        self.s3.get_paginator.return_value.paginate.return_value = pages
+
+    def test_db_names_stream_in_byte_order(self):
+        self.assertEqual(
+            list(reconcile.iter_db_names()), ["Z.png", "a.png", "a.w320.webp", "c.png"]
+        )
+
+    def test_report_counts_orphans_without_deleting(self):
+        stats = reconcile.reconcile_storage()
+        self.assertEqual(
+            stats,
+            {
+                "scanned_count": 5,
+                "orphan_count": 1,
+                "recent_orphan_count": 1,
+                "missing_count": 1,
+                "deleted_count": 0,
+                "error_count": 0,
+            },
+        )
+        self.s3.delete_objects.assert_not_called()
+
+    def test_delete_removes_only_old_orphans(self):
+        stats = reconcile.reconcile_storage(delete=True)
+        self.assertEqual(stats["deleted_count"], 1)
+        (call,) = self.s3.delete_objects.call_args_list
+        self.assertEqual(
+            call.kwargs["Delete"]["Objects"], [{"Key": "media/orphan-old.png"}]
+        )
+        self.assertEqual(Media.objects.count(), 3)
+
+
+class IncrementalRescanTests(TestCase):
+    def setUp(self):
+        self.image = Media.objects.create(file="image.png", hash_value="11" * 32)
+        self.news = []
+        for title in ("첫 소식", "둘째 소식"):
+            news = News(date="2024-01-01")
+            news.set_current_language("ko")
+            news.title = title
+            news.content = ""
+            news.save()
+            self.news.append(news)
+        usage.rescan_changed_references(full=True)
+
+    def edit_without_signals(self, news, updated_at):
+        """시그널 없이 바뀐 콘텐츠 (update(), 데이터 이전 등)"""
+        News._parler_meta.root_model.objects.filter(master=news).update(
+            content='<img src="/media/image.png">'
+        )
+        News.objects.filter(pk=news.pk).update(updated_at=updated_at)
+
+    def get_sources(self):
+        return set(
+            MediaReference.objects.filter(media=self.image).values_list(
+                "source_pk", flat=True
+            )
+        )
+
+    def test_rescan_picks_up_rows_changed_after_watermark(self):
+        recent, old = self.news
+        self.edit_without_signals(recent, timezone.now())
+        self.edit_without_signals(old, timezone.now() - timedelta(days=1))
+        stats = usage.rescan_changed_references()
+        self.assertEqual(self.get_sources(), {recent.pk})
+        self.assertEqual(stats["changed_count"], 1)
+        self.assertTrue(Media.objects.get(pk=self.image.pk).is_used_cached)
+        # 전체 재스캔은 워터마크와 관계없이 모든 행을 확인
+        usage.rescan_changed_references(full=True)
+        self.assertEqual(self.get_sources(), {recent.pk, old.pk})
+
+    def test_rescan_prunes_references_of_deleted_sources(self):
+        MediaReference.objects.create(
+            source_model="homepage.news",
+            source_pk=self.news[-1].pk + 100,
+            field="main_image",
+            media=self.image,
+        )
+        Media.objects.filter(pk=self.image.pk).update(is_used_cached=True)
+        usage.rescan_changed_references()
+        self.assertEqual(self.get_sources(), set())
+        self.assertFalse(Media.objects.get(pk=self.image.pk).is_used_cached)
+
+
+class BulkUploadTests(StorageMockMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        storage_class = type(getattr(self.storage, "_wrapped", self.storage))
+        save = mock.patch.object(
+            storage_class, "_save", side_effect=lambda name, content: name
+        )
+        self.storage_save = save.start()
+        self.addCleanup(save.stop)
+        self.existing = Media.objects.create(
+            file="existing.txt", hash_value=hashlib.sha256(b"old").hexdigest()
+        )
+
+    def files(self, *contents):
+        return [
+            SimpleUploadedFile(f"{i}.txt", content)
+            for i, content in enumerate(contents)
+        ]
+
+    def test_results_keep_input_order_and_merge_duplicates(self):
+        receiver = mock.Mock()
+        post_save.connect(receiver, sender=Media)
+        self.addCleanup(post_save.disconnect, receiver, sender=Media)
+        medias = bulk_upload_media(self.files(b"a", b"b", b"a", b"old"))
+        self.assertEqual(medias[0].pk, medias[2].pk)
+        self.assertEqual(medias[3].pk, self.existing.pk)
+        self.assertEqual(
+            [media.hash_value for media in medias[:2]],
+            [hashlib.sha256(b"a").hexdigest(), hashlib.sha256(b"b").hexdigest()],
+        )
+        self.assertEqual(Media.objects.count(), 3)
+        self.assertEqual(self.storage_save.call_count, 2)
+        self.assertEqual(receiver.call_count, 2)
+
+    def test_concurrent_insert_falls_back_to_upsert(self):
+        # 해시 조회 뒤 다른 요청이 같은 파일을 먼저 저장한 경우
+        with mock.patch.object(Media.objects, "in_bulk", return_value={}):
+            medias = bulk_upload_media(self.files(b"old", b"new"))
+        self.assertEqual(medias[0].pk, self.existing.pk)
+        self.assertEqual(Media.objects.count(), 2)
+
+    def test_view_returns_ids_per_file(self):
+        user = get_user_model().objects.create_user(
+            "admin", password="x", is_staff=True
+        )
+        request = APIRequestFactory().post(
+            "/", {"files": self.files(b"a", b"a")}, format="multipart"
+        )
+        force_authenticate(request, user=user)
+        response = MediaBulkUploadView.as_view()(request)
+        self.assertEqual(response.status_code, 201)
+        ids = [row["id"] for row in response.data["results"]]
+        self.assertEqual(len(set(ids)), 1)
+        self.assertEqual(len(response.data["media"]), 1)
+
+
+class PerceptualHashTests(TestCase):
+    def gradient(self, width, height):
+        image = Image.new("L", (width, height))
+        image.putdata(
+            [(x * 255 // width + y) % 256 for y in range(height) for x in range(width)]
+        )
+        return image.convert("RGB")
+
+    def test_resized_and_recompressed_images_stay_close(self):
+        original = self.gradient(640, 480)
+        buffer = io.BytesIO()
+        original.resize((320, 240)).save(buffer, format="JPEG", quality=30)
+        copy = Image.open(io.BytesIO(buffer.getvalue()))
+        different = original.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+        value = int(similarity.dhash(original), 16)
+        self.assertEqual(len(similarity.dhash(original)), 16)
+        self.assertLessEqual(
+            similarity.hamming_distance(value, int(similarity.dhash(copy), 16)), 2
+        )
+        self.assertGreater(
+            similarity.hamming_distance(value, int(similarity.dhash(different), 16)),
+            similarity.get_max_distance(),
+        )
+
+    def test_bk_tree_search_matches_brute_force(self):
+        rng = random.Random(0)
+        values = {rng.getrandbits(16) for _ in range(300)}
+        tree = similarity.BKTree()
+        for value in values:
+            tree.add(value)
+        for query in list(values)[:20]:
+            expected = {
+                value
+                for value in values
+                if similarity.hamming_distance(query, value) <= 3
+            }
+            self.assertEqual(set(tree.search(query, 3)), expected)
@@ -1,9 +1,34 @@
 # uploads/urls.py
 from django.urls import path
-from .views import MediaUploadView, MediaListView
+from .views import (
+    MediaUploadView,
+    MediaBulkUploadView,
+    MediaListView,
+    DirectUploadStartView,
+    DirectUploadCompleteView,
+    ResumableUploadStartView,
+    ResumableUploadView,
+)
 
 
 urlpatterns = [
     path("upload/", MediaUploadView.as_view(), name="media-upload"),
+    path("upload/bulk/", MediaBulkUploadView.as_view(), name="media-bulk-upload"),
+    path("direct/", DirectUploadStartView.as_view(), name="media-direct-upload"),
+    path(
+        "direct/complete/",
+        DirectUploadCompleteView.as_view(),
+        name="media-direct-upload-complete",
+    ),
+    path(
+        "resumable/",
+        ResumableUploadStartView.as_view(),
+        name="media-resumable-upload",
+    ),
+    path(
+        "resumable/<path:key>/",
+        ResumableUploadView.as_view(),
+        name="media-resumable-upload-detail",
+    ),
     path("", MediaListView.as_view(), name="media-list"),
 ]
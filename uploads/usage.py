@@ -0,0 +1,222 @@
+# uploads/usage.py
+# 참조 색인 없이 전체 콘텐츠에서 사용 중인 Media를 집합 연산으로 계산하는 엔진
+# 참조 필드마다 values_list 쿼리 한 번으로 id를 모으고, is_used_cached는 id 청크 단위 UPDATE로 반영
+import logging
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from django.db import connection
+from django.utils import timezone
+from parler.models import TranslatedFieldsModelMixin
+from .extractors import iter_content_media_names
+from .models import Media, MediaReference, MediaScanWatermark
+from .references import get_reference_fields, get_reference_models, sync_references
+from .utils import update_media_usage
+
+logger = logging.getLogger(__name__)
+
+# IN 절 하나에 넣는 id/경로 수 (DB 파라미터 제한과 쿼리 크기 고려)
+CHUNK_SIZE = 1000
+
+# 시계 오차와 늦게 커밋된 트랜잭션을 고려하여 워터마크보다 조금 앞부터 다시 확인
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+def _chunks(values, size=CHUNK_SIZE):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+@contextmanager
+def count_queries():
+    """블록 안에서 실행된 SQL 수를 센다 (DEBUG 설정과 무관하게 동작)"""
+    counter = {"queries": 0}
+
+    def wrapper(execute, sql, params, many, context):
+        counter["queries"] += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(wrapper):
+        yield counter
+
+
+def collect_model_media_ids(model, batch_size=2000):
+    """
+    모델 하나의 참조 필드에서 사용 중인 Media id 집합을 계산합니다.
+    FK/M2M은 필드당 values_list 한 번, CKEditor 콘텐츠는 경로만 스트리밍으로 읽어 추출하며
+    메모리에는 id와 경로 집합만 유지합니다.
+    """
+    fk_fields, m2m_fields, html_fields = get_reference_fields(model)
+    referenced_ids = set()
+    for field in fk_fields:
+        referenced_ids.update(
+            model.objects.filter(**{f"{field.attname}__isnull": False})
+            .values_list(field.attname, flat=True)
+            .distinct()
+            .iterator(chunk_size=batch_size)
+        )
+    for field in m2m_fields:
+        through = field.remote_field.through
+        referenced_ids.update(
+            through.objects.values_list(
+                f"{field.m2m_reverse_field_name()}_id", flat=True
+            )
+            .distinct()
+            .iterator(chunk_size=batch_size)
+        )
+
+    media_names = set()
+    for field_name in html_fields:
+        for _pk, names in iter_content_media_names(model, field_name, batch_size):
+            media_names.update(names)
+    # 콘텐츠 안의 경로는 청크 단위로 Media id로 변환
+    for names in _chunks(media_names):
+        referenced_ids.update(
+            Media.objects.filter(file__in=names).values_list("id", flat=True)
+        )
+    return referenced_ids
+
+
+def collect_referenced_media_ids(batch_size=2000):
+    """모든 참조 모델에서 사용 중인 Media id 집합을 계산"""
+    referenced_ids = set()
+    for model in get_reference_models():
+        referenced_ids |= collect_model_media_ids(model, batch_size)
+    return referenced_ids
+
+
+def apply_media_usage(referenced_ids):
+    """
+    계산된 사용 중 id 집합으로 is_used_cached를 갱신하고 변경된 행 수를 반환합니다.
+    현재 값과 다른 행만 골라 True/False 두 종류의 UPDATE ... WHERE id IN으로 반영합니다.
+    """
+    flagged_ids = set(
+        Media.objects.filter(is_used_cached=True).values_list("id", flat=True)
+    )
+    # referenced_ids에 삭제된 Media id가 섞여 있어도 UPDATE 대상이 없으므로 무시됨
+    to_set = referenced_ids - flagged_ids
+    to_unset = flagged_ids - referenced_ids
+
+    updated_count = 0
+    for ids in _chunks(to_set):
+        updated_count += Media.objects.filter(id__in=ids).update(is_used_cached=True)
+    for ids in _chunks(to_unset):
+        updated_count += Media.objects.filter(id__in=ids).update(is_used_cached=False)
+    return updated_count
+
+
+def scan_media_usage():
+    """
+    전체 콘텐츠를 스캔하여 is_used_cached를 다시 계산하고 통계를 반환합니다.
+    참조 색인이 의심될 때의 검증이나 색인 없이 사용 여부를 계산할 때 사용합니다.
+    """
+    started = time.perf_counter()
+    with count_queries() as counter:
+        referenced_ids = collect_referenced_media_ids()
+        scanned = time.perf_counter()
+        updated_count = apply_media_usage(referenced_ids)
+
+    stats = {
+        "referenced_count": len(referenced_ids),
+        "updated_count": updated_count,
+        "queries": counter["queries"],
+        "scan_seconds": round(scanned - started, 3),
+        "update_seconds": round(time.perf_counter() - scanned, 3),
+    }
+    logger.info(f"미디어 사용 여부 스캔 완료: {stats}")
+    return stats
+
+
+def get_change_lookup(model):
+    """
+    행 변경 시각으로 사용할 auto_now 필드의 조회 경로를 반환합니다 (없으면 None).
+    parler 번역 모델은 원본(master) 모델의 필드를 사용합니다.
+    """
+    if issubclass(model, TranslatedFieldsModelMixin):
+        lookup = get_change_lookup(model.master.field.related_model)
+        return f"master__{lookup}" if lookup else None
+    for field in model._meta.concrete_fields:
+        if getattr(field, "auto_now", False):
+            return field.name
+    return None
+
+
+def get_watermark(model):
+    return (
+        MediaScanWatermark.objects.filter(source_model=model._meta.label_lower)
+        .values_list("scanned_at", flat=True)
+        .first()
+    )
+
+
+def set_watermark(model, scanned_at):
+    MediaScanWatermark.objects.update_or_create(
+        source_model=model._meta.label_lower, defaults={"scanned_at": scanned_at}
+    )
+
+
+def prune_deleted_sources(model):
+    """시그널 없이 삭제된 원본 객체의 참조를 색인에서 제거하고 영향받은 Media id 반환"""
+    source_model = model
+    if issubclass(model, TranslatedFieldsModelMixin):
+        source_model = model.master.field.related_model
+    stale = MediaReference.objects.filter(
+        source_model=source_model._meta.label_lower
+    ).exclude(source_pk__in=source_model.objects.values("pk"))
+    media_ids = set(stale.values_list("media_id", flat=True))
+    if media_ids:
+        stale.delete()
+    return media_ids
+
+
+def rescan_model_references(model, since=None, batch_size=500):
+    """
+    since 이후 변경된 행만 다시 추출하여 색인에 기록된 기존 참조와 비교(diff)합니다.
+    since가 없거나 변경 시각 필드가 없는 모델은 전체 행을 다시 추출합니다.
+    변경된 Media id 집합을 반환하며 is_used_cached 갱신은 호출한 쪽에서 합니다.
+    """
+    queryset = model.objects.order_by("pk")
+    lookup = get_change_lookup(model)
+    if since and lookup:
+        queryset = queryset.filter(**{f"{lookup}__gte": since - WATERMARK_OVERLAP})
+    m2m_fields = get_reference_fields(model)[1]
+    if m2m_fields:
+        queryset = queryset.prefetch_related(*[field.name for field in m2m_fields])
+
+    changed_ids = set()
+    rescanned_count = 0
+    for instance in queryset.iterator(chunk_size=batch_size):
+        changed_ids |= sync_references(instance, refresh_usage=False)
+        rescanned_count += 1
+    changed_ids |= prune_deleted_sources(model)
+    logger.info(
+        f"참조 재스캔: {model._meta.label} {rescanned_count}개 행, "
+        f"Media {len(changed_ids)}개 변경"
+    )
+    return changed_ids
+
+
+def rescan_changed_references(full=False):
+    """
+    모든 참조 모델에 대해 워터마크 이후 변경된 행만 다시 스캔하고 통계를 반환합니다.
+    스캔 시작 시각을 새 워터마크로 저장하여 다음 실행은 그 이후 변경분만 확인합니다.
+    """
+    started = time.perf_counter()
+    changed_ids = set()
+    with count_queries() as counter:
+        for model in get_reference_models():
+            scanned_at = timezone.now()
+            since = None if full else get_watermark(model)
+            changed_ids |= rescan_model_references(model, since)
+            set_watermark(model, scanned_at)
+        updated_count = update_media_usage(changed_ids) if changed_ids else 0
+
+    stats = {
+        "changed_count": len(changed_ids),
+        "updated_count": updated_count,
+        "queries": counter["queries"],
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    logger.info(f"미디어 참조 증분 스캔 완료: {stats}")
+    return stats
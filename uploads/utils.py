@@ -1,55 +1,61 @@
 # uploads/utils.py
 from django.apps import apps
+from django.db.models import Exists, OuterRef
 from django_ckeditor_5.fields import CKEditor5Field
-from urllib.parse import urlparse
-from .models import Media
-from parler.models import TranslatableModel
-import re
+from .deletion import batch_file_deletes
+from .extractors import MEDIA_PREFIX, replace_media_names
+from .models import Media, MediaReference
 
 
-def update_media_usage():
-    """모든 미디어의 사용 여부를 확인하고 업데이트합니다."""
-    used_paths = set()
-    for model in apps.get_models():
-        for field in model._meta.get_fields():
-            if isinstance(field, CKEditor5Field):
-                for instance in model.objects.all():
-                    if isinstance(instance, TranslatableModel):
-                        # TranslatableModel인 경우 translations를 순회
-                        for translation in instance.translations.all():
-                            content = getattr(translation, field.name, "")
-                            if content:
-                                url_pattern = re.compile(r'src=["\']([^"\']+)["\']')
-                                urls = url_pattern.findall(content)
-                                for url in urls:
-                                    parsed = urlparse(url)
-                                    path = parsed.path
-                                    used_paths.add(path)
-                    else:
-                        # 번역 모델이거나 일반 모델인 경우 직접 필드 확인
-                        content = getattr(instance, field.name, "")
-                        if content:
-                            url_pattern = re.compile(r'src=["\']([^"\']+)["\']')
-                            urls = url_pattern.findall(content)
-                            for url in urls:
-                                parsed = urlparse(url)
-                                path = parsed.path
-                                used_paths.add(path)
-    all_media = Media.objects.all()
-    updated_count = 0
-    for media in all_media:
-        media_path = urlparse(media.file.url).path
-        is_used = media_path in used_paths or media._check_usage()
-        if is_used != media.is_used_cached:
-            media.is_used_cached = is_used
-            media.save(update_fields=["is_used_cached"])
-            updated_count += 1
-    return updated_count
+def update_media_usage(media_ids=None):
+    """
+    참조 색인(MediaReference)을 기준으로 is_used_cached를 갱신하고 변경된 행 수를 반환합니다.
+    media_ids를 주면 해당 Media만 갱신합니다.
+    """
+    queryset = Media.objects.all()
+    if media_ids is not None:
+        queryset = queryset.filter(id__in=media_ids)
+    referenced = Exists(MediaReference.objects.filter(media=OuterRef("pk")))
+    used_count = queryset.filter(referenced, is_used_cached=False).update(
+        is_used_cached=True
+    )
+    unused_count = queryset.filter(~referenced, is_used_cached=True).update(
+        is_used_cached=False
+    )
+    return used_count + unused_count
 
 
 def clean_unused_media():
     """사용 여부를 확인한 후 미사용 미디어를 삭제합니다."""
     updated_count = update_media_usage()
     unused = Media.objects.filter(is_used_cached=False)
-    count, _ = unused.delete()
-    return updated_count, count
+    # 파일은 개별 DELETE 대신 DeleteObjects로 모아서 삭제
+    with batch_file_deletes():
+        _, deleted = unused.delete()
+    return updated_count, deleted.get(Media._meta.label, 0)
+
+
+def rewrite_media_references(renamed):
+    """CKEditor 콘텐츠 안의 미디어 경로를 새 저장 키로 치환하고 변경된 행 수를 반환합니다."""
+    if not renamed:
+        return 0
+
+    rewritten_count = 0
+    for model in apps.get_models():
+        field_names = [
+            field.name
+            for field in model._meta.get_fields()
+            if isinstance(field, CKEditor5Field)
+        ]
+        for field_name in field_names:
+            rows = (
+                model.objects.filter(**{f"{field_name}__contains": MEDIA_PREFIX})
+                .values_list("pk", field_name)
+                .iterator()
+            )
+            for pk, content in rows:
+                new_content = replace_media_names(content, renamed)
+                if new_content != content:
+                    model.objects.filter(pk=pk).update(**{field_name: new_content})
+                    rewritten_count += 1
+    return rewritten_count
@@ -0,0 +1,95 @@
+# uploads/versioning.py
+# 미디어 URL 버전(?v=해시) 일괄 조회
+# 요청 단위 리졸버가 파일명별 해시를 모아 한 번의 IN 쿼리로 조회하고, 선택적으로 Redis 캐시를 사용
+import contextvars
+from contextlib import contextmanager
+from django.conf import settings
+from django.core.cache import cache
+
+CACHE_KEY_PREFIX = "media-version:"
+
+_current_resolver = contextvars.ContextVar("media_version_resolver", default=None)
+
+
+def _cache_key(name):
+    return f"{CACHE_KEY_PREFIX}{name}"
+
+
+class MediaVersionResolver:
+    """파일명 → 해시값 매핑을 모아 한 번에 조회하는 요청 단위 리졸버"""
+
+    def __init__(self, use_cache=None):
+        if use_cache is None:
+            use_cache = getattr(settings, "MEDIA_VERSION_CACHE_ENABLED", False)
+        self.use_cache = use_cache
+        self._versions = {}
+        self._pending = set()
+
+    def prime(self, media_list):
+        """이미 로드된 Media 인스턴스의 해시값을 등록하여 조회를 생략"""
+        for media in media_list:
+            if media is not None and media.file:
+                self._versions[media.file.name] = media.hash_value or ""
+
+    def defer(self, names):
+        """다음 resolve() 시 한 번에 조회할 파일명을 등록"""
+        self._pending.update(name for name in names if name not in self._versions)
+
+    def resolve(self):
+        """대기 중인 파일명의 해시값을 캐시 → DB(IN 쿼리 1회) 순으로 조회"""
+        pending = self._pending - self._versions.keys()
+        self._pending = set()
+        if not pending:
+            return
+
+        if self.use_cache:
+            cached = cache.get_many([_cache_key(name) for name in pending])
+            for name in list(pending):
+                value = cached.get(_cache_key(name))
+                if value is not None:
+                    self._versions[name] = value
+                    pending.discard(name)
+            if not pending:
+                return
+
+        from uploads.models import Media
+
+        found = dict(
+            Media.objects.filter(file__in=pending).values_list("file", "hash_value")
+        )
+        resolved = {name: found.get(name) or "" for name in pending}
+        self._versions.update(resolved)
+
+        if self.use_cache:
+            cache.set_many(
+                {_cache_key(name): value for name, value in resolved.items()},
+                timeout=getattr(settings, "MEDIA_VERSION_CACHE_TIMEOUT", 86400),
+            )
+
+    def get(self, name):
+        """파일명의 해시값 반환 (없으면 빈 문자열)"""
+        if name not in self._versions:
+            self._pending.add(name)
+            self.resolve()
+        return self._versions.get(name, "")
+
+
+def get_resolver():
+    """현재 요청의 리졸버 반환, 요청 범위 밖이면 일회용 리졸버 생성"""
+    return _current_resolver.get() or MediaVersionResolver()
+
+
+@contextmanager
+def media_version_scope(use_cache=None):
+    """블록 안에서 같은 리졸버를 공유하도록 활성화"""
+    token = _current_resolver.set(MediaVersionResolver(use_cache=use_cache))
+    try:
+        yield _current_resolver.get()
+    finally:
+        _current_resolver.reset(token)
+
+
+def invalidate_media_version(name):
+    """Media 변경 시 캐시된 해시값 제거"""
+    if name and getattr(settings, "MEDIA_VERSION_CACHE_ENABLED", False):
+        cache.delete(_cache_key(name))
@@ -3,21 +3,61 @@ from rest_framework import generics
 from rest_framework.permissions import IsAdminUser
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from django.conf import settings
+from django.db.models import prefetch_related_objects
 from django.http import JsonResponse
 from .models import Media
-from .serializers import MediaSerializer
+from .bulk import bulk_upload_media
+from .dedup import save_unique_media
+from .direct import finish_direct_upload, start_direct_upload
+from .metadata import extract_metadata
+from .resumable import (
+    UploadConflict,
+    abort_resumable_upload,
+    get_resumable_upload,
+    start_resumable_upload,
+    upload_chunk,
+)
+from .serializers import (
+    MediaSerializer,
+    DirectUploadStartSerializer,
+    DirectUploadCompleteSerializer,
+)
+from .streaming import stream_media_upload
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 def handle_media_upload(file_obj):
     """공통 미디어 업로드 처리 로직"""
+    threshold = getattr(settings, "MEDIA_STREAMING_UPLOAD_THRESHOLD", None)
+    if threshold and file_obj.size >= threshold:
+        return handle_streaming_media_upload(file_obj)
+
     hash_value = Media.calculate_file_hash(file_obj)
-    existing_media = Media.objects.filter(hash_value=hash_value).first()
-    if existing_media:
-        return existing_media
     media = Media(
         file=file_obj, hash_value=hash_value, title=file_obj.name.split("/")[-1]
     )
-    media.save()
+    # 같은 해시의 행이 이미 있거나 동시에 저장되었으면 먼저 저장된 행을 반환
+    media, _created = save_unique_media(media)
+    return media
+
+
+def handle_streaming_media_upload(file_obj):
+    """
+    대용량 파일 업로드 처리 로직
+    파일을 한 번만 읽으며 해시 계산과 멀티파트 업로드를 함께 수행하고,
+    저장 시 같은 해시의 행이 있으면 그 행을 반환하며 방금 올린 오브젝트는 삭제됩니다.
+    """
+    storage = Media._meta.get_field("file").storage
+    name, hash_value, size = stream_media_upload(file_obj, storage=storage)
+
+    media = Media(hash_value=hash_value, title=file_obj.name.split("/")[-1])
+    media.file.name = name
+    # 업로드된 임시 파일에서 헤더만 다시 읽어 메타데이터 추출
+    media.apply_metadata(extract_metadata(file_obj, name, size=size))
+    media, _created = save_unique_media(media)
     return media
 
 
@@ -33,8 +73,33 @@ class MediaUploadView(generics.CreateAPIView):
             serializer.instance = media
 
 
+class MediaBulkUploadView(APIView):
+    """여러 파일을 한 번에 업로드하고 입력 순서대로 Media id를 반환"""
+
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        files = request.FILES.getlist("files")
+        if not files:
+            return Response({"error": "No file uploaded"}, status=400)
+
+        medias = bulk_upload_media(files)
+        unique_medias = list({media.id: media for media in medias}.values())
+        prefetch_related_objects(unique_medias, "renditions")
+        return Response(
+            {
+                "results": [
+                    {"index": index, "filename": file_obj.name, "id": media.id}
+                    for index, (file_obj, media) in enumerate(zip(files, medias))
+                ],
+                "media": MediaSerializer(unique_medias, many=True).data,
+            },
+            status=201,
+        )
+
+
 class MediaListView(generics.ListAPIView):
-    queryset = Media.objects.all()
+    queryset = Media.objects.prefetch_related("renditions")
     serializer_class = MediaSerializer
     permission_classes = [IsAdminUser]
 
@@ -48,3 +113,111 @@ class CKEditor5UploadView(APIView):
             return JsonResponse({"error": "No file uploaded"}, status=400)
         media = handle_media_upload(file_obj)
         return JsonResponse({"url": media.file.url})
+
+
+class DirectUploadStartView(APIView):
+    """1단계: R2 직접 업로드용 presigned URL 발급 (이미 있는 파일이면 바로 반환)"""
+
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        serializer = DirectUploadStartSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        existing_media = Media.objects.filter(hash_value=data["sha256"]).first()
+        if existing_media:
+            return Response(
+                {"duplicate": True, "media": MediaSerializer(existing_media).data}
+            )
+
+        upload = start_direct_upload(data["filename"], data["size"], data["sha256"])
+        return Response({"duplicate": False, **upload}, status=201)
+
+
+class DirectUploadCompleteView(APIView):
+    """2단계: 크기/해시 확인 후 중복 처리를 거쳐 Media 생성"""
+
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        serializer = DirectUploadCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        try:
+            media, created = finish_direct_upload(data["key"], data.get("parts"))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+        return Response(MediaSerializer(media).data, status=201 if created else 200)
+
+
+class ResumableUploadStartView(APIView):
+    """이어받기 가능한 청크 업로드 시작 (이미 있는 파일이면 바로 반환)"""
+
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        serializer = DirectUploadStartSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        existing_media = Media.objects.filter(hash_value=data["sha256"]).first()
+        if existing_media:
+            return Response(
+                {"duplicate": True, "media": MediaSerializer(existing_media).data}
+            )
+
+        upload = start_resumable_upload(
+            data["filename"], data["size"], data["sha256"]
+        )
+        return Response({"duplicate": False, **upload}, status=201)
+
+
+class ResumableUploadView(APIView):
+    """
+    청크 업로드 진행 조회(GET), 청크 전송(PATCH), 취소(DELETE)
+    PATCH는 Upload-Offset 헤더에 청크 시작 위치를, 본문에 청크 바이트를 그대로 보냅니다.
+    연결이 끊기면 GET으로 offset을 확인하고 그 위치부터 다시 보냅니다.
+    offset이 전체 크기와 같으면 빈 본문으로 보내 완료 처리만 다시 시도합니다.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, key, *args, **kwargs):
+        try:
+            upload = get_resumable_upload(key)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=404)
+        return Response(upload, headers={"Upload-Offset": str(upload["offset"])})
+
+    def patch(self, request, key, *args, **kwargs):
+        try:
+            offset = int(request.headers["Upload-Offset"])
+            length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except (KeyError, ValueError):
+            return Response({"error": "Upload-Offset 헤더가 필요합니다."}, status=400)
+
+        # request.data를 사용하지 않으므로 본문이 파서나 임시 파일을 거치지 않음
+        try:
+            offset, media = upload_chunk(key, offset, request.stream, length)
+        except UploadConflict as e:
+            return Response({"error": str(e)}, status=409)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+
+        headers = {"Upload-Offset": str(offset)}
+        if media is None:
+            return Response({"offset": offset}, headers=headers)
+        return Response(
+            {"offset": offset, "media": MediaSerializer(media).data},
+            status=201,
+            headers=headers,
+        )
+
+    def delete(self, request, key, *args, **kwargs):
+        try:
+            abort_resumable_upload(key)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=404)
+        return Response(status=204)